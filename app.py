@@ -4,10 +4,14 @@ Aplicación completa con interfaz modernizada
 """
 
 from nicegui import ui, app
-from ui.interfaz import crear_interfaz_principal
+from ui.interfaz import crear_interfaz_principal, robot_ctrl
 from database.init_db import inicializar_base_datos
+from database.db import cerrar_conexiones
+from database.db_async import db_async
+from database.mantenimiento import MantenimientoBD, PlanificadorMantenimiento
 from ui.state.app_state import app_state
 from models.procesos_basicos import cargar_procesos_personalizados_desde_bd
+from controllers.instantanea_base import activar_instantanea_base
 
 # ===== INICIALIZACIÓN =====
 print("Iniciando Thermomix...")
@@ -15,14 +19,41 @@ print("Iniciando Thermomix...")
 # Inicializar base de datos (incluye migración a v2.0)
 inicializar_base_datos()
 
+# Bases de datos creadas sin auto_vacuum=INCREMENTAL: un único VACUUM
+# completo, antes de atender a nadie (el mantenimiento periódico solo hace
+# pasos incrementales)
+MantenimientoBD().convertir_a_vacuum_incremental()
+
 # Cargar procesos personalizados desde BD
 print("Cargando procesos personalizados...")
 cargar_procesos_personalizados_desde_bd()
 print("✓ Procesos personalizados cargados")
 
+# Recetas base en memoria: no cambian tras la carga inicial, así que los
+# listados y aperturas de recetas base dejan de leer la base de datos
+print("Cargando recetas base en memoria...")
+instantanea = activar_instantanea_base()
+print(f"✓ {len(instantanea)} recetas base en memoria")
+
+# Mantenimiento de la base de datos (VACUUM incremental, ANALYZE, purga)
+# en segundo plano mientras el robot está inactivo
+def robot_inactivo() -> bool:
+    """Ni el controlador ni la interfaz (pasos con su timer) están ejecutando nada"""
+    return robot_ctrl.esta_inactivo() and not app_state.en_ejecucion
+
+
+planificador_mantenimiento = PlanificadorMantenimiento(robot_inactivo)
+app.on_startup(planificador_mantenimiento.iniciar)
+
+# Al apagar: parar el mantenimiento, terminar las operaciones asíncronas
+# pendientes y cerrar las conexiones
+app.on_shutdown(planificador_mantenimiento.detener)
+app.on_shutdown(db_async.cerrar)
+app.on_shutdown(cerrar_conexiones)
+
 # ===== CONFIGURACIÓN DE LA APLICACIÓN =====
 @ui.page('/')
-def main_page():
+async def main_page():
     """Página principal de la aplicación"""
 
     # Detectar preferencia de modo oscuro del navegador
@@ -36,7 +67,7 @@ def main_page():
     ''')
 
     # Crear interfaz principal
-    crear_interfaz_principal()
+    await crear_interfaz_principal()
 
 
 # ===== METADATA DE LA APP =====
@@ -0,0 +1,112 @@
+"""
+Benchmark de búsqueda de recetas
+Compara la búsqueda FTS5 de RecetasController.buscar_recetas con el
+filtrado en Python sobre la lista completa de objetos Receta.
+
+Uso:
+    python benchmarks/bench_busqueda.py [num_recetas]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+
+NUM_RECETAS_POR_DEFECTO = 100000
+TAMANO_PAGINA = 24
+REPETICIONES = 5
+
+BUSQUEDAS = ['tomate', 'Receta 04213', 'hervir cebolla', 'inexistente']
+
+INGREDIENTES = ['tomate', 'cebolla', 'pimiento', 'calabacín', 'garbanzo', 'albahaca']
+
+
+def generar_recetas(num_recetas: int):
+    """Genera recetas base sintéticas con textos variados"""
+    for i in range(num_recetas):
+        ingrediente = INGREDIENTES[i % len(INGREDIENTES)]
+        yield (
+            f"Receta {i:06d}",
+            f"Plato sintético de {ingrediente}",
+            [
+                ("Picar", f"velocidad=media, {ingrediente}", 5),
+                ("Hervir" if i % 3 else "Sofreir", "temperatura=100C", 60),
+                ("Triturar", "velocidad=alta", 10),
+            ],
+        )
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema e inserta el catálogo sintético"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+
+    inicio = time.perf_counter()
+    cargar_recetas_base(DatabaseManager(), generar_recetas(num_recetas))
+    return time.perf_counter() - inicio
+
+
+def buscar_fts(ctrl, texto: str):
+    """Búsqueda actual: total de resultados y primera página desde el índice"""
+    return ctrl.contar_resultados_busqueda(texto), ctrl.buscar_recetas(texto, limite=TAMANO_PAGINA)
+
+
+def buscar_en_python(ctrl, texto: str):
+    """Búsqueda anterior: subcadena sobre todas las recetas materializadas"""
+    recetas = ctrl.obtener_recetas_base()
+    termino = texto.lower()
+    encontradas = [
+        r for r in recetas
+        if termino in r.nombre.lower() or (r.descripcion and termino in r.descripcion.lower())
+    ]
+    return len(encontradas), encontradas[:TAMANO_PAGINA]
+
+
+def medir_ms(funcion, *args) -> float:
+    """Mediana en milisegundos de REPETICIONES ejecuciones"""
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion(*args)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2]
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        carga = preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        print(f"{num_recetas} recetas cargadas (con índice FTS5) en {carga:.1f}s\n")
+
+        ctrl = RecetasController()
+        RecetasController.invalidar_cache()
+
+        inicio = time.perf_counter()
+        ctrl.obtener_recetas_base()
+        materializar = (time.perf_counter() - inicio) * 1000
+        print(f"Materializar el catálogo completo (caché fría): {materializar:.0f}ms\n")
+
+        print(f"{'búsqueda':<16} | {'resultados':>10} | {'FTS5':>9} | {'Python (caché caliente)':>23}")
+        print("-" * 68)
+        for texto in BUSQUEDAS:
+            total, _ = buscar_fts(ctrl, texto)
+            t_fts = medir_ms(buscar_fts, ctrl, texto)
+            t_python = medir_ms(buscar_en_python, ctrl, texto)
+            print(f"{texto:<16} | {total:>10} | {t_fts:>7.1f}ms | {t_python:>21.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
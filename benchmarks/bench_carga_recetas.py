@@ -0,0 +1,168 @@
+"""
+Benchmark de carga de recetas
+Compara la carga N+1 (una consulta de procesos por receta) con la carga
+agrupada de RecetasController, midiendo número de consultas y tiempo.
+También compara la apertura de una receta recorriendo el catálogo completo
+con la búsqueda por clave primaria de obtener_receta_por_id.
+
+Uso:
+    python benchmarks/bench_carga_recetas.py [tamaño1 tamaño2 ...]
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+
+TAMANOS_POR_DEFECTO = [100, 1000, 5000]
+PROCESOS_POR_RECETA = 4
+APERTURAS = 50
+
+
+class ContadorConsultas:
+    """Envuelve DatabaseManager.ejecutar_query para contar las consultas"""
+
+    def __init__(self):
+        self.consultas = 0
+        self._original = DatabaseManager.ejecutar_query
+
+    def __enter__(self):
+        contador = self
+        original = self._original
+
+        def ejecutar_query_contado(db, query, params=()):
+            contador.consultas += 1
+            return original(db, query, params)
+
+        DatabaseManager.ejecutar_query = ejecutar_query_contado
+        return self
+
+    def __exit__(self, *exc):
+        DatabaseManager.ejecutar_query = self._original
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema y lo rellena con recetas de usuario sintéticas"""
+    from database.init_db import inicializar_base_datos
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+
+    conn = sqlite3.connect(ruta)
+    with conn:
+        conn.executemany(
+            "INSERT INTO recetas_usuario (id, nombre, descripcion) VALUES (?, ?, ?)",
+            ((i, f"Receta {i:06d}", "Receta sintética") for i in range(1, num_recetas + 1))
+        )
+        conn.executemany(
+            """
+            INSERT INTO procesos_usuario (receta_id, tipo_proceso, parametros, orden, duracion)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                (i, tipo, "velocidad=media", orden, 5)
+                for i in range(1, num_recetas + 1)
+                for orden, tipo in enumerate(["Picar", "Triturar", "Hervir", "Sofreir"][:PROCESOS_POR_RECETA], 1)
+            )
+        )
+    conn.close()
+
+
+def carga_n_mas_uno():
+    """Reproduce la carga anterior: una consulta de procesos por receta"""
+    from models.receta import Receta
+
+    db = DatabaseManager()
+    recetas = []
+    for r_data in db.obtener_recetas_usuario():
+        receta = Receta(r_data['id'], r_data['nombre'], r_data.get('descripcion', ''), False)
+        receta.cargar_procesos_desde_db(db.obtener_procesos_receta_usuario(r_data['id']))
+        recetas.append(receta)
+    return recetas
+
+
+def carga_agrupada():
+    """Carga actual del controlador (consultas por conjuntos, sin caché)"""
+    from controllers.recetas_controller import RecetasController
+
+    RecetasController.invalidar_cache()
+    return RecetasController().obtener_recetas_usuario()
+
+
+def medir(funcion):
+    """Ejecuta la función y devuelve (consultas, segundos, num_recetas)"""
+    with ContadorConsultas() as contador:
+        inicio = time.perf_counter()
+        recetas = funcion()
+        duracion = time.perf_counter() - inicio
+    return contador.consultas, duracion, len(recetas)
+
+
+def abrir_recorriendo_catalogo(receta_id: int):
+    """Apertura anterior: cargar todas las recetas y buscar la pedida"""
+    from controllers.recetas_controller import RecetasController
+
+    RecetasController.invalidar_cache()
+    for receta in RecetasController().obtener_recetas_usuario():
+        if receta.id == receta_id:
+            return receta
+    return None
+
+
+def abrir_por_clave(receta_id: int):
+    """Apertura actual: solo la receta y sus procesos (sin caché)"""
+    from controllers.recetas_controller import RecetasController
+
+    return RecetasController().obtener_receta_por_id(receta_id, es_base=False, usar_cache=False)
+
+
+def medir_aperturas(funcion, num_recetas: int) -> float:
+    """Abre APERTURAS recetas repartidas por el catálogo y devuelve ms por apertura"""
+    ids = [1 + (i * 7919) % num_recetas for i in range(APERTURAS)]
+    inicio = time.perf_counter()
+    for receta_id in ids:
+        assert funcion(receta_id).id == receta_id
+    return (time.perf_counter() - inicio) * 1000 / APERTURAS
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO
+
+    print(f"{'recetas':>8} | {'N+1 consultas':>13} | {'N+1 tiempo':>10} | "
+          f"{'agrupada consultas':>18} | {'agrupada tiempo':>15}")
+    print("-" * 78)
+
+    aperturas = []
+    for tamano in tamanos:
+        with tempfile.TemporaryDirectory() as tmp:
+            preparar_base_datos(os.path.join(tmp, "bench.db"), tamano)
+
+            consultas_antes, tiempo_antes, total_antes = medir(carga_n_mas_uno)
+            consultas_ahora, tiempo_ahora, total_ahora = medir(carga_agrupada)
+            assert total_antes == total_ahora == tamano
+
+            print(f"{tamano:>8} | {consultas_antes:>13} | {tiempo_antes * 1000:>8.1f}ms | "
+                  f"{consultas_ahora:>18} | {tiempo_ahora * 1000:>13.1f}ms")
+
+            aperturas.append((
+                tamano,
+                medir_aperturas(abrir_recorriendo_catalogo, tamano),
+                medir_aperturas(abrir_por_clave, tamano),
+            ))
+
+    print(f"\n{'recetas':>8} | {'abrir recorriendo':>17} | {'abrir por clave':>15}")
+    print("-" * 48)
+    for tamano, recorriendo, por_clave in aperturas:
+        print(f"{tamano:>8} | {recorriendo:>15.2f}ms | {por_clave:>13.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark de exportación e importación del catálogo en JSONL
+Exporta un catálogo sintético de recetas de usuario, lo importa en una base
+de datos vacía con distintos tamaños de lote y mide filas por segundo y pico
+de memoria (tracemalloc) de cada operación.
+
+Uso:
+    python benchmarks/bench_catalogo.py [num_recetas]
+"""
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+import database.pool as pool_module
+from database.db import DatabaseManager, RecetaCompleta
+
+NUM_RECETAS_POR_DEFECTO = 20000
+LOTES = (1, 100, 1000)
+
+
+def receta_sintetica(i: int) -> RecetaCompleta:
+    """Receta de usuario con 3 ingredientes y 4 pasos"""
+    return (
+        f"Mía {i:06d}", "Receta sintética", i % 7 == 0,
+        [("Tomate", 200.0, "g"), ("Cebolla", 1.0, "ud"), ("Sal", None, "")],
+        [("Picar", "velocidad=media", 5), ("Sofreir", "aceite", 30),
+         ("Triturar", "velocidad=alta", 10), ("Hervir", "temperatura=100C", 60)],
+    )
+
+
+def usar_base_datos(ruta: str):
+    """Crea (si hace falta) y activa la base de datos de `ruta`"""
+    from database.init_db import inicializar_base_datos
+
+    db_module.DATABASE_PATH = ruta
+    pool_module.pool_conexiones.cerrar_todas()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+
+
+def medir(funcion):
+    """Devuelve (informe, pico de memoria en MB) de una llamada"""
+    gc.collect()
+    tracemalloc.start()
+    informe = funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return informe, pico / (1024 * 1024)
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        usar_base_datos(os.path.join(tmp, "origen.db"))
+        db = DatabaseManager()
+        for inicio in range(0, num_recetas, 1000):
+            db.insertar_lote_recetas_usuario(
+                [receta_sintetica(i) for i in range(inicio, min(inicio + 1000, num_recetas))]
+            )
+
+        ruta_jsonl = os.path.join(tmp, "catalogo.jsonl")
+        print(f"{num_recetas} recetas de usuario, {num_recetas * 8} filas\n")
+        print(f"{'operación':<22} | {'tiempo':>8} | {'filas/s':>10} | {'pico memoria':>12}")
+        print("-" * 62)
+
+        with open(ruta_jsonl, 'w', encoding='utf-8') as destino:
+            informe, mb = medir(lambda: RecetasController().exportar_catalogo(destino))
+        print(f"{'exportar':<22} | {informe['segundos'] * 1000:>6.0f}ms | "
+              f"{informe['filas_por_segundo']:>10,.0f} | {mb:>9.1f} MB")
+
+        for lote in LOTES:
+            usar_base_datos(os.path.join(tmp, f"destino_{lote}.db"))
+            with open(ruta_jsonl, encoding='utf-8') as origen:
+                informe, mb = medir(lambda: RecetasController().importar_catalogo(origen, lote))
+            print(f"{f'importar (lote {lote})':<22} | {informe['segundos'] * 1000:>6.0f}ms | "
+                  f"{informe['filas_por_segundo']:>10,.0f} | {mb:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
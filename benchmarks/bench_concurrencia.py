@@ -0,0 +1,157 @@
+"""
+Benchmark de concurrencia lectores/escritores
+Ejecuta hilos lectores (listado de favoritas) y escritores (toggle de
+favorito y creación de recetas) contra la misma base de datos y compara
+el modo rollback-journal clásico con el perfil WAL por defecto.
+
+Uso:
+    python benchmarks/bench_concurrencia.py [lectores] [escritores] [segundos]
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+from database.pool import PRAGMAS_POR_DEFECTO
+
+NUM_RECETAS = 2000
+
+PERFILES = {
+    'rollback (DELETE, FULL)': {
+        'busy_timeout': 5000,
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+    },
+    'WAL (perfil por defecto)': PRAGMAS_POR_DEFECTO,
+}
+
+
+def preparar_base_datos(ruta: str):
+    """Crea el esquema y un catálogo de recetas de usuario (20% favoritas)"""
+    from database.init_db import inicializar_base_datos
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+    DatabaseManager.configurar_pragmas({'busy_timeout': 5000})
+    # Sin conexiones abiertas: cambiar journal_mode desde WAL exige acceso exclusivo
+    db_module.cerrar_conexiones()
+
+    conn = sqlite3.connect(ruta)
+    with conn:
+        conn.executemany(
+            "INSERT INTO recetas_usuario (id, nombre, descripcion, favorito) VALUES (?, ?, ?, ?)",
+            ((i, f"Receta {i:05d}", "Receta sintética", int(i % 5 == 0))
+             for i in range(1, NUM_RECETAS + 1))
+        )
+        conn.executemany(
+            """
+            INSERT INTO procesos_usuario (receta_id, tipo_proceso, parametros, orden, duracion)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ((i, tipo, "velocidad=media", orden, 5)
+             for i in range(1, NUM_RECETAS + 1)
+             for orden, tipo in enumerate(["Picar", "Triturar", "Hervir"], 1))
+        )
+    conn.close()
+
+
+def ejecutar_perfil(pragmas: dict, lectores: int, escritores: int, segundos: float) -> dict:
+    """Lanza los hilos durante `segundos` y devuelve las métricas"""
+    from controllers.recetas_controller import RecetasController
+
+    DatabaseManager.configurar_pragmas(pragmas)
+
+    fin = time.perf_counter() + segundos
+    latencias_lectura = []
+    contadores = {'lecturas': 0, 'escrituras': 0, 'errores': 0}
+    lock = threading.Lock()
+
+    def lector():
+        # Lectura directa a SQLite: la caché del catálogo no debe ocultar los bloqueos
+        db = DatabaseManager()
+        locales = []
+        while time.perf_counter() < fin:
+            inicio = time.perf_counter()
+            try:
+                db.ejecutar_query("SELECT * FROM recetas_usuario WHERE favorito = 1 ORDER BY nombre")
+                db.obtener_todos_procesos_usuario(solo_favoritas=True)
+            except sqlite3.OperationalError:
+                with lock:
+                    contadores['errores'] += 1
+                continue
+            locales.append(time.perf_counter() - inicio)
+        with lock:
+            latencias_lectura.extend(locales)
+            contadores['lecturas'] += len(locales)
+
+    def escritor(semilla: int):
+        ctrl = RecetasController()
+        hechas = 0
+        i = semilla
+        while time.perf_counter() < fin:
+            i += 1
+            try:
+                if i % 2:
+                    ctrl.toggle_favorito(1 + i % NUM_RECETAS)
+                else:
+                    ctrl.crear_receta_usuario(f"Nueva {semilla}-{i}", "benchmark")
+                hechas += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    contadores['errores'] += 1
+        with lock:
+            contadores['escrituras'] += hechas
+
+    hilos = [threading.Thread(target=lector) for _ in range(lectores)]
+    hilos += [threading.Thread(target=escritor, args=(n * 100000,)) for n in range(escritores)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    latencias_lectura.sort()
+    total = len(latencias_lectura)
+    return {
+        'lecturas_s': contadores['lecturas'] / segundos,
+        'escrituras_s': contadores['escrituras'] / segundos,
+        'p50_ms': latencias_lectura[total // 2] * 1000 if total else 0.0,
+        'p99_ms': latencias_lectura[int(total * 0.99)] * 1000 if total else 0.0,
+        'max_ms': latencias_lectura[-1] * 1000 if total else 0.0,
+        'errores': contadores['errores'],
+    }
+
+
+def main():
+    lectores = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    escritores = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    segundos = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+
+    print(f"{lectores} lectores, {escritores} escritores, {segundos:.0f}s por perfil, "
+          f"{NUM_RECETAS} recetas\n")
+    print(f"{'perfil':<26} | {'lecturas/s':>10} | {'escrituras/s':>12} | "
+          f"{'p50 lect.':>9} | {'p99 lect.':>9} | {'máx lect.':>9} | {'errores':>7}")
+    print("-" * 100)
+
+    for nombre, pragmas in PERFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            preparar_base_datos(os.path.join(tmp, "bench.db"))
+            r = ejecutar_perfil(pragmas, lectores, escritores, segundos)
+            DatabaseManager.configurar_pragmas(PRAGMAS_POR_DEFECTO)
+            db_module.cerrar_conexiones()  # Antes de borrar el directorio temporal
+
+        print(f"{nombre:<26} | {r['lecturas_s']:>10.1f} | {r['escrituras_s']:>12.1f} | "
+              f"{r['p50_ms']:>7.1f}ms | {r['p99_ms']:>7.1f}ms | {r['max_ms']:>7.1f}ms | "
+              f"{r['errores']:>7}")
+
+
+if __name__ == "__main__":
+    main()
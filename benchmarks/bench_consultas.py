@@ -0,0 +1,112 @@
+"""
+Benchmark del registro de consultas y la caché de sentencias
+Ejecuta las operaciones frecuentes (abrir receta, página del navegador,
+conteo, favorito) con la caché de sentencias de sqlite3 desactivada, que
+obliga a analizar y planificar el SQL en cada llamada, y con el tamaño
+configurado en database/pool.py. Al final muestra los tiempos por consulta
+que acumula el registro.
+
+Uso:
+    python benchmarks/bench_consultas.py [num_recetas] [repeticiones]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+import database.pool as pool_module
+from database.consultas import registro_consultas
+from database.db import DatabaseManager
+
+NUM_RECETAS_POR_DEFECTO = 5000
+REPETICIONES_POR_DEFECTO = 2000
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema con recetas base y de usuario sintéticas"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+        db = DatabaseManager()
+        cargar_recetas_base(db, (
+            (f"Receta {i:05d}", "Receta sintética",
+             [("Picar", "velocidad=media", 5), ("Hervir", "temperatura=100C", 60)])
+            for i in range(num_recetas)
+        ))
+        for i in range(num_recetas // 10):
+            db.insertar_receta_usuario_completa(
+                f"Mía {i:05d}", "", [], [("Picar", "velocidad=alta", 5)]
+            )
+
+
+def operaciones(ctrl, db, num_recetas: int):
+    """Operaciones frecuentes de la interfaz: nombre -> función(i)"""
+    return {
+        'abrir receta': lambda i: ctrl.obtener_receta_por_id(
+            i % num_recetas + 1, True, usar_cache=False
+        ),
+        'página navegador': lambda i: ctrl.listar_recetas(
+            'todas', (f"Receta {i % num_recetas:05d}", 1, i % num_recetas + 1), 24
+        ),
+        'conteo filtrado': lambda i: ctrl.contar_recetas('todas', 60 + i % 10),
+        'toggle favorito': lambda i: ctrl.toggle_favorito(i % (num_recetas // 10) + 1),
+    }
+
+
+def medir_us(funcion, repeticiones: int) -> float:
+    """Microsegundos medios por llamada"""
+    inicio = time.perf_counter()
+    for i in range(repeticiones):
+        funcion(i)
+    return (time.perf_counter() - inicio) * 1e6 / repeticiones
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else REPETICIONES_POR_DEFECTO
+    tamano_configurado = pool_module.TAMANO_CACHE_SENTENCIAS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        ctrl = RecetasController()
+        db = DatabaseManager()
+        ops = operaciones(ctrl, db, num_recetas)
+
+        resultados = {}
+        for etiqueta, tamano in (('sin caché', 0), (f'caché {tamano_configurado}', tamano_configurado)):
+            # Conexiones nuevas con el tamaño de caché indicado
+            pool_module.TAMANO_CACHE_SENTENCIAS = tamano
+            pool_module.pool_conexiones.cerrar_todas()
+            for funcion in ops.values():
+                funcion(0)  # Calentamiento
+            resultados[etiqueta] = {
+                nombre: medir_us(funcion, repeticiones) for nombre, funcion in ops.items()
+            }
+        pool_module.TAMANO_CACHE_SENTENCIAS = tamano_configurado
+
+        etiquetas = list(resultados)
+        print(f"{num_recetas} recetas base, {repeticiones} llamadas por operación\n")
+        print(f"{'operación':<18} | " + " | ".join(f"{e:>12}" for e in etiquetas))
+        print("-" * (21 + 15 * len(etiquetas)))
+        for nombre in ops:
+            print(f"{nombre:<18} | " + " | ".join(
+                f"{resultados[e][nombre]:>10.1f}µs" for e in etiquetas
+            ))
+
+        print("\nConsultas con más tiempo acumulado (registro_consultas):")
+        for nombre, datos in list(registro_consultas.estadisticas().items())[:8]:
+            print(f"  {nombre:<36} {datos['llamadas']:>7} llamadas, "
+                  f"media {datos['media_ms'] * 1000:>7.1f}µs, máx {datos['max_ms']:>6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark de latencia de detención y de cambio de velocidad
+Lanza un Hervir de 30 minutos en tiempo real en un hilo, lo detiene (o le
+cambia la velocidad) al cabo de un momento y mide cuánto tarda el proceso
+en reaccionar. Antes la detención se comprobaba solo entre pasos, con una
+latencia de hasta 3 minutos.
+
+Uso:
+    python benchmarks/bench_detencion.py [repeticiones]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.procesos_basicos import Hervir
+from models.reloj import RelojReal, usar_reloj
+
+REPETICIONES_POR_DEFECTO = 20
+DURACION = 30 * 60          # Hervir de 30 minutos
+ESPERA_ANTES_DE_AVISAR = 0.05
+LIMITE_MS = 5.0             # Latencia máxima aceptable
+
+
+def medir_detencion() -> float:
+    """Milisegundos entre detener() y el final de ejecutar()"""
+    proceso = Hervir("temperatura=100C", DURACION)
+    terminado = threading.Event()
+
+    def ejecutar():
+        with usar_reloj(RelojReal()):
+            proceso.ejecutar()
+        terminado.set()
+
+    threading.Thread(target=ejecutar, daemon=True).start()
+    time.sleep(ESPERA_ANTES_DE_AVISAR)
+
+    inicio = time.perf_counter()
+    proceso.detener()
+    if not terminado.wait(10):
+        raise RuntimeError("El proceso no se detuvo")
+    return (time.perf_counter() - inicio) * 1000
+
+
+def medir_cambio_velocidad() -> float:
+    """Milisegundos entre ajustar_velocidad() y el mensaje de velocidad ajustada"""
+    proceso = Hervir("temperatura=100C", DURACION)
+    avisado = threading.Event()
+
+    def callback(mensaje: str):
+        if "Velocidad ajustada" in mensaje:
+            avisado.set()
+
+    hilo = threading.Thread(target=proceso.ejecutar, args=(callback,), daemon=True)
+    hilo.start()
+    time.sleep(ESPERA_ANTES_DE_AVISAR)
+
+    inicio = time.perf_counter()
+    proceso.ajustar_velocidad(10)
+    if not avisado.wait(10):
+        raise RuntimeError("El proceso no atendió el cambio de velocidad")
+    latencia = (time.perf_counter() - inicio) * 1000
+
+    proceso.detener()
+    hilo.join(10)
+    return latencia
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else REPETICIONES_POR_DEFECTO
+
+    print(f"Hervir de {DURACION // 60} min, {repeticiones} repeticiones\n")
+    print(f"{'aviso':<12} | {'p50':>8} | {'máx':>8}")
+    print("-" * 34)
+
+    correcto = True
+    for nombre, medir in (('detener', medir_detencion),
+                          ('velocidad', medir_cambio_velocidad)):
+        latencias = sorted(medir() for _ in range(repeticiones))
+        maximo = latencias[-1]
+        correcto = correcto and maximo < LIMITE_MS
+        print(f"{nombre:<12} | {latencias[len(latencias) // 2]:>6.2f}ms | {maximo:>6.2f}ms")
+
+    print()
+    if not correcto:
+        print(f"❌ Latencia por encima de {LIMITE_MS:.0f} ms")
+        sys.exit(1)
+    print(f"✓ Latencia por debajo de {LIMITE_MS:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark de la instantánea en memoria de las recetas base
+Compara las lecturas del navegador (página de recetas base, página de
+'todas', conteo con filtro de duración y apertura de una receta base) leyendo
+de SQLite y desde la instantánea, con uno y con varios hilos a la vez.
+Muestra también lo que cuesta cargar la instantánea y su memoria.
+
+Uso:
+    python benchmarks/bench_instantanea.py [num_recetas] [repeticiones]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from controllers import instantanea_base as instantanea_module
+from database.db import DatabaseManager
+
+NUM_RECETAS_POR_DEFECTO = 50000
+REPETICIONES_POR_DEFECTO = 2000
+HILOS = 4
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema con recetas base y algunas de usuario sintéticas"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+        db = DatabaseManager()
+        cargar_recetas_base(db, (
+            (f"Receta {i:06d}", "Receta sintética",
+             [("Picar", "velocidad=media", 5 + i % 60), ("Hervir", "temperatura=100C", 60)])
+            for i in range(num_recetas)
+        ))
+        for i in range(num_recetas // 100):
+            db.insertar_receta_usuario_completa(
+                f"Receta {i * 100:06d} mía", "", [], [("Picar", "velocidad=alta", 5)]
+            )
+
+
+def operaciones(ctrl, num_recetas: int):
+    """Lecturas frecuentes del navegador: nombre -> función(i)"""
+    return {
+        'página base': lambda i: ctrl.listar_recetas(
+            'base', (f"Receta {i % num_recetas:06d}", 1, i % num_recetas + 1), 24
+        ),
+        'página todas': lambda i: ctrl.listar_recetas(
+            'todas', (f"Receta {i % num_recetas:06d}", 1, i % num_recetas + 1), 24
+        ),
+        'conteo ≤ 10 min': lambda i: ctrl.contar_recetas('todas', 60 + i % 30),
+        'abrir receta base': lambda i: ctrl.obtener_receta_por_id(
+            i % num_recetas + 1, True, usar_cache=False
+        ),
+    }
+
+
+def medir_us(funcion, repeticiones: int, hilos: int = 1) -> float:
+    """Microsegundos medios por llamada (tiempo de pared / llamadas totales)"""
+    def trabajar():
+        for i in range(repeticiones):
+            funcion(i)
+
+    trabajadores = [threading.Thread(target=trabajar) for _ in range(hilos)]
+    inicio = time.perf_counter()
+    for t in trabajadores:
+        t.start()
+    for t in trabajadores:
+        t.join()
+    return (time.perf_counter() - inicio) * 1e6 / (repeticiones * hilos)
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else REPETICIONES_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        ctrl = RecetasController()
+        ops = operaciones(ctrl, num_recetas)
+
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        instantanea_module.activar_instantanea_base()
+        carga_ms = (time.perf_counter() - inicio) * 1000
+        memoria_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        tracemalloc.stop()
+        print(f"{num_recetas} recetas base: instantánea cargada en {carga_ms:.0f}ms "
+              f"(con tracemalloc), {memoria_mb:.1f} MB\n")
+
+        columnas = [(f"{modo} x{hilos}", modo, hilos)
+                    for modo in ('SQLite', 'memoria') for hilos in (1, HILOS)]
+        print(f"{'operación':<18} | " + " | ".join(f"{c[0]:>12}" for c in columnas))
+        print("-" * (21 + 15 * len(columnas)))
+        for nombre, funcion in ops.items():
+            tiempos = []
+            for _, modo, hilos in columnas:
+                if modo == 'SQLite':
+                    instantanea_module.desactivar_instantanea_base()
+                else:
+                    instantanea_module.activar_instantanea_base()
+                funcion(0)  # Calentamiento
+                tiempos.append(medir_us(funcion, repeticiones, hilos))
+            print(f"{nombre:<18} | " + " | ".join(f"{t:>10.1f}µs" for t in tiempos))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark de latencia del bucle de eventos con clientes concurrentes
+Simula varios clientes de NiceGUI sobre un mismo bucle de asyncio: cada uno
+pide páginas del navegador y de vez en cuando guarda una receta grande.
+Un latido cada LATIDO_MS mide cuánto se retrasa el bucle (lo que notaría el
+tráfico de websocket de todos los clientes) llamando al controlador de forma
+síncrona o a través de la fachada asíncrona (database.db_async).
+
+Uso:
+    python benchmarks/bench_latencia_async.py [clientes] [segundos]
+"""
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db_async import AsyncDatabaseManager
+
+CLIENTES_POR_DEFECTO = 8
+SEGUNDOS_POR_DEFECTO = 5.0
+NUM_RECETAS = 20000
+PASOS_RECETA_GRANDE = 200  # Escritura lenta: una receta con muchos pasos
+LATIDO_MS = 10
+ESCRITURA_CADA = 10        # Una de cada N acciones de un cliente es una escritura
+
+
+def preparar_base_datos(ruta: str):
+    """Crea el esquema con un catálogo de recetas base sintéticas"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+    from database.db import DatabaseManager
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+        cargar_recetas_base(DatabaseManager(), (
+            (f"Receta {i:05d}", "Receta sintética",
+             [("Picar", "velocidad=media", 5), ("Hervir", "temperatura=100C", 60)])
+            for i in range(NUM_RECETAS)
+        ))
+
+
+def percentil(valores, fraccion: float) -> float:
+    """Percentil de una lista de valores (en su misma unidad)"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(int(len(ordenados) * fraccion), len(ordenados) - 1)]
+
+
+async def ejecutar_modo(ctrl, fachada, clientes: int, segundos: float) -> dict:
+    """Lanza los clientes y el latido durante `segundos` y devuelve las métricas"""
+    fin = time.perf_counter() + segundos
+    retrasos = []
+    latencias = []
+    procesos = [
+        {'tipo': 'Picar', 'parametros': 'velocidad=media', 'duracion': 5}
+    ] * PASOS_RECETA_GRANDE
+
+    async def llamar(escritura: bool, funcion, *args):
+        if fachada is None:
+            return funcion(*args)  # Bloquea el bucle mientras dura
+        if escritura:
+            return await fachada.escribir(funcion, *args)
+        return await fachada.leer(funcion, *args)
+
+    async def latido():
+        intervalo = LATIDO_MS / 1000
+        while time.perf_counter() < fin:
+            esperado = time.perf_counter() + intervalo
+            await asyncio.sleep(intervalo)
+            retrasos.append((time.perf_counter() - esperado) * 1000)
+
+    async def cliente(n: int):
+        accion = 0
+        cursor = None
+        while time.perf_counter() < fin:
+            accion += 1
+            inicio = time.perf_counter()
+            if accion % ESCRITURA_CADA == 0:
+                await llamar(True, ctrl.guardar_receta_completa,
+                             f"Grande {n}-{accion}", "", [], procesos)
+            else:
+                _, cursor = await llamar(False, ctrl.listar_recetas, 'todas', cursor, 24)
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(latido(), *(cliente(n) for n in range(clientes)))
+    return {
+        'acciones': len(latencias),
+        'retraso_p50': percentil(retrasos, 0.50),
+        'retraso_p99': percentil(retrasos, 0.99),
+        'retraso_max': max(retrasos, default=0.0),
+        'latencia_p50': percentil(latencias, 0.50),
+        'latencia_p99': percentil(latencias, 0.99),
+    }
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTES_POR_DEFECTO
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else SEGUNDOS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"))
+        ctrl = RecetasController()
+
+        print(f"{clientes} clientes, {segundos:.0f}s por modo, "
+              f"1 de cada {ESCRITURA_CADA} acciones guarda una receta de "
+              f"{PASOS_RECETA_GRANDE} pasos\n")
+        print(f"{'modo':<10} | {'acciones':>8} | {'retraso bucle p50/p99/máx':>27} | "
+              f"{'latencia acción p50/p99':>23}")
+        print("-" * 79)
+
+        fachada = AsyncDatabaseManager()
+        for nombre, modo in (('síncrono', None), ('db_async', fachada)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                r = asyncio.run(ejecutar_modo(ctrl, modo, clientes, segundos))
+            print(f"{nombre:<10} | {r['acciones']:>8} | "
+                  f"{r['retraso_p50']:>7.1f} /{r['retraso_p99']:>7.1f} /{r['retraso_max']:>7.1f}ms | "
+                  f"{r['latencia_p50']:>8.1f} /{r['latencia_p99']:>7.1f}ms")
+        fachada.cerrar()
+
+
+if __name__ == "__main__":
+    main()
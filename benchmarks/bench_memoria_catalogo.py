@@ -0,0 +1,84 @@
+"""
+Benchmark de memoria de la carga del catálogo completo
+Crea una base de datos con N recetas base sintéticas (4 procesos cada una),
+carga el catálogo con RecetasController.obtener_recetas_base() y mide con
+tracemalloc la memoria que ocupan las recetas y procesos cargados, en
+total y por objeto.
+
+Para comparar layouts (con y sin __slots__), ejecutarlo en cada versión
+del código con los mismos argumentos.
+
+Uso:
+    python benchmarks/bench_memoria_catalogo.py [recetas]
+"""
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+
+NUM_RECETAS_POR_DEFECTO = 50000
+PASOS = [
+    ("Pesar", "ingrediente=garbanzos, peso=400g", 5),
+    ("Triturar", "velocidad=alta", 60),
+    ("Hervir", "temperatura=100C, tiempo=45min", 2700),
+    ("Sofreir", "temperatura=media, tiempo=2min", 120),
+]
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema con un catálogo de recetas base sintéticas"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+    from database.db import DatabaseManager
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+        cargar_recetas_base(DatabaseManager(), (
+            (f"Receta {i:06d}", "Receta sintética", PASOS) for i in range(num_recetas)
+        ))
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        ctrl = RecetasController()
+
+        gc.collect()
+        tracemalloc.start()
+        antes = tracemalloc.get_traced_memory()[0]
+        inicio = time.perf_counter()
+        recetas = ctrl.obtener_recetas_base()
+        segundos = time.perf_counter() - inicio
+        gc.collect()
+        despues, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        num_procesos = sum(r.get_num_pasos() for r in recetas)
+        memoria = despues - antes
+        objetos = len(recetas) + num_procesos
+        print(f"{len(recetas)} recetas, {num_procesos} procesos "
+              f"cargados en {segundos:.2f}s (con tracemalloc)")
+        print(f"Memoria retenida: {memoria / (1024 * 1024):.1f} MB "
+              f"(pico {(pico - antes) / (1024 * 1024):.1f} MB)")
+        print(f"Por receta (con sus procesos): {memoria / len(recetas):.0f} bytes")
+        print(f"Por objeto: {memoria / objetos:.0f} bytes")
+
+        ejemplo = recetas[0].procesos[0]
+        print(f"\nLayout de {type(ejemplo).__name__}: "
+              f"{'__dict__' if hasattr(ejemplo, '__dict__') else '__slots__'}")
+
+
+if __name__ == "__main__":
+    main()
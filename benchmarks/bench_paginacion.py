@@ -0,0 +1,121 @@
+"""
+Benchmark de paginación del navegador
+Compara el coste de una página a distintas profundidades con paginación
+por clave (RecetasController.listar_recetas) y con LIMIT/OFFSET, y el de
+una página de tarjetas con resúmenes SQL frente a objetos Receta completos.
+
+Uso:
+    python benchmarks/bench_paginacion.py [num_recetas]
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+
+NUM_RECETAS_POR_DEFECTO = 100000
+TAMANO_PAGINA = 24
+REPETICIONES = 20
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema y lo rellena con recetas de usuario sintéticas"""
+    from database.init_db import inicializar_base_datos
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+
+    conn = sqlite3.connect(ruta)
+    with conn:
+        conn.executemany(
+            "INSERT INTO recetas_usuario (nombre, descripcion, favorito) VALUES (?, ?, ?)",
+            ((f"Receta {(i * 7919) % num_recetas:06d}", "", int(i % 4 == 0))
+             for i in range(num_recetas))
+        )
+        conn.executemany(
+            """
+            INSERT INTO procesos_usuario (receta_id, tipo_proceso, parametros, orden, duracion)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ((i, tipo, "velocidad=media", orden, 5)
+             for i in range(1, num_recetas + 1)
+             for orden, tipo in enumerate(["Picar", "Triturar", "Hervir", "Sofreir"], 1))
+        )
+    conn.close()
+
+
+def pagina_offset(db: DatabaseManager, desplazamiento: int):
+    """Página con LIMIT/OFFSET (recorre y descarta las filas anteriores)"""
+    return db.ejecutar_query(
+        """
+        SELECT id, nombre, 0 AS es_base FROM recetas_usuario
+        ORDER BY nombre, id LIMIT ? OFFSET ?
+        """,
+        (TAMANO_PAGINA, desplazamiento)
+    )
+
+
+def pagina_recetas_completas(ctrl, cursor):
+    """Página de tarjetas construyendo cada Receta con sus ProcesoCocina"""
+    filas = ctrl._db.listar_recetas('usuario', cursor, TAMANO_PAGINA)
+    return [ctrl.obtener_receta_por_id(f['id'], False, usar_cache=False) for f in filas]
+
+
+def medir_ms(funcion, *args) -> float:
+    """Mediana en milisegundos de REPETICIONES ejecuciones"""
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion(*args)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2]
+
+
+def main():
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        db = DatabaseManager()
+
+        print(f"{num_recetas} recetas de usuario, páginas de {TAMANO_PAGINA}\n")
+        print(f"{'profundidad':>11} | {'keyset':>8} | {'OFFSET':>8}")
+        print("-" * 34)
+
+        for fraccion in (0.0, 0.25, 0.5, 0.99):
+            desplazamiento = int(num_recetas * fraccion)
+            # Cursor = última fila de la página anterior
+            cursor = None
+            if desplazamiento:
+                fila = pagina_offset(db, desplazamiento - 1)[0]
+                cursor = (fila['nombre'], fila['es_base'], fila['id'])
+
+            t_keyset = medir_ms(db.listar_recetas, 'usuario', cursor, TAMANO_PAGINA)
+            t_offset = medir_ms(pagina_offset, db, desplazamiento)
+            assert ([f['id'] for f in db.listar_recetas('usuario', cursor, TAMANO_PAGINA)]
+                    == [f['id'] for f in pagina_offset(db, desplazamiento)])
+
+            print(f"{desplazamiento:>11} | {t_keyset:>6.2f}ms | {t_offset:>6.2f}ms")
+
+        t_conteo = medir_ms(db.contar_recetas, 'todas')
+        print(f"\nconteo (todas): {t_conteo:.2f}ms")
+
+        from controllers.recetas_controller import RecetasController
+        ctrl = RecetasController()
+        t_resumen = medir_ms(ctrl.listar_recetas, 'usuario', None, TAMANO_PAGINA)
+        t_completas = medir_ms(pagina_recetas_completas, ctrl, None)
+        print(f"página de tarjetas: resúmenes {t_resumen:.2f}ms, "
+              f"Receta completas {t_completas:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark de interpretación de parámetros
+Crea muchos procesos con los textos de parámetros del catálogo
+preinstalado y llama a get_descripcion() de todos, interpretando los
+parámetros sin caché (una vez por proceso) y con la caché de
+parsear_parametros (una vez por texto distinto).
+
+Uso:
+    python benchmarks/bench_parametros.py [procesos]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models.proceso as proceso_module
+from database.init_db import RECETAS_PREINSTALADAS
+from models.parametros import parsear_parametros
+from models.procesos_basicos import crear_proceso
+
+PROCESOS_POR_DEFECTO = 200000
+
+
+def medir(pasos, n: int) -> tuple:
+    """Segundos en crear n procesos y en describirlos todos"""
+    inicio = time.perf_counter()
+    procesos = [crear_proceso(*pasos[i % len(pasos)]) for i in range(n)]
+    creacion = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for proceso in procesos:
+        proceso.get_descripcion()
+        proceso.mensaje_inicio()
+    descripcion = time.perf_counter() - inicio
+    return creacion, descripcion
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else PROCESOS_POR_DEFECTO
+    pasos = [paso for _, _, procesos in RECETAS_PREINSTALADAS for paso in procesos]
+    distintos = len({parametros for _, parametros, _ in pasos})
+
+    print(f"{n} procesos, {distintos} textos de parámetros distintos\n")
+    print(f"{'modo':<10} | {'creación':>10} | {'descripciones':>13}")
+    print("-" * 40)
+
+    for nombre, parser in (('sin caché', parsear_parametros.__wrapped__),
+                           ('con caché', parsear_parametros)):
+        proceso_module.parsear_parametros = parser
+        parsear_parametros.cache_clear()
+        creacion, descripcion = medir(pasos, n)
+        print(f"{nombre:<10} | {creacion * 1000:>7.0f} ms | {descripcion * 1000:>10.0f} ms")
+    proceso_module.parsear_parametros = parsear_parametros
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark de muchos robots simulados a la vez
+Ejecuta la misma receta en N robots con un RelojEscalado, primero con un
+hilo por robot (RobotCocina.ejecutar_receta, como ThreadingManager) y
+después como tareas de un único bucle de asyncio
+(RobotCocina.ejecutar_receta_async). Mide el tiempo total, los hilos vivos
+y, en el modo asyncio, el retraso del bucle con un latido.
+
+Uso:
+    python benchmarks/bench_robots_async.py [robots] [factor_reloj]
+"""
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.procesos_basicos import crear_proceso
+from models.receta import Receta
+from models.reloj import RelojEscalado, usar_reloj
+from models.robot import RobotCocina
+
+ROBOTS_POR_DEFECTO = 500
+FACTOR_POR_DEFECTO = 600.0  # 10 minutos simulados por segundo real
+LATIDO_MS = 10
+PASOS_RECETA = [
+    ("Pesar", "ingrediente=garbanzos, peso=400g", 5),
+    ("Triturar", "velocidad=alta", 60),
+    ("Hervir", "temperatura=100C, tiempo=5min", 300),
+    ("PrepararPure", "velocidad=media", 60),
+]
+
+
+def crear_robots(n: int):
+    """Robots encendidos, cada uno con su propia receta"""
+    robots = []
+    for i in range(n):
+        robot = RobotCocina()
+        robot.encender()
+        receta = Receta(i, f"Hummus {i}", "")
+        receta.establecer_procesos([crear_proceso(t, p, d) for t, p, d in PASOS_RECETA])
+        robots.append((robot, receta))
+    return robots
+
+
+def con_hilos(robots, reloj) -> dict:
+    """Un hilo por robot"""
+    resultados = []
+
+    def ejecutar(robot, receta):
+        with usar_reloj(reloj):
+            resultados.append(robot.ejecutar_receta(receta))
+
+    inicio = time.perf_counter()
+    hilos = [threading.Thread(target=ejecutar, args=par, daemon=True) for par in robots]
+    for hilo in hilos:
+        hilo.start()
+    max_hilos = threading.active_count()
+    for hilo in hilos:
+        hilo.join()
+    return {'segundos': time.perf_counter() - inicio, 'hilos': max_hilos,
+            'completadas': sum(resultados), 'retraso_max': None}
+
+
+def con_asyncio(robots, reloj) -> dict:
+    """Todas las recetas como tareas de un único bucle"""
+    retrasos = []
+
+    async def principal():
+        terminado = asyncio.Event()
+
+        async def latido():
+            intervalo = LATIDO_MS / 1000
+            while not terminado.is_set():
+                esperado = time.perf_counter() + intervalo
+                await asyncio.sleep(intervalo)
+                retrasos.append((time.perf_counter() - esperado) * 1000)
+
+        async def ejecutar(robot, receta):
+            with usar_reloj(reloj):
+                return await robot.ejecutar_receta_async(receta)
+
+        tarea_latido = asyncio.create_task(latido())
+        resultados = await asyncio.gather(*(ejecutar(r, rec) for r, rec in robots))
+        hilos = threading.active_count()
+        terminado.set()
+        await tarea_latido
+        return resultados, hilos
+
+    inicio = time.perf_counter()
+    resultados, hilos = asyncio.run(principal())
+    return {'segundos': time.perf_counter() - inicio, 'hilos': hilos,
+            'completadas': sum(resultados), 'retraso_max': max(retrasos, default=0.0)}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ROBOTS_POR_DEFECTO
+    factor = float(sys.argv[2]) if len(sys.argv) > 2 else FACTOR_POR_DEFECTO
+    duracion = sum(d for _, _, d in PASOS_RECETA)
+
+    print(f"{n} robots, receta de {duracion}s base, reloj x{factor:g}\n")
+    print(f"{'modo':<8} | {'tiempo':>8} | {'hilos':>6} | {'completadas':>11} | {'retraso bucle máx':>17}")
+    print("-" * 64)
+
+    for nombre, modo in (('hilos', con_hilos), ('asyncio', con_asyncio)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            r = modo(crear_robots(n), RelojEscalado(factor))
+        retraso = f"{r['retraso_max']:.1f} ms" if r['retraso_max'] is not None else "-"
+        print(f"{nombre:<8} | {r['segundos']:>6.2f} s | {r['hilos']:>6} | "
+              f"{r['completadas']:>5}/{n:<5} | {retraso:>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de simulación de recetas con relojes intercambiables
+Ejecuta las recetas preinstaladas (y una con un proceso personalizado largo)
+con un RelojVirtual y, opcionalmente, con un RelojEscalado. Compara el
+tiempo simulado con el tiempo real que tarda la ejecución y comprueba que
+el log generado es el mismo con los dos relojes.
+
+Uso:
+    python benchmarks/bench_simulacion.py [factor_reloj_escalado]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.init_db import RECETAS_PREINSTALADAS
+from models.procesos_basicos import crear_proceso, registrar_proceso_personalizado
+from models.receta import Receta
+from models.reloj import RelojEscalado, RelojVirtual, usar_reloj
+
+REPETICIONES = 20
+
+
+def construir_recetas():
+    """Recetas preinstaladas más una con un Fermentar de una hora"""
+    registrar_proceso_personalizado("Fermentar", "🫙", 3600, "temperatura=28C")
+    semillas = list(RECETAS_PREINSTALADAS) + [
+        ("Pan de masa madre", "Fermentación larga",
+         [("Amasar", "velocidad=baja, tiempo=10min", 600),
+          ("Fermentar", "temperatura=28C", 3600)]),
+    ]
+    recetas = []
+    for i, (nombre, descripcion, pasos) in enumerate(semillas, 1):
+        receta = Receta(i, nombre, descripcion, es_base=True)
+        receta.establecer_procesos([crear_proceso(t, p, d) for t, p, d in pasos])
+        recetas.append(receta)
+    return recetas
+
+
+def simular(receta: Receta, reloj) -> tuple:
+    """Ejecuta la receta con el reloj dado y devuelve (segundos simulados, log)"""
+    log = []
+    receta.reiniciar_procesos()
+    with usar_reloj(reloj):
+        inicio = reloj.ahora()
+        receta.ejecutar_secuencial(log.append)
+        return reloj.ahora() - inicio, log
+
+
+def main():
+    factor = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    recetas = construir_recetas()
+
+    print(f"{'receta':<24} | {'simulado':>9} | {'real (virtual)':>14}"
+          + (f" | {'real (x' + format(factor, 'g') + ')':>12}" if factor else ""))
+    print("-" * (54 + (15 if factor else 0)))
+
+    total_simulado = 0.0
+    total_real = 0.0
+    for receta in recetas:
+        inicio = time.perf_counter()
+        for _ in range(REPETICIONES):
+            simulado, log_virtual = simular(receta, RelojVirtual())
+        real = (time.perf_counter() - inicio) / REPETICIONES
+        total_simulado += simulado
+        total_real += real
+
+        linea = f"{receta.nombre:<24} | {simulado / 60:>7.1f}min | {real * 1000:>11.2f} ms"
+        if factor:
+            inicio = time.perf_counter()
+            _, log_escalado = simular(receta, RelojEscalado(factor))
+            linea += f" | {time.perf_counter() - inicio:>10.2f} s"
+            if log_escalado != log_virtual:
+                linea += "  ⚠️ log distinto"
+        print(linea)
+
+    print("-" * (54 + (15 if factor else 0)))
+    print(f"{'total':<24} | {total_simulado / 60:>7.1f}min | {total_real * 1000:>11.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark de lectura en streaming
+Compara ejecutar_query (lista completa de dicts) con iterar_query y sus
+fábricas de filas al recorrer todos los procesos, y la carga del catálogo
+de recetas pasando por dicts con la construcción directa desde el cursor.
+Mide tiempo y pico de memoria (tracemalloc).
+
+Uso:
+    python benchmarks/bench_streaming.py [num_recetas]
+"""
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+from database.filas import fila_dict, fila_registro, fila_tupla
+
+NUM_RECETAS_POR_DEFECTO = 50000
+CONSULTA_PROCESOS = "SELECT * FROM procesos_base ORDER BY receta_id, orden"
+
+
+def preparar_base_datos(ruta: str, num_recetas: int):
+    """Crea el esquema con un catálogo de recetas base de 4 pasos"""
+    from database.init_db import inicializar_base_datos, cargar_recetas_base
+
+    db_module.DATABASE_PATH = ruta
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicializar_base_datos()
+        cargar_recetas_base(DatabaseManager(), (
+            (f"Receta {i:06d}", "Receta sintética", [
+                ("Picar", "velocidad=media", 5),
+                ("Triturar", "velocidad=alta", 10),
+                ("Hervir", "temperatura=100C", 60),
+                ("Sofreir", "aceite", 30),
+            ])
+            for i in range(num_recetas)
+        ))
+
+
+def medir(funcion):
+    """Devuelve (milisegundos, pico de memoria en MB) de una llamada"""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    funcion()
+    transcurrido = (time.perf_counter() - inicio) * 1000
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return transcurrido, pico / (1024 * 1024)
+
+
+def recorrer_lista(db):
+    """Suma de duraciones materializando todas las filas como dicts"""
+    return sum(fila['duracion'] for fila in db.ejecutar_query(CONSULTA_PROCESOS))
+
+
+def recorrer_streaming(db, fabrica, acceso):
+    """Suma de duraciones recorriendo el cursor con una fábrica de filas"""
+    return sum(acceso(fila) for fila in db.iterar_query(CONSULTA_PROCESOS, (), fabrica))
+
+
+def cargar_catalogo_con_dicts(ctrl):
+    """Carga anterior: listas de dicts agrupadas y luego objetos del modelo"""
+    from models.receta import Receta
+
+    db = ctrl._db
+    procesos_por_receta = {}
+    for p_data in db.obtener_todos_procesos_base():
+        procesos_por_receta.setdefault(p_data['receta_id'], []).append(p_data)
+
+    recetas = []
+    for r_data in db.obtener_recetas_base():
+        receta = Receta(r_data['id'], r_data['nombre'], r_data.get('descripcion', ''), True)
+        receta.cargar_procesos_desde_db(procesos_por_receta.get(r_data['id'], []))
+        recetas.append(receta)
+    return recetas
+
+
+def main():
+    from controllers.recetas_controller import RecetasController
+
+    num_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RECETAS_POR_DEFECTO
+
+    with tempfile.TemporaryDirectory() as tmp:
+        preparar_base_datos(os.path.join(tmp, "bench.db"), num_recetas)
+        db = DatabaseManager()
+        ctrl = RecetasController()
+
+        print(f"{num_recetas} recetas base, {num_recetas * 4} procesos\n")
+        print(f"{'recorrer procesos':<32} | {'tiempo':>9} | {'pico memoria':>12}")
+        print("-" * 60)
+        casos = {
+            'ejecutar_query (dicts)': lambda: recorrer_lista(db),
+            'iterar_query + fila_dict': lambda: recorrer_streaming(
+                db, fila_dict, lambda f: f['duracion']),
+            'iterar_query + fila_registro': lambda: recorrer_streaming(
+                db, fila_registro, lambda f: f.duracion),
+            'iterar_query + fila_tupla': lambda: recorrer_streaming(
+                db, fila_tupla, lambda f: f[5]),
+        }
+        for nombre, funcion in casos.items():
+            ms, mb = medir(funcion)
+            print(f"{nombre:<32} | {ms:>7.0f}ms | {mb:>9.1f} MB")
+
+        print(f"\n{'cargar catálogo (objetos Receta)':<32} | {'tiempo':>9} | {'pico memoria':>12}")
+        print("-" * 60)
+        for nombre, funcion in {
+            'dicts intermedios': lambda: cargar_catalogo_con_dicts(ctrl),
+            'directo desde el cursor': ctrl._cargar_recetas_base,
+        }.items():
+            ms, mb = medir(funcion)
+            print(f"{nombre:<32} | {ms:>7.0f}ms | {mb:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
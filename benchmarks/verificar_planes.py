@@ -0,0 +1,44 @@
+"""
+Verificación de planes de consulta
+Crea una base de datos temporal con todas las migraciones y comprueba
+con EXPLAIN QUERY PLAN que las consultas frecuentes no vuelven a SCAN.
+Termina con código 1 si alguna consulta deja de usar su índice.
+
+Uso:
+    python benchmarks/verificar_planes.py
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database.db as db_module
+from database.db import DatabaseManager
+from database.migraciones import CONSULTAS_INDEXADAS, verificar_planes_consulta
+
+
+def main() -> int:
+    from database.init_db import inicializar_base_datos
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_module.DATABASE_PATH = os.path.join(tmp, "planes.db")
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicializar_base_datos()
+
+        regresiones = verificar_planes_consulta(DatabaseManager())
+        db_module.cerrar_conexiones()
+
+    for nombre in CONSULTAS_INDEXADAS:
+        if nombre in regresiones:
+            print(f"❌ {nombre}: {'; '.join(regresiones[nombre])}")
+        else:
+            print(f"✓ {nombre}")
+
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
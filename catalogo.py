@@ -0,0 +1,109 @@
+"""
+THERMOMIX - Exportación e importación del catálogo de recetas
+Sincroniza las recetas de usuario entre robots mediante ficheros JSONL
+
+Uso:
+    python catalogo.py exportar recetas.jsonl
+    python catalogo.py importar recetas.jsonl [--lote 1000]
+    python catalogo.py exportar - | ssh otro-robot python catalogo.py importar -
+"""
+import argparse
+import contextlib
+import sys
+
+import database.db as db_module
+from controllers.recetas_controller import RecetasController, TAMANO_LOTE_IMPORTACION
+from database.db import cerrar_conexiones
+from database.init_db import inicializar_base_datos
+from models.procesos_basicos import cargar_procesos_personalizados_desde_bd
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Define los subcomandos exportar e importar"""
+    parser = argparse.ArgumentParser(
+        description="Exporta o importa las recetas de usuario en formato JSONL"
+    )
+    parser.add_argument('--db', help="Ruta de la base de datos (por defecto robot_cocina.db)")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    exportar = subcomandos.add_parser('exportar', help="Escribe las recetas de usuario en un fichero JSONL")
+    exportar.add_argument('ruta', help="Fichero de destino ('-' para la salida estándar)")
+
+    importar = subcomandos.add_parser('importar', help="Añade las recetas de un fichero JSONL")
+    importar.add_argument('ruta', help="Fichero de origen ('-' para la entrada estándar)")
+    importar.add_argument('--lote', type=int, default=TAMANO_LOTE_IMPORTACION,
+                          help=f"Líneas por transacción (por defecto {TAMANO_LOTE_IMPORTACION})")
+    return parser
+
+
+def exportar(ctrl: RecetasController, ruta: str, salida_estandar) -> dict:
+    """Exporta el catálogo de usuario a `ruta` (o a la salida estándar)"""
+    if ruta == '-':
+        return ctrl.exportar_catalogo(salida_estandar)
+    with open(ruta, 'w', encoding='utf-8', newline='\n') as destino:
+        return ctrl.exportar_catalogo(destino)
+
+
+def importar(ctrl: RecetasController, ruta: str, tamano_lote: int) -> dict:
+    """Importa el catálogo desde `ruta` (o desde la entrada estándar)"""
+    # Los tipos de proceso se validan contra los básicos y los personalizados
+    cargar_procesos_personalizados_desde_bd()
+    if ruta == '-':
+        return ctrl.importar_catalogo(sys.stdin, tamano_lote)
+    with open(ruta, encoding='utf-8') as origen:
+        return ctrl.importar_catalogo(origen, tamano_lote)
+
+
+def mostrar_informe(accion: str, informe: dict):
+    """Imprime el resumen de la operación y su ritmo en filas por segundo"""
+    print(f"✓ {accion}: {informe['recetas']} recetas, {informe['ingredientes']} ingredientes, "
+          f"{informe['procesos']} procesos")
+    print(f"⏱️ {informe['filas']} filas en {informe['segundos']:.2f}s "
+          f"({informe['filas_por_segundo']:,.0f} filas/s)")
+
+    if informe.get('omitidas'):
+        print(f"ℹ️ {informe['omitidas']} recetas omitidas (ya existía una con el mismo nombre)")
+    if informe.get('invalidas'):
+        print(f"⚠️ {informe['invalidas']} líneas inválidas omitidas:")
+        for numero, motivo in informe['errores']:
+            print(f"   línea {numero}: {motivo}")
+        if informe['invalidas'] > len(informe['errores']):
+            print(f"   ... y {informe['invalidas'] - len(informe['errores'])} más")
+
+
+def main(argv=None) -> int:
+    """
+    Punto de entrada de la línea de comandos
+
+    Returns:
+        Código de salida: 0 si todo fue bien, 1 si hubo líneas inválidas
+    """
+    args = crear_parser().parse_args(argv)
+    if args.comando == 'importar' and args.lote < 1:
+        print("❌ --lote debe ser mayor que 0", file=sys.stderr)
+        return 2
+
+    if args.db:
+        db_module.DATABASE_PATH = args.db
+
+    # Con '-' la salida estándar es para los datos: los mensajes van a stderr
+    salida_estandar = sys.stdout
+    mensajes = sys.stderr if args.ruta == '-' else salida_estandar
+    with contextlib.redirect_stdout(mensajes):
+        try:
+            inicializar_base_datos()
+            ctrl = RecetasController()
+            if args.comando == 'exportar':
+                informe = exportar(ctrl, args.ruta, salida_estandar)
+                mostrar_informe("Exportadas", informe)
+            else:
+                informe = importar(ctrl, args.ruta, args.lote)
+                mostrar_informe("Importadas", informe)
+        finally:
+            cerrar_conexiones()
+
+    return 1 if informe.get('invalidas') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Caché en memoria del catálogo de recetas
+Evita reconstruir los objetos Receta y ProcesoCocina en cada render
+"""
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from models.receta import Receta
+
+
+class CacheCatalogo:
+    """
+    Caché compartida de recetas base y de usuario
+
+    Las recetas base no cambian tras la carga inicial, así que se leen una
+    sola vez. Las de usuario se mantienen con escritura directa
+    (write-through): cada operación del controlador que modifica la base de
+    datos actualiza también la caché, o la invalida si no puede hacerlo.
+
+    Además mantiene un índice (es_base, id) -> Receta para abrir una receta
+    concreta sin recorrer ni cargar el catálogo completo.
+
+    Las recetas devueltas son compartidas: para ejecutarlas hay que usar
+    una copia (Receta.copiar).
+    """
+
+    def __init__(self):
+        """Inicializa la caché vacía"""
+        self._lock = threading.RLock()
+        self._base: Optional[List[Receta]] = None
+        self._usuario: Optional[List[Receta]] = None
+        self._indice: Dict[Tuple[bool, int], Receta] = {}
+        self._aciertos = 0
+        self._fallos = 0
+        self._invalidaciones = 0
+
+    # ========== LECTURA ==========
+
+    def obtener_base(self, cargar: Callable[[], List[Receta]]) -> List[Receta]:
+        """
+        Obtiene las recetas base, cargándolas la primera vez
+
+        Args:
+            cargar: Función que lee las recetas base de la base de datos
+
+        Returns:
+            Copia de la lista cacheada (las recetas son compartidas)
+        """
+        with self._lock:
+            if self._base is None:
+                self._fallos += 1
+                self._base = cargar()
+                self._indexar(self._base, es_base=True)
+            else:
+                self._aciertos += 1
+            return list(self._base)
+
+    def obtener_usuario(self, cargar: Callable[[], List[Receta]]) -> List[Receta]:
+        """
+        Obtiene las recetas de usuario, cargándolas si la caché no es válida
+
+        Args:
+            cargar: Función que lee las recetas de usuario de la base de datos
+
+        Returns:
+            Copia de la lista cacheada (las recetas son compartidas)
+        """
+        with self._lock:
+            if self._usuario is None:
+                self._fallos += 1
+                self._usuario = cargar()
+                self._indexar(self._usuario, es_base=False)
+            else:
+                self._aciertos += 1
+            return list(self._usuario)
+
+    def obtener_por_id(self, receta_id: int, es_base: bool,
+                       cargar: Callable[[], Optional[Receta]]) -> Optional[Receta]:
+        """
+        Obtiene una receta concreta a través del índice por ID
+
+        Args:
+            receta_id: ID de la receta
+            es_base: True si es receta base, False si es de usuario
+            cargar: Función que lee solo esa receta de la base de datos
+
+        Returns:
+            Receta cacheada o recién cargada (None si no existe; no se cachea)
+        """
+        clave = (es_base, receta_id)
+        with self._lock:
+            receta = self._indice.get(clave)
+            if receta is not None:
+                self._aciertos += 1
+                return receta
+            self._fallos += 1
+            invalidaciones = self._invalidaciones
+
+        # La lectura se hace sin el lock para no bloquear al resto de lectores
+        receta = cargar()
+        if receta is None:
+            return None
+
+        with self._lock:
+            if self._invalidaciones != invalidaciones:
+                return receta  # Se invalidó durante la lectura: puede estar desfasada
+            # Si otro hilo la cargó a la vez, se queda la primera
+            return self._indice.setdefault(clave, receta)
+
+    # ========== ESCRITURA DIRECTA ==========
+
+    def agregar_usuario(self, receta: Receta):
+        """Inserta una receta de usuario recién creada respetando el orden por nombre"""
+        with self._lock:
+            self._indice[(False, receta.id)] = receta
+            if self._usuario is None:
+                return
+            nombres = [r.nombre for r in self._usuario]
+            self._usuario.insert(bisect.bisect_right(nombres, receta.nombre), receta)
+
+    def actualizar_favorito(self, receta_id: int, favorito: bool):
+        """Actualiza el estado de favorito de una receta de usuario cacheada"""
+        with self._lock:
+            indexada = self._indice.get((False, receta_id))
+            if indexada is not None:
+                indexada.favorito = favorito
+            if self._usuario is None:
+                return
+            for receta in self._usuario:
+                if receta.id == receta_id:
+                    receta.favorito = favorito
+                    return
+            # La receta no estaba en caché: la caché está desfasada
+            self._invalidar_usuario()
+
+    def vaciar_usuario(self):
+        """Deja la caché de usuario vacía (reinicio de fábrica)"""
+        with self._lock:
+            self._usuario = []
+            self._descartar_indice(es_base=False)
+            self._invalidaciones += 1
+
+    # ========== INVALIDACIÓN ==========
+
+    def invalidar_usuario(self):
+        """Fuerza la recarga de las recetas de usuario en el próximo acceso"""
+        with self._lock:
+            self._invalidar_usuario()
+
+    def invalidar_todo(self):
+        """Fuerza la recarga de todo el catálogo (ej: cambian los procesos personalizados)"""
+        with self._lock:
+            self._base = None
+            self._descartar_indice(es_base=True)
+            self._invalidar_usuario()
+
+    def _invalidar_usuario(self):
+        """Invalida la caché de usuario (llamar con el lock)"""
+        self._usuario = None
+        self._descartar_indice(es_base=False)
+        self._invalidaciones += 1
+
+    def _indexar(self, recetas: List[Receta], es_base: bool):
+        """Añade una lista de recetas al índice por ID (llamar con el lock)"""
+        for receta in recetas:
+            self._indice[(es_base, receta.id)] = receta
+
+    def _descartar_indice(self, es_base: bool):
+        """Elimina del índice las recetas base o las de usuario (llamar con el lock)"""
+        self._indice = {clave: r for clave, r in self._indice.items() if clave[0] != es_base}
+
+    # ========== ESTADÍSTICAS ==========
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché
+
+        Returns:
+            Diccionario con aciertos, fallos e invalidaciones
+        """
+        with self._lock:
+            return {
+                'aciertos': self._aciertos,
+                'fallos': self._fallos,
+                'invalidaciones': self._invalidaciones,
+            }
+
+
+# Caché compartida por todas las instancias de RecetasController
+cache_catalogo = CacheCatalogo()
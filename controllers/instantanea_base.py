@@ -0,0 +1,175 @@
+"""
+Instantánea inmutable en memoria de las recetas base
+Sirve listados, conteos y aperturas de recetas base sin leer la base de datos
+"""
+import bisect
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from database.db import DatabaseManager
+
+# Una receta base tal como la muestra un resumen (tipos_procesos separados por comas)
+FilaBase = namedtuple('FilaBase', 'id nombre descripcion num_pasos duracion_total tipos_procesos')
+
+# Proceso de una receta base: (tipo, parametros, duracion)
+ProcesoBase = Tuple[str, str, int]
+
+
+class InstantaneaBase:
+    """
+    Copia inmutable de recetas_base y procesos_base
+
+    Las recetas base no cambian después de la carga inicial (init_db), así
+    que se pueden leer una vez al arrancar y servir desde memoria. Todo el
+    contenido son tuplas y diccionarios de solo lectura (MappingProxyType):
+    una vez construida, la instantánea se comparte entre hilos sin ningún
+    lock, porque nadie puede modificarla.
+
+    Las filas están ordenadas por (nombre, id), el mismo orden que el
+    listado paginado de la base de datos, así que los cursores de página
+    son intercambiables entre ambas fuentes.
+    """
+
+    __slots__ = ('_filas', '_claves', '_por_id', '_procesos', '_duraciones')
+
+    def __init__(self, filas: List[FilaBase], procesos: Dict[int, List[ProcesoBase]]):
+        """
+        Construye la instantánea
+
+        Args:
+            filas: Recetas base ordenadas por (nombre, id)
+            procesos: Procesos de cada receta, en orden, por ID de receta
+        """
+        self._filas: Tuple[FilaBase, ...] = tuple(filas)
+        self._claves: Tuple[Tuple[str, int], ...] = tuple((f.nombre, f.id) for f in self._filas)
+        self._por_id: Mapping[int, FilaBase] = MappingProxyType({f.id: f for f in self._filas})
+        self._procesos: Mapping[int, Tuple[ProcesoBase, ...]] = MappingProxyType(
+            {receta_id: tuple(lista) for receta_id, lista in procesos.items()}
+        )
+        self._duraciones: Tuple[int, ...] = tuple(sorted(f.duracion_total for f in self._filas))
+
+    @classmethod
+    def cargar(cls, db: DatabaseManager) -> 'InstantaneaBase':
+        """
+        Lee recetas y procesos base en streaming y construye la instantánea
+
+        Args:
+            db: Gestor de base de datos
+
+        Returns:
+            Instantánea con el catálogo base completo
+        """
+        procesos: Dict[int, List[ProcesoBase]] = {}
+        for receta_id, tipo, parametros, duracion in db.iterar('modelo_procesos_base'):
+            procesos.setdefault(receta_id, []).append((tipo, parametros or '', duracion))
+
+        filas = [
+            FilaBase(receta_id, nombre, descripcion, num_pasos, duracion_total, ','.join(
+                tipo for tipo, _, _ in procesos.get(receta_id, ())[:DatabaseManager.TIPOS_EN_RESUMEN]
+            ) or None)
+            for receta_id, nombre, descripcion, num_pasos, duracion_total
+            in db.iterar('instantanea_recetas_base')
+        ]
+        return cls(filas, procesos)
+
+    def __len__(self) -> int:
+        return len(self._filas)
+
+    # ========== CONSULTAS ==========
+
+    @property
+    def filas(self) -> Tuple[FilaBase, ...]:
+        """Todas las recetas base ordenadas por (nombre, id)"""
+        return self._filas
+
+    def fila(self, receta_id: int) -> Optional[FilaBase]:
+        """Receta base por ID (None si no existe)"""
+        return self._por_id.get(receta_id)
+
+    def procesos(self, receta_id: int) -> Tuple[ProcesoBase, ...]:
+        """Procesos (tipo, parametros, duracion) de una receta base, en orden"""
+        return self._procesos.get(receta_id, ())
+
+    def listar(self, despues_de: Optional[Tuple[str, int, int]] = None, limite: int = 24,
+               duracion_maxima: Optional[int] = None) -> List[Dict]:
+        """
+        Página de recetas base con las mismas filas y cursor que DatabaseManager.listar_recetas
+
+        Args:
+            despues_de: (nombre, es_base, id) de la última receta ya mostrada
+            limite: Tamaño de la página
+            duracion_maxima: Solo recetas de como mucho estos segundos
+
+        Returns:
+            Filas de resumen (diccionarios nuevos, que el llamador puede modificar)
+        """
+        inicio = 0
+        if despues_de is not None:
+            nombre, es_base_cursor, receta_id = despues_de
+            if es_base_cursor:
+                inicio = bisect.bisect_right(self._claves, (nombre, receta_id))
+            else:
+                # Con el mismo nombre, la receta base va después de la de usuario
+                inicio = bisect.bisect_left(self._claves, (nombre,))
+
+        pagina = []
+        for indice in range(inicio, len(self._filas)):
+            fila = self._filas[indice]
+            if duracion_maxima is not None and fila.duracion_total > duracion_maxima:
+                continue
+            pagina.append(self.resumen(fila))
+            if len(pagina) == limite:
+                break
+        return pagina
+
+    def contar(self, duracion_maxima: Optional[int] = None) -> int:
+        """Número de recetas base (de como mucho `duracion_maxima` segundos)"""
+        if duracion_maxima is None:
+            return len(self._filas)
+        return bisect.bisect_right(self._duraciones, duracion_maxima)
+
+    @staticmethod
+    def resumen(fila: FilaBase) -> Dict:
+        """Fila de resumen con las columnas de DatabaseManager.listar_recetas"""
+        return {
+            'id': fila.id,
+            'nombre': fila.nombre,
+            'descripcion': fila.descripcion,
+            'es_base': 1,
+            'favorito': 0,
+            'num_pasos': fila.num_pasos,
+            'duracion_total': fila.duracion_total,
+            'tipos_procesos': fila.tipos_procesos,
+        }
+
+
+# Instantánea en uso (None = las recetas base se leen de la base de datos).
+# Se sustituye con una sola asignación, así que los lectores ven siempre
+# una instantánea completa, la anterior o la nueva
+_instantanea: Optional[InstantaneaBase] = None
+
+
+def activar_instantanea_base(db: Optional[DatabaseManager] = None) -> InstantaneaBase:
+    """
+    Carga las recetas base en memoria y las sirve desde ahí a partir de ahora
+
+    Debe llamarse después de inicializar la base de datos (init_db), cuando
+    el catálogo base ya está completo.
+
+    Returns:
+        La instantánea cargada
+    """
+    global _instantanea
+    _instantanea = InstantaneaBase.cargar(db or DatabaseManager())
+    return _instantanea
+
+
+def desactivar_instantanea_base():
+    """Vuelve a leer las recetas base de la base de datos"""
+    global _instantanea
+    _instantanea = None
+
+
+def instantanea_base() -> Optional[InstantaneaBase]:
+    """Instantánea activa, o None si las recetas base se leen de la base de datos"""
+    return _instantanea
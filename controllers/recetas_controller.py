@@ -2,18 +2,40 @@
 Controlador de Recetas
 Gestiona las operaciones CRUD de recetas
 """
-from typing import List, Optional
-from database.db import DatabaseManager
-from models.receta import Receta
-from models.procesos_basicos import PROCESOS_DISPONIBLES, _procesos_personalizados_cache
+import json
+import math
+import re
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+from database.db import DatabaseManager, RecetaCompleta
+from models.proceso import ProcesoCocina
+from controllers.cache_catalogo import cache_catalogo
+from controllers.instantanea_base import FilaBase, InstantaneaBase, instantanea_base
+from models.receta import Receta, ResumenReceta
+from models.procesos_basicos import PROCESOS_DISPONIBLES, _procesos_personalizados_cache, crear_proceso
 from utils.exceptions import RecetaNoEncontradaException
 
+# Cursor de paginación: (nombre, es_base, id) de la última receta de la página
+CursorRecetas = Tuple[str, int, int]
+
+# Líneas del fichero JSONL que se validan e insertan por transacción al importar
+TAMANO_LOTE_IMPORTACION = 1000
+
+# Errores de validación que se guardan en el informe de importación
+MAX_ERRORES_INFORME = 20
+
 class RecetasController:
     """
     Controlador para gestionar recetas base y de usuario
     
     Proporciona métodos para crear, leer y eliminar recetas,
     así como para gestionar sus procesos.
+
+    Las lecturas se sirven desde la caché compartida del catálogo y las
+    escrituras la mantienen actualizada. Si la instantánea de recetas base
+    está activa (activar_instantanea_base), las recetas base se leen de
+    memoria y solo las de usuario van a la base de datos.
     """
     
     def __init__(self):
@@ -24,29 +46,19 @@ class RecetasController:
     
     def obtener_recetas_base(self) -> List[Receta]:
         """
-        Obtiene todas las recetas preinstaladas
+        Obtiene todas las recetas preinstaladas (cacheadas tras la primera carga)
         
         Returns:
             Lista de recetas base con sus procesos cargados
         """
-        recetas_data = self._db.obtener_recetas_base()
-        recetas = []
-        
-        for r_data in recetas_data:
-            receta = Receta(
-                id=r_data['id'],
-                nombre=r_data['nombre'],
-                descripcion=r_data.get('descripcion', ''),
-                es_base=True
-            )
-            
-            # Cargar procesos
-            procesos_data = self._db.obtener_procesos_receta_base(r_data['id'])
-            receta.cargar_procesos_desde_db(procesos_data)
-            
-            recetas.append(receta)
-        
-        return recetas
+        return cache_catalogo.obtener_base(self._cargar_recetas_base)
+
+    def _cargar_recetas_base(self) -> List[Receta]:
+        """Lee las recetas base y sus procesos (de la instantánea o de la base de datos)"""
+        instantanea = instantanea_base()
+        if instantanea is not None:
+            return [self._receta_desde_instantanea(instantanea, fila) for fila in instantanea.filas]
+        return self._cargar_recetas('modelo_recetas_base', 'modelo_procesos_base')
     
     def obtener_recetas_usuario(self) -> List[Receta]:
         """
@@ -55,26 +67,36 @@ class RecetasController:
         Returns:
             Lista de recetas de usuario con sus procesos cargados
         """
-        recetas_data = self._db.obtener_recetas_usuario()
-        recetas = []
+        return cache_catalogo.obtener_usuario(self._cargar_recetas_usuario)
 
-        for r_data in recetas_data:
-            receta = Receta(
-                id=r_data['id'],
-                nombre=r_data['nombre'],
-                descripcion=r_data.get('descripcion', ''),
-                es_base=False
-            )
+    def _cargar_recetas_usuario(self) -> List[Receta]:
+        """Lee las recetas de usuario y sus procesos de la base de datos"""
+        return self._cargar_recetas('modelo_recetas_usuario', 'modelo_procesos_usuario')
+
+    def _cargar_recetas(self, consulta_recetas: str, consulta_procesos: str,
+                        params: tuple = ()) -> List[Receta]:
+        """
+        Construye recetas y procesos directamente desde el cursor
 
-            # Establecer favorito (nuevo en v2.0)
-            receta.favorito = bool(r_data.get('favorito', 0))
+        Las filas se recorren en streaming y cada una se convierte en su
+        objeto del modelo sin pasar por listas de diccionarios intermedias.
 
-            # Cargar procesos
-            procesos_data = self._db.obtener_procesos_receta_usuario(r_data['id'])
-            receta.cargar_procesos_desde_db(procesos_data)
+        Args:
+            consulta_recetas: Consulta registrada con las filas de receta
+            consulta_procesos: Consulta registrada con los procesos (por receta_id, orden)
+            params: Parámetros de ambas consultas
 
-            recetas.append(receta)
+        Returns:
+            Recetas con sus procesos, en el orden de consulta_recetas
+        """
+        procesos_por_receta: Dict[int, List[ProcesoCocina]] = {}
+        for receta_id, proceso in self._db.iterar(consulta_procesos, params, self._fila_proceso):
+            if proceso is not None:
+                procesos_por_receta.setdefault(receta_id, []).append(proceso)
 
+        recetas = list(self._db.iterar(consulta_recetas, params, self._fila_receta))
+        for receta in recetas:
+            receta.establecer_procesos(procesos_por_receta.get(receta.id, []))
         return recetas
     
     def obtener_todas_recetas(self) -> tuple[List[Receta], List[Receta]]:
@@ -86,25 +108,199 @@ class RecetasController:
         """
         return self.obtener_recetas_base(), self.obtener_recetas_usuario()
     
-    def obtener_receta_por_id(self, receta_id: int, es_base: bool) -> Optional[Receta]:
+    def obtener_receta_por_id(self, receta_id: int, es_base: bool,
+                              usar_cache: bool = True) -> Optional[Receta]:
         """
         Busca una receta específica por ID
         
+        Solo lee esa receta y sus procesos (búsqueda por clave primaria),
+        así que el coste no depende del tamaño del catálogo.
+
         Args:
             receta_id: ID de la receta
             es_base: True si es receta base, False si es de usuario
+            usar_cache: Si es False, lee siempre de la base de datos
         
         Returns:
             Receta encontrada o None
         """
-        recetas = self.obtener_recetas_base() if es_base else self.obtener_recetas_usuario()
-        
-        for receta in recetas:
-            if receta.id == receta_id:
-                return receta
-        
-        return None
+        if not usar_cache:
+            return self._cargar_receta(receta_id, es_base)
+
+        return cache_catalogo.obtener_por_id(
+            receta_id, es_base, lambda: self._cargar_receta(receta_id, es_base)
+        )
+
+    def _cargar_receta(self, receta_id: int, es_base: bool) -> Optional[Receta]:
+        """Lee una sola receta y sus procesos (las base, de la instantánea si está activa)"""
+        instantanea = instantanea_base() if es_base else None
+        if instantanea is not None:
+            fila = instantanea.fila(receta_id)
+            return self._receta_desde_instantanea(instantanea, fila) if fila else None
+        if es_base:
+            recetas = self._cargar_recetas(
+                'modelo_receta_base_por_id', 'modelo_procesos_receta_base', (receta_id,)
+            )
+        else:
+            recetas = self._cargar_recetas(
+                'modelo_receta_usuario_por_id', 'modelo_procesos_receta_usuario', (receta_id,)
+            )
+        return recetas[0] if recetas else None
     
+    # ========== LISTADO PAGINADO ==========
+
+    def listar_recetas(self, filtro: str = 'todas', despues_de: Optional[CursorRecetas] = None,
+                       limite: int = 24, duracion_maxima: Optional[int] = None
+                       ) -> Tuple[List[ResumenReceta], Optional[CursorRecetas]]:
+        """
+        Obtiene una página de resúmenes de recetas ordenada por nombre
+
+        Los pasos y la duración vienen de columnas de la propia receta: no
+        se crea ningún ProcesoCocina hasta que se abre (obtener_receta_por_id).
+
+        Args:
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            despues_de: Cursor devuelto por la página anterior (None = primera)
+            limite: Tamaño de la página
+            duracion_maxima: Solo recetas de como mucho estos segundos (None = todas)
+
+        Returns:
+            Tupla (resúmenes de la página, cursor de la siguiente página o
+            None si no hay más)
+        """
+        instantanea = instantanea_base()
+        if instantanea is not None and filtro in ('todas', 'base'):
+            filas = self._listar_con_instantanea(
+                instantanea, filtro, despues_de, limite, duracion_maxima
+            )
+        else:
+            filas = self._db.listar_recetas(filtro, despues_de, limite, duracion_maxima)
+        resumenes = [self._construir_resumen(fila) for fila in filas]
+
+        if len(filas) < limite:
+            return resumenes, None
+        ultima = filas[-1]
+        return resumenes, (ultima['nombre'], ultima['es_base'], ultima['id'])
+
+    def _listar_con_instantanea(self, instantanea: InstantaneaBase, filtro: str,
+                                despues_de: Optional[CursorRecetas], limite: int,
+                                duracion_maxima: Optional[int]) -> List[Dict]:
+        """
+        Página de 'base' o 'todas' con las recetas base servidas desde memoria
+
+        Para 'todas' se pide a la base de datos solo la página de recetas de
+        usuario y se mezcla con la de recetas base en el mismo orden
+        (nombre, es_base, id) que usa el UNION ALL de listar_recetas.
+        """
+        base = instantanea.listar(despues_de, limite, duracion_maxima)
+        if filtro == 'base':
+            return base
+
+        usuario = self._db.listar_recetas('usuario', despues_de, limite, duracion_maxima)
+        return sorted(
+            base + usuario, key=lambda fila: (fila['nombre'], fila['es_base'], fila['id'])
+        )[:limite]
+
+    def contar_recetas(self, filtro: str = 'todas', duracion_maxima: Optional[int] = None) -> int:
+        """
+        Cuenta las recetas de un filtro sin cargarlas
+
+        Args:
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            duracion_maxima: Solo recetas de como mucho estos segundos (None = todas)
+
+        Returns:
+            Número de recetas
+        """
+        instantanea = instantanea_base()
+        if instantanea is None or filtro in ('usuario', 'favoritas'):
+            return self._db.contar_recetas(filtro, duracion_maxima)
+
+        total = instantanea.contar(duracion_maxima)
+        if filtro == 'todas':
+            total += self._db.contar_recetas('usuario', duracion_maxima)
+        return total
+
+    # ========== BÚSQUEDA ==========
+
+    def buscar_recetas(self, texto: str, filtro: str = 'todas',
+                       limite: int = 50, desplazamiento: int = 0,
+                       duracion_maxima: Optional[int] = None) -> List[ResumenReceta]:
+        """
+        Busca recetas por nombre, descripción, ingredientes y procesos
+
+        Usa el índice FTS5 (recetas_fts): los resultados se ordenan por
+        relevancia (bm25, con más peso en el nombre) y cada palabra se
+        busca como prefijo ("tom" encuentra "Tomate").
+
+        Args:
+            texto: Texto introducido por el usuario
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            limite: Tamaño de la página de resultados
+            desplazamiento: Resultados a saltar
+            duracion_maxima: Solo recetas de como mucho estos segundos (None = todas)
+
+        Returns:
+            Resúmenes de la página pedida (vacía si el texto no tiene palabras)
+        """
+        consulta = self._consulta_fts(texto)
+        if consulta is None:
+            return []
+
+        coincidencias = self._db.buscar_recetas(
+            consulta, filtro, limite, desplazamiento, duracion_maxima
+        )
+        ids_base = [c['id'] for c in coincidencias if c['es_base']]
+        ids_usuario = [c['id'] for c in coincidencias if not c['es_base']]
+        instantanea = instantanea_base()
+        if instantanea is not None:
+            filas = self._db.obtener_resumenes_recetas([], ids_usuario)
+            filas.extend(
+                instantanea.resumen(fila)
+                for fila in map(instantanea.fila, ids_base) if fila is not None
+            )
+        else:
+            filas = self._db.obtener_resumenes_recetas(ids_base, ids_usuario)
+
+        # Devolver en el orden de relevancia de la búsqueda
+        por_clave = {(fila['es_base'], fila['id']): fila for fila in filas}
+        return [
+            self._construir_resumen(por_clave[clave])
+            for clave in ((c['es_base'], c['id']) for c in coincidencias)
+            if clave in por_clave
+        ]
+
+    def contar_resultados_busqueda(self, texto: str, filtro: str = 'todas',
+                                   duracion_maxima: Optional[int] = None) -> int:
+        """
+        Cuenta las recetas que coinciden con una búsqueda
+
+        Args:
+            texto: Texto introducido por el usuario
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            duracion_maxima: Solo recetas de como mucho estos segundos (None = todas)
+
+        Returns:
+            Número total de resultados
+        """
+        consulta = self._consulta_fts(texto)
+        if consulta is None:
+            return 0
+        return self._db.contar_busqueda_recetas(consulta, filtro, duracion_maxima)
+
+    @staticmethod
+    def _consulta_fts(texto: str) -> Optional[str]:
+        """
+        Convierte el texto del usuario en una expresión MATCH segura
+
+        Cada palabra se entrecomilla (así no se interpretan operadores de
+        FTS5) y se busca como prefijo. Todas las palabras deben aparecer.
+        """
+        palabras = re.findall(r'\w+', texto or '')
+        if not palabras:
+            return None
+        return ' '.join(f'"{palabra}"*' for palabra in palabras)
+
     # ========== CREACIÓN DE RECETAS ==========
     
     def crear_receta_usuario(self, nombre: str, descripcion: str = "") -> Receta:
@@ -127,6 +323,7 @@ class RecetasController:
             descripcion=descripcion,
             es_base=False
         )
+        cache_catalogo.agregar_usuario(receta)
 
         return receta
     
@@ -147,17 +344,63 @@ class RecetasController:
         Raises:
             ValueError: Si el tipo de proceso no existe
         """
-        # Verificar si es un proceso básico o personalizado
-        if tipo_proceso not in PROCESOS_DISPONIBLES and tipo_proceso not in _procesos_personalizados_cache:
-            raise ValueError(f"Tipo de proceso '{tipo_proceso}' no válido")
+        self._validar_tipo_proceso(tipo_proceso)
 
-        # Obtener el siguiente orden
-        procesos = self._db.obtener_procesos_receta_usuario(receta_id)
-        orden = len(procesos) + 1
+        # Obtener el siguiente orden (MAX sobre el índice, sin cargar los procesos)
+        orden = self._db.obtener_siguiente_orden_proceso_usuario(receta_id)
 
-        return self._db.insertar_proceso_usuario(
+        proceso_id = self._db.insertar_proceso_usuario(
             receta_id, tipo_proceso, parametros, orden, duracion
         )
+        cache_catalogo.invalidar_usuario()
+
+        return proceso_id
+
+    def guardar_receta_completa(self, nombre: str, descripcion: str,
+                                ingredientes: List[Dict], procesos: List[Dict]) -> Receta:
+        """
+        Guarda una receta de usuario completa (datos, ingredientes y procesos)
+        en una sola transacción
+
+        Si algo falla no queda nada guardado.
+
+        Args:
+            nombre: Nombre de la receta
+            descripcion: Descripción
+            ingredientes: Lista de dicts con 'nombre', 'cantidad' y 'unidad'
+            procesos: Lista de dicts con 'tipo', 'parametros' y 'duracion'
+
+        Returns:
+            Receta creada con sus procesos cargados
+
+        Raises:
+            ValueError: Si algún tipo de proceso no existe (antes de escribir nada)
+        """
+        for proceso in procesos:
+            self._validar_tipo_proceso(proceso['tipo'])
+
+        filas_procesos = [
+            (p['tipo'], p.get('parametros', ''), p['duracion']) for p in procesos
+        ]
+        receta_id = self._db.insertar_receta_usuario_completa(
+            nombre,
+            descripcion,
+            [(i['nombre'], i['cantidad'], i['unidad']) for i in ingredientes],
+            filas_procesos
+        )
+
+        receta = Receta(
+            id=receta_id,
+            nombre=nombre,
+            descripcion=descripcion,
+            es_base=False
+        )
+        receta.cargar_procesos_desde_db([
+            {'tipo_proceso': t, 'parametros': p, 'duracion': d} for t, p, d in filas_procesos
+        ])
+        cache_catalogo.agregar_usuario(receta)
+
+        return receta
 
     def agregar_ingrediente(self, receta_id: int, nombre: str,
                            cantidad: float, unidad: str, orden: int) -> int:
@@ -174,15 +417,7 @@ class RecetasController:
         Returns:
             ID del ingrediente creado
         """
-        resultado = self._db.ejecutar_comando(
-            """
-            INSERT INTO ingredientes (receta_id, nombre, cantidad, unidad, orden, es_base)
-            VALUES (?, ?, ?, ?, ?, 0)
-            """,
-            (receta_id, nombre, cantidad, unidad, orden)
-        )
-
-        return resultado
+        return self._db.insertar_ingrediente_usuario(receta_id, nombre, cantidad, unidad, orden)
 
     # ========== FAVORITOS (NUEVO v2.0) ==========
 
@@ -205,24 +440,17 @@ class RecetasController:
             raise ValueError("No se pueden marcar recetas preinstaladas como favoritas")
 
         # Obtener estado actual
-        resultado = self._db.ejecutar_query(
-            "SELECT favorito FROM recetas_usuario WHERE id = ?",
-            (receta_id,)
-        )
+        favorito = self._db.obtener_favorito_receta_usuario(receta_id)
 
-        if not resultado:
+        if favorito is None:
             raise RecetaNoEncontradaException(f"Receta {receta_id} no encontrada")
 
-        # Alternar estado
-        nuevo_estado = 0 if resultado[0]['favorito'] else 1
-
-        # Actualizar en BD
-        self._db.ejecutar_comando(
-            "UPDATE recetas_usuario SET favorito = ? WHERE id = ?",
-            (nuevo_estado, receta_id)
-        )
+        # Alternar estado y actualizar en BD
+        nuevo_estado = not favorito
+        self._db.actualizar_favorito_receta_usuario(receta_id, nuevo_estado)
+        cache_catalogo.actualizar_favorito(receta_id, nuevo_estado)
 
-        return bool(nuevo_estado)
+        return nuevo_estado
 
     def obtener_recetas_favoritas(self) -> List[Receta]:
         """
@@ -231,27 +459,7 @@ class RecetasController:
         Returns:
             Lista de recetas favoritas
         """
-        recetas_data = self._db.ejecutar_query(
-            "SELECT * FROM recetas_usuario WHERE favorito = 1 ORDER BY nombre"
-        )
-
-        recetas = []
-        for r_data in recetas_data:
-            receta = Receta(
-                id=r_data['id'],
-                nombre=r_data['nombre'],
-                descripcion=r_data.get('descripcion', ''),
-                es_base=False
-            )
-            receta.favorito = True
-
-            # Cargar procesos
-            procesos_data = self._db.obtener_procesos_receta_usuario(r_data['id'])
-            receta.cargar_procesos_desde_db(procesos_data)
-
-            recetas.append(receta)
-
-        return recetas
+        return [receta for receta in self.obtener_recetas_usuario() if receta.favorito]
 
     # ========== ELIMINACIÓN ==========
 
@@ -261,7 +469,282 @@ class RecetasController:
         (mantiene las recetas base)
         """
         self._db.eliminar_recetas_usuario()
+        cache_catalogo.vaciar_usuario()
+
+    # ========== EXPORTACIÓN E IMPORTACIÓN (JSONL) ==========
+
+    def exportar_catalogo(self, destino: TextIO) -> Dict[str, Any]:
+        """
+        Escribe las recetas de usuario en formato JSONL, una receta por línea
+
+        Formato de cada línea (los procesos usan el mismo formato que el
+        fichero de semillas de init_db):
+            {"nombre": "...", "descripcion": "...", "favorito": false,
+             "ingredientes": [{"nombre": "...", "cantidad": 200.0, "unidad": "g"}, ...],
+             "procesos": [{"tipo": "Picar", "parametros": "...", "duracion": 5}, ...]}
+
+        Las recetas se leen en streaming (ver DatabaseManager.iterar_catalogo_usuario):
+        la memoria no depende del tamaño del catálogo.
+
+        Args:
+            destino: Fichero de texto abierto para escritura
+
+        Returns:
+            Informe con recetas, ingredientes, procesos, filas, segundos y filas_por_segundo
+        """
+        inicio = time.perf_counter()
+        recetas = ingredientes_total = procesos_total = 0
+
+        for nombre, descripcion, favorito, ingredientes, procesos in self._db.iterar_catalogo_usuario():
+            destino.write(json.dumps({
+                'nombre': nombre,
+                'descripcion': descripcion,
+                'favorito': favorito,
+                'ingredientes': [
+                    {'nombre': n, 'cantidad': c, 'unidad': u} for n, c, u in ingredientes
+                ],
+                'procesos': [
+                    {'tipo': t, 'parametros': p, 'duracion': d} for t, p, d in procesos
+                ],
+            }, ensure_ascii=False))
+            destino.write('\n')
+            recetas += 1
+            ingredientes_total += len(ingredientes)
+            procesos_total += len(procesos)
+
+        return self._informe_transferencia(inicio, recetas, ingredientes_total, procesos_total)
+
+    def importar_catalogo(self, origen: Iterable[str],
+                          tamano_lote: int = TAMANO_LOTE_IMPORTACION) -> Dict[str, Any]:
+        """
+        Importa recetas de usuario desde líneas JSONL (formato de exportar_catalogo)
+
+        Las líneas se leen por lotes: cada lote se valida y se inserta en una
+        transacción, así que la memoria queda acotada por el tamaño del lote.
+        Las líneas inválidas (JSON mal formado, campos que faltan, tipos de
+        proceso que no son básicos ni personalizados) se omiten y se anotan
+        en el informe; las recetas con un nombre que ya existe también se
+        omiten para que repetir una importación no duplique el catálogo.
+
+        Los procesos personalizados deben estar cargados en el registro
+        (cargar_procesos_personalizados_desde_bd) antes de importar.
+
+        Args:
+            origen: Líneas del fichero JSONL (p. ej. el propio fichero abierto)
+            tamano_lote: Líneas por transacción
+
+        Returns:
+            Informe de exportar_catalogo más 'omitidas' (nombre repetido),
+            'invalidas' y 'errores' (primeras líneas inválidas: [(número, motivo)])
+        """
+        inicio = time.perf_counter()
+        lineas = enumerate(origen, start=1)
+        leidas = recetas = ingredientes = procesos = invalidas = 0
+        errores: List[Tuple[int, str]] = []
+
+        while True:
+            bloque = list(islice(lineas, tamano_lote))
+            if not bloque:
+                break
+
+            lote: List[RecetaCompleta] = []
+            for numero, linea in bloque:
+                if not linea.strip():
+                    continue
+                leidas += 1
+                try:
+                    lote.append(self._receta_desde_json(linea))
+                except ValueError as e:
+                    invalidas += 1
+                    if len(errores) < MAX_ERRORES_INFORME:
+                        errores.append((numero, str(e)))
+
+            if lote:
+                r, i, p = self._db.insertar_lote_recetas_usuario(lote)
+                recetas += r
+                ingredientes += i
+                procesos += p
+
+        if recetas:
+            cache_catalogo.invalidar_usuario()
+
+        informe = self._informe_transferencia(inicio, recetas, ingredientes, procesos)
+        informe['omitidas'] = leidas - invalidas - recetas
+        informe['invalidas'] = invalidas
+        informe['errores'] = errores
+        return informe
+
+    @classmethod
+    def _receta_desde_json(cls, linea: str) -> RecetaCompleta:
+        """
+        Convierte y valida una línea JSONL del catálogo
+
+        Raises:
+            ValueError: Si la línea no es una receta válida
+        """
+        try:
+            datos = json.loads(linea)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e.msg}") from None
+        if not isinstance(datos, dict):
+            raise ValueError("La línea no es un objeto JSON")
+
+        nombre = datos.get('nombre')
+        if not isinstance(nombre, str) or not nombre.strip():
+            raise ValueError("Falta el nombre de la receta")
+        descripcion = datos.get('descripcion') or ''
+        if not isinstance(descripcion, str):
+            raise ValueError("La descripción debe ser texto")
+
+        ingredientes = [cls._ingrediente_desde_json(i) for i in cls._lista_json(datos, 'ingredientes')]
+        procesos = [cls._proceso_desde_json(p) for p in cls._lista_json(datos, 'procesos')]
+
+        for tipo, _, duracion in procesos:
+            cls._validar_tipo_proceso(tipo)
+            if duracion <= 0:
+                raise ValueError(f"Duración no válida en el proceso '{tipo}': {duracion}")
+
+        return nombre, descripcion, bool(datos.get('favorito', False)), ingredientes, procesos
+
+    # Los valores que llegan a la base de datos se comprueban aquí: un error
+    # de SQLite dentro del lote desharía también las líneas válidas del lote
+
+    @staticmethod
+    def _lista_json(datos: dict, clave: str) -> List[dict]:
+        """Lista de objetos de la clave indicada (vacía si no está)"""
+        valor = datos.get(clave) or []
+        if not isinstance(valor, list) or not all(isinstance(v, dict) for v in valor):
+            raise ValueError(f"'{clave}' debe ser una lista de objetos")
+        return valor
+
+    @staticmethod
+    def _texto_json(valor: Any, campo: str, obligatorio: bool = False) -> str:
+        """Texto de un campo ('' si falta y no es obligatorio)"""
+        if valor is None and not obligatorio:
+            return ''
+        if not isinstance(valor, str) or (obligatorio and not valor.strip()):
+            raise ValueError(f"'{campo}' debe ser un texto{' no vacío' if obligatorio else ''}")
+        return valor
+
+    @staticmethod
+    def _numero_json(valor: Any, campo: str) -> float:
+        """Valor numérico finito de un campo (bool no cuenta como número)"""
+        if (isinstance(valor, bool) or not isinstance(valor, (int, float))
+                or not math.isfinite(valor)):
+            raise ValueError(f"'{campo}' debe ser un número")
+        return valor
+
+    @classmethod
+    def _ingrediente_desde_json(cls, datos: dict) -> Tuple[str, Optional[float], str]:
+        """(nombre, cantidad, unidad) de un ingrediente del JSONL"""
+        cantidad = datos.get('cantidad')
+        return (
+            cls._texto_json(datos.get('nombre'), 'nombre del ingrediente', obligatorio=True),
+            None if cantidad is None else float(cls._numero_json(cantidad, 'cantidad')),
+            cls._texto_json(datos.get('unidad'), 'unidad'),
+        )
+
+    @classmethod
+    def _proceso_desde_json(cls, datos: dict) -> Tuple[str, str, int]:
+        """(tipo, parametros, duracion) de un proceso del JSONL"""
+        return (
+            cls._texto_json(datos.get('tipo'), 'tipo del proceso', obligatorio=True),
+            cls._texto_json(datos.get('parametros'), 'parametros'),
+            int(cls._numero_json(datos.get('duracion'), 'duracion')),
+        )
+
+    @staticmethod
+    def _informe_transferencia(inicio: float, recetas: int,
+                               ingredientes: int, procesos: int) -> Dict[str, Any]:
+        """Informe común de exportación/importación con el ritmo en filas por segundo"""
+        segundos = time.perf_counter() - inicio
+        filas = recetas + ingredientes + procesos
+        return {
+            'recetas': recetas,
+            'ingredientes': ingredientes,
+            'procesos': procesos,
+            'filas': filas,
+            'segundos': segundos,
+            'filas_por_segundo': filas / segundos if segundos > 0 else 0.0,
+        }
+
+    # ========== CACHÉ ==========
+
+    @staticmethod
+    def estadisticas_cache() -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché del catálogo
+
+        Returns:
+            Diccionario con aciertos, fallos e invalidaciones
+        """
+        return cache_catalogo.estadisticas()
+
+    @staticmethod
+    def invalidar_cache():
+        """Descarta el catálogo cacheado (ej: al cambiar los procesos personalizados)"""
+        cache_catalogo.invalidar_todo()
     
+    # ========== CONSTRUCCIÓN DE RECETAS ==========
+
+    @staticmethod
+    def _validar_tipo_proceso(tipo_proceso: str):
+        """
+        Verifica que el tipo de proceso sea básico o personalizado
+
+        Raises:
+            ValueError: Si el tipo de proceso no existe
+        """
+        if tipo_proceso not in PROCESOS_DISPONIBLES and tipo_proceso not in _procesos_personalizados_cache:
+            raise ValueError(f"Tipo de proceso '{tipo_proceso}' no válido")
+
+    @classmethod
+    def _receta_desde_instantanea(cls, instantanea: InstantaneaBase, fila: FilaBase) -> Receta:
+        """Construye una receta base (con sus procesos) a partir de la instantánea"""
+        receta = Receta(fila.id, fila.nombre, fila.descripcion, True)
+        procesos = (
+            cls._fila_proceso(None, (fila.id, tipo, parametros, duracion))[1]
+            for tipo, parametros, duracion in instantanea.procesos(fila.id)
+        )
+        receta.establecer_procesos([proceso for proceso in procesos if proceso is not None])
+        return receta
+
+    @staticmethod
+    def _fila_receta(cursor, fila: tuple) -> Receta:
+        """Fábrica de filas: (id, nombre, descripcion, es_base, favorito) -> Receta"""
+        receta_id, nombre, descripcion, es_base, favorito = fila
+        return Receta(receta_id, nombre, descripcion, bool(es_base), bool(favorito))
+
+    @staticmethod
+    def _fila_proceso(cursor, fila: tuple) -> Tuple[int, Optional[ProcesoCocina]]:
+        """
+        Fábrica de filas: (receta_id, tipo, parametros, duracion) -> (receta_id, proceso)
+
+        El proceso es None si su tipo ya no existe (se omite, como en
+        Receta.cargar_procesos_desde_db).
+        """
+        receta_id, tipo, parametros, duracion = fila
+        try:
+            return receta_id, crear_proceso(tipo, parametros or '', duracion)
+        except ValueError as e:
+            print(f"⚠️ Error cargando proceso: {e}")
+            return receta_id, None
+
+    @staticmethod
+    def _construir_resumen(fila: Dict) -> ResumenReceta:
+        """Crea un ResumenReceta a partir de una fila de resumen"""
+        tipos = fila['tipos_procesos']
+        return ResumenReceta(
+            id=fila['id'],
+            nombre=fila['nombre'],
+            descripcion=fila['descripcion'],
+            es_base=bool(fila['es_base']),
+            favorito=bool(fila['favorito']),
+            num_pasos=fila['num_pasos'],
+            duracion_total=fila['duracion_total'],
+            tipos_procesos=tuple(tipos.split(',')) if tipos else ()
+        )
+
     # ========== UTILIDADES ==========
     
     def obtener_tipos_procesos_disponibles(self) -> List[str]:
@@ -278,19 +761,38 @@ class RecetasController:
     def obtener_info_receta(self, receta: Receta) -> dict:
         """
         Obtiene información detallada de una receta
-        
+
+        El número de pasos y la duración total son los de las columnas
+        guardadas (los mismos que muestran las tarjetas); solo se calculan
+        con los procesos si la receta no está en la base de datos.
+
         Args:
             receta: Receta a analizar
-        
+
         Returns:
             Diccionario con información
         """
+        num_pasos, duracion_total = self._totales_guardados(receta)
         return {
             'id': receta.id,
             'nombre': receta.nombre,
             'descripcion': receta.descripcion,
             'tipo': 'BASE' if receta.es_base else 'USUARIO',
-            'num_pasos': receta.get_num_pasos(),
-            'duracion_total': receta.get_duracion_total(),
+            'num_pasos': num_pasos,
+            'duracion_total': duracion_total,
             'procesos': [p.get_descripcion() for p in receta.procesos]
-        }
\ No newline at end of file
+        }
+
+    def _totales_guardados(self, receta: Receta) -> Tuple[int, int]:
+        """(num_pasos, duracion_total) de la receta según sus columnas guardadas"""
+        instantanea = instantanea_base() if receta.es_base else None
+        if instantanea is not None:
+            fila = instantanea.fila(receta.id)
+            if fila is not None:
+                return fila.num_pasos, fila.duracion_total
+        else:
+            fila = (self._db.obtener_receta_base(receta.id) if receta.es_base
+                    else self._db.obtener_receta_usuario(receta.id))
+            if fila is not None:
+                return fila['num_pasos'], fila['duracion_total']
+        return receta.get_num_pasos(), receta.get_duracion_total()
\ No newline at end of file
@@ -2,6 +2,7 @@
 Controlador del Robot de Cocina
 Capa intermedia entre la UI y el modelo del robot
 """
+import asyncio
 from models.robot import RobotCocina
 from models.receta import Receta
 from models.proceso import ProcesoCocina
@@ -21,6 +22,7 @@ class RobotController:
         """Inicializa el controlador con un robot y gestor de hilos"""
         self._robot = RobotCocina()
         self._thread_manager = ThreadingManager()
+        self._tarea: Optional[asyncio.Task] = None  # Ejecución en el bucle de asyncio
     
     # ========== DELEGACIÓN AL ROBOT ==========
     
@@ -51,6 +53,10 @@ class RobotController:
         """Verifica si el robot está ejecutando"""
         return self._robot.esta_ejecutando
     
+    def esta_inactivo(self) -> bool:
+        """Verifica que no haya ningún proceso ni receta en ejecución"""
+        return not self._robot.esta_ejecutando and not self.hay_ejecucion_activa()
+
     @property
     def robot(self):
         """Expone el robot interno para acceso directo"""
@@ -161,9 +167,76 @@ class RobotController:
         
         self._thread_manager.ejecutar_en_hilo(wrapper)
     
+    # ========== EJECUCIÓN EN EL BUCLE DE ASYNCIO ==========
+
+    async def ejecutar_proceso_en_bucle(self, proceso: ProcesoCocina) -> bool:
+        """
+        Ejecuta un proceso individual como tarea del bucle de asyncio
+
+        No crea ningún hilo: se espera con await desde el bucle de NiceGUI.
+
+        Returns:
+            True si se completó, False si fue detenido, falló o ya había
+            otra ejecución en curso
+        """
+        return await self._ejecutar_en_bucle(self._robot.ejecutar_proceso_async, proceso)
+
+    async def ejecutar_receta_en_bucle(self, receta: Receta) -> bool:
+        """
+        Ejecuta una receta como tarea del bucle de asyncio
+
+        No crea ningún hilo: se espera con await desde el bucle de NiceGUI.
+
+        Returns:
+            True si se completó, False si fue detenida, falló o ya había
+            otra ejecución en curso
+        """
+        return await self._ejecutar_en_bucle(self._robot.ejecutar_receta_async, receta)
+
+    async def _ejecutar_en_bucle(self, ejecutar: Callable, objetivo) -> bool:
+        """Espera la ejecución registrando la tarea y tratando los errores como los hilos"""
+        # Sin await entre la comprobación y el registro: dos tareas del mismo
+        # bucle no pueden colarse a la vez
+        if self.hay_ejecucion_activa():
+            print("⚠️ Ya hay una ejecución en curso")
+            return False
+
+        tarea = asyncio.current_task()
+        self._tarea = tarea
+        try:
+            return await ejecutar(objetivo)
+        except RobotApagadoException as e:
+            print(f"⚠️ Robot apagado: {e}")
+        except ProcesoInvalidoException as e:
+            print(f"⚠️ Proceso inválido: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ Error inesperado: {e}")
+        finally:
+            if self._tarea is tarea:
+                self._tarea = None
+        return False
+
+    def cancelar_ejecucion_en_bucle(self) -> bool:
+        """
+        Cancela la ejecución en curso en el bucle de asyncio
+
+        Detiene el proceso o la receta y la tarea que la esperaba recibe
+        CancelledError. Se puede llamar desde cualquier hilo.
+
+        Returns:
+            True si había una tarea que cancelar
+        """
+        tarea = self._tarea
+        if tarea is None or tarea.done():
+            return False
+        tarea.get_loop().call_soon_threadsafe(tarea.cancel)
+        return True
+
     def hay_ejecucion_activa(self) -> bool:
-        """Verifica si hay una ejecución en curso"""
-        return self._thread_manager.hay_hilo_activo()
+        """Verifica si hay una ejecución en curso (en un hilo o en el bucle de asyncio)"""
+        return self._tarea is not None or self._thread_manager.hay_hilo_activo()
     
     def obtener_info(self) -> dict:
         """Obtiene información del estado del robot"""
@@ -0,0 +1,312 @@
+"""
+Registro central de consultas SQL con nombre
+Guarda el SQL normalizado de las operaciones frecuentes y mide sus tiempos
+"""
+import re
+import threading
+from typing import Callable, Dict, Hashable, List, Tuple
+
+_ESPACIOS = re.compile(r'\s+')
+
+
+def normalizar_sql(sql: str) -> str:
+    """
+    Normaliza el texto de una consulta (espacios y saltos de línea)
+
+    Los literales con espacios significativos deben pasarse como
+    parámetros: también se colapsarían.
+    """
+    return _ESPACIOS.sub(' ', sql).strip()
+
+
+class RegistroConsultas:
+    """
+    Registro de consultas con nombre
+
+    sqlite3 guarda en cada conexión las sentencias ya compiladas, indexadas
+    por el texto exacto del SQL. Si dos sitios escriben la misma consulta con
+    distinto sangrado, o una consulta se reconstruye en cada llamada, SQLite
+    la vuelve a analizar y planificar. El registro da a cada consulta un
+    nombre y un único texto normalizado, así que todas las llamadas
+    reutilizan la misma sentencia preparada.
+
+    Las consultas cuyo texto depende de opciones (filtro, cursor...) se
+    guardan como variantes: se construyen una vez por clave y se reutilizan.
+
+    Además acumula por nombre el número de ejecuciones y su tiempo.
+    """
+
+    def __init__(self):
+        """Inicializa el registro vacío"""
+        self._lock = threading.Lock()
+        self._consultas: Dict[str, str] = {}
+        self._variantes: Dict[Tuple[str, Hashable], str] = {}
+        self._tiempos: Dict[str, List[float]] = {}  # nombre -> [llamadas, total, máximo]
+
+    # ========== REGISTRO ==========
+
+    def registrar(self, nombre: str, sql: str) -> str:
+        """
+        Registra una consulta con nombre
+
+        Args:
+            nombre: Nombre único de la consulta
+            sql: Texto SQL (se normaliza)
+
+        Returns:
+            SQL normalizado
+
+        Raises:
+            ValueError: Si el nombre ya está registrado con otro SQL
+        """
+        normalizado = normalizar_sql(sql)
+        with self._lock:
+            previo = self._consultas.get(nombre)
+            if previo is not None and previo != normalizado:
+                raise ValueError(f"La consulta '{nombre}' ya está registrada con otro SQL")
+            self._consultas[nombre] = normalizado
+        return normalizado
+
+    def sql(self, nombre: str) -> str:
+        """
+        Obtiene el SQL normalizado de una consulta registrada
+
+        Raises:
+            KeyError: Si la consulta no está registrada
+        """
+        try:
+            return self._consultas[nombre]
+        except KeyError:
+            raise KeyError(f"Consulta no registrada: '{nombre}'") from None
+
+    def variante(self, nombre: str, clave: Hashable, construir: Callable[[], str]) -> str:
+        """
+        Obtiene el SQL de una variante de consulta, construyéndolo la primera vez
+
+        Args:
+            nombre: Nombre de la familia de consultas (ej: 'listar_recetas')
+            clave: Opciones de las que depende el texto del SQL
+            construir: Función que genera el SQL de esa variante
+
+        Returns:
+            SQL normalizado (siempre la misma cadena para la misma clave)
+        """
+        sql = self._variantes.get((nombre, clave))
+        if sql is None:
+            sql = normalizar_sql(construir())
+            with self._lock:
+                sql = self._variantes.setdefault((nombre, clave), sql)
+        return sql
+
+    def nombres(self) -> List[str]:
+        """Nombres de las consultas registradas"""
+        with self._lock:
+            return sorted(self._consultas)
+
+    # ========== ESTADÍSTICAS ==========
+
+    def medir(self, nombre: str, segundos: float):
+        """Acumula el tiempo de una ejecución de la consulta"""
+        with self._lock:
+            tiempos = self._tiempos.get(nombre)
+            if tiempos is None:
+                self._tiempos[nombre] = [1, segundos, segundos]
+            else:
+                tiempos[0] += 1
+                tiempos[1] += segundos
+                if segundos > tiempos[2]:
+                    tiempos[2] = segundos
+
+    def estadisticas(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtiene los tiempos acumulados por consulta
+
+        Returns:
+            Diccionario nombre -> {'llamadas', 'total_ms', 'media_ms', 'max_ms'},
+            de mayor a menor tiempo total
+        """
+        with self._lock:
+            copia = {nombre: list(t) for nombre, t in self._tiempos.items()}
+
+        return {
+            nombre: {
+                'llamadas': int(llamadas),
+                'total_ms': total * 1000,
+                'media_ms': total * 1000 / llamadas,
+                'max_ms': maximo * 1000,
+            }
+            for nombre, (llamadas, total, maximo) in sorted(
+                copia.items(), key=lambda item: item[1][1], reverse=True
+            )
+        }
+
+    def reiniciar_estadisticas(self):
+        """Pone a cero los tiempos acumulados"""
+        with self._lock:
+            self._tiempos = {}
+
+
+# ========== CONSULTAS DE LA APLICACIÓN ==========
+
+CONSULTAS: Dict[str, str] = {
+    # Recetas
+    'recetas_base': "SELECT * FROM recetas_base ORDER BY nombre",
+    'recetas_usuario': "SELECT * FROM recetas_usuario ORDER BY nombre",
+    'receta_base_por_id': "SELECT * FROM recetas_base WHERE id = ?",
+    'receta_usuario_por_id': "SELECT * FROM recetas_usuario WHERE id = ?",
+    'hay_recetas_base': "SELECT 1 FROM recetas_base LIMIT 1",
+    'favorito_receta_usuario': "SELECT favorito FROM recetas_usuario WHERE id = ?",
+    'actualizar_favorito_receta_usuario': "UPDATE recetas_usuario SET favorito = ? WHERE id = ?",
+    'insertar_receta_usuario': "INSERT INTO recetas_usuario (nombre, descripcion) VALUES (?, ?)",
+    'eliminar_recetas_usuario': "DELETE FROM recetas_usuario",
+
+    # Procesos de recetas
+    'procesos_receta_base': "SELECT * FROM procesos_base WHERE receta_id = ? ORDER BY orden",
+    'procesos_receta_usuario': "SELECT * FROM procesos_usuario WHERE receta_id = ? ORDER BY orden",
+    'procesos_base': "SELECT * FROM procesos_base ORDER BY receta_id, orden",
+    'procesos_usuario': "SELECT * FROM procesos_usuario ORDER BY receta_id, orden",
+    'procesos_usuario_favoritas': """
+        SELECT p.* FROM procesos_usuario p
+        JOIN recetas_usuario r ON r.id = p.receta_id
+        WHERE r.favorito = 1
+        ORDER BY p.receta_id, p.orden
+    """,
+    'insertar_proceso_usuario': """
+        INSERT INTO procesos_usuario (receta_id, tipo_proceso, parametros, orden, duracion)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    'siguiente_orden_proceso_usuario': """
+        SELECT COALESCE(MAX(orden), 0) + 1 AS siguiente
+        FROM procesos_usuario WHERE receta_id = ?
+    """,
+    'eliminar_procesos_usuario': "DELETE FROM procesos_usuario",
+
+    # Carga en streaming de los modelos (columnas en el orden de sus constructores)
+    'modelo_recetas_base': """
+        SELECT id, nombre, COALESCE(descripcion, ''), 1, 0 FROM recetas_base ORDER BY nombre
+    """,
+    'modelo_recetas_usuario': """
+        SELECT id, nombre, COALESCE(descripcion, ''), 0, COALESCE(favorito, 0)
+        FROM recetas_usuario ORDER BY nombre
+    """,
+    'modelo_receta_base_por_id': """
+        SELECT id, nombre, COALESCE(descripcion, ''), 1, 0 FROM recetas_base WHERE id = ?
+    """,
+    'modelo_receta_usuario_por_id': """
+        SELECT id, nombre, COALESCE(descripcion, ''), 0, COALESCE(favorito, 0)
+        FROM recetas_usuario WHERE id = ?
+    """,
+    'instantanea_recetas_base': """
+        SELECT id, nombre, COALESCE(descripcion, ''), num_pasos, duracion_total
+        FROM recetas_base ORDER BY nombre, id
+    """,
+    'modelo_procesos_base': """
+        SELECT receta_id, tipo_proceso, parametros, duracion FROM procesos_base
+        ORDER BY receta_id, orden
+    """,
+    'modelo_procesos_usuario': """
+        SELECT receta_id, tipo_proceso, parametros, duracion FROM procesos_usuario
+        ORDER BY receta_id, orden
+    """,
+    'modelo_procesos_receta_base': """
+        SELECT receta_id, tipo_proceso, parametros, duracion FROM procesos_base
+        WHERE receta_id = ? ORDER BY orden
+    """,
+    'modelo_procesos_receta_usuario': """
+        SELECT receta_id, tipo_proceso, parametros, duracion FROM procesos_usuario
+        WHERE receta_id = ? ORDER BY orden
+    """,
+
+    # Ingredientes
+    'insertar_ingrediente_usuario': """
+        INSERT INTO ingredientes (receta_id, nombre, cantidad, unidad, orden, es_base)
+        VALUES (?, ?, ?, ?, ?, 0)
+    """,
+    'eliminar_ingredientes_usuario': "DELETE FROM ingredientes WHERE es_base = 0",
+
+    # Carga de recetas base (init_db)
+    'nombres_recetas_base_existentes': """
+        SELECT nombre FROM recetas_base WHERE nombre IN (SELECT value FROM json_each(?))
+    """,
+    'siguiente_id_receta_base': """
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'recetas_base'), 0),
+            COALESCE((SELECT MAX(id) FROM recetas_base), 0)
+        ) + 1
+    """,
+    'insertar_proceso_base': """
+        INSERT INTO procesos_base (receta_id, tipo_proceso, parametros, orden, duracion)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    'insertar_receta_base': """
+        INSERT INTO recetas_base (id, nombre, descripcion, num_pasos, duracion_total)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+
+    # Exportación e importación del catálogo de usuario (catalogo.py).
+    # Las tres lecturas van ordenadas por receta para emparejarlas en streaming
+    'exportar_recetas_usuario': """
+        SELECT id, nombre, COALESCE(descripcion, ''), COALESCE(favorito, 0)
+        FROM recetas_usuario ORDER BY id
+    """,
+    'exportar_procesos_usuario': """
+        SELECT receta_id, tipo_proceso, COALESCE(parametros, ''), duracion FROM procesos_usuario
+        ORDER BY receta_id, orden
+    """,
+    'exportar_ingredientes_usuario': """
+        SELECT receta_id, nombre, cantidad, unidad FROM ingredientes
+        WHERE es_base = 0 ORDER BY receta_id, orden
+    """,
+    'nombres_recetas_usuario_existentes': """
+        SELECT nombre FROM recetas_usuario WHERE nombre IN (SELECT value FROM json_each(?))
+    """,
+    'siguiente_id_receta_usuario': """
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'recetas_usuario'), 0),
+            COALESCE((SELECT MAX(id) FROM recetas_usuario), 0)
+        ) + 1
+    """,
+    'importar_receta_usuario': """
+        INSERT INTO recetas_usuario
+        (id, nombre, descripcion, favorito, fecha_creacion, num_pasos, duracion_total)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
+    """,
+
+    # Procesos personalizados
+    'procesos_personalizados_activos': """
+        SELECT * FROM procesos_personalizados WHERE activo = 1 ORDER BY nombre
+    """,
+    'proceso_personalizado_por_nombre': """
+        SELECT * FROM procesos_personalizados WHERE nombre = ? AND activo = 1
+    """,
+    'existe_nombre_proceso_personalizado': """
+        SELECT EXISTS(SELECT 1 FROM procesos_personalizados WHERE nombre = ?) AS existe
+    """,
+    'insertar_proceso_personalizado': """
+        INSERT INTO procesos_personalizados
+        (nombre, emoji, duracion_base, parametros_defecto, descripcion)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    'actualizar_proceso_personalizado': """
+        UPDATE procesos_personalizados
+        SET nombre = ?, emoji = ?, duracion_base = ?, parametros_defecto = ?, descripcion = ?
+        WHERE id = ?
+    """,
+    'desactivar_proceso_personalizado': "UPDATE procesos_personalizados SET activo = 0 WHERE id = ?",
+    'borrar_proceso_personalizado': "DELETE FROM procesos_personalizados WHERE id = ?",
+    'purgar_procesos_personalizados_inactivos': """
+        DELETE FROM procesos_personalizados
+        WHERE activo = 0
+          AND NOT EXISTS (SELECT 1 FROM procesos_usuario p WHERE p.tipo_proceso = nombre)
+          AND NOT EXISTS (SELECT 1 FROM procesos_base p WHERE p.tipo_proceso = nombre)
+    """,
+
+    # Esquema
+    'tabla_existe': "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+}
+
+
+# Registro compartido por todas las instancias de DatabaseManager
+registro_consultas = RegistroConsultas()
+for _nombre, _sql in CONSULTAS.items():
+    registro_consultas.registrar(_nombre, _sql)
@@ -3,22 +3,45 @@ Módulo de gestión de base de datos SQLite
 """
 import sqlite3
 import os
-from typing import List, Dict, Optional
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
+from database.pool import pool_conexiones
+from database.consultas import registro_consultas
+from database.filas import FabricaFilas, fila_tupla
 
 # Ruta de la base de datos (en el directorio raíz del proyecto)
 DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'robot_cocina.db')
 
+# Receta de usuario completa para exportar/importar:
+# (nombre, descripcion, favorito, [(nombre, cantidad, unidad), ...], [(tipo, parametros, duracion), ...])
+RecetaCompleta = Tuple[str, str, bool, List[tuple], List[tuple]]
+
 class DatabaseManager:
     """Gestor de conexiones y operaciones con la base de datos"""
     
     def __init__(self):
         self.db_path = DATABASE_PATH
     
-    def get_connection(self):
-        """Obtiene una conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Obtiene la conexión persistente del hilo actual
+
+        Las conexiones se reutilizan entre llamadas a través del pool
+        compartido, por lo que no deben cerrarse tras usarlas.
+        """
+        return pool_conexiones.obtener_conexion(self.db_path)
+
+    @staticmethod
+    def configurar_pragmas(pragmas: Dict[str, object]):
+        """
+        Cambia el perfil de PRAGMAs de todas las conexiones
+
+        Args:
+            pragmas: Diccionario nombre -> valor (ver PRAGMAS_POR_DEFECTO)
+        """
+        pool_conexiones.configurar_pragmas(pragmas)
     
     def ejecutar_query(self, query: str, params: tuple = ()) -> List[Dict]:
         """Ejecuta una query SELECT y retorna resultados"""
@@ -28,6 +51,46 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def iterar_query(self, query: str, params: tuple = (),
+                     fabrica: FabricaFilas = fila_tupla) -> Iterator[Any]:
+        """
+        Recorre el resultado de un SELECT fila a fila, sin materializarlo
+
+        A diferencia de ejecutar_query no se crea la lista completa ni un
+        dict por fila: cada fila se entrega en cuanto SQLite la produce,
+        convertida por la fábrica (tupla, registro u objeto del modelo; ver
+        database/filas.py). La memoria no depende del número de filas.
+
+        El iterador debe consumirse en el mismo hilo que lo creó.
+
+        Args:
+            query: Consulta SELECT
+            params: Parámetros de la consulta
+            fabrica: Función (cursor, tupla) -> objeto entregado
+
+        Yields:
+            Un objeto por fila
+        """
+        cursor = self.get_connection().cursor()
+        cursor.row_factory = fabrica
+        try:
+            yield from cursor.execute(query, params)
+        finally:
+            cursor.close()
+
+    def iterar(self, nombre: str, params: tuple = (),
+               fabrica: FabricaFilas = fila_tupla) -> Iterator[Any]:
+        """
+        Recorre en streaming una consulta registrada (ver iterar_query)
+
+        El tiempo acumulado para `nombre` incluye el consumo del iterador.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield from self.iterar_query(registro_consultas.sql(nombre), params, fabrica)
+        finally:
+            registro_consultas.medir(nombre, time.perf_counter() - inicio)
+
     def ejecutar_comando(self, comando: str, params: tuple = ()) -> int:
         """Ejecuta un comando INSERT/UPDATE/DELETE"""
         with self.get_connection() as conn:
@@ -36,6 +99,49 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
+    def consultar(self, nombre: str, params: tuple = ()) -> List[Dict]:
+        """
+        Ejecuta una consulta registrada (database/consultas.py)
+
+        Args:
+            nombre: Nombre de la consulta en el registro
+            params: Parámetros de la consulta
+
+        Returns:
+            Filas como diccionarios
+        """
+        return self._consultar_sql(nombre, registro_consultas.sql(nombre), params)
+
+    def modificar(self, nombre: str, params: tuple = ()) -> int:
+        """
+        Ejecuta un comando registrado (INSERT/UPDATE/DELETE)
+
+        Args:
+            nombre: Nombre del comando en el registro
+            params: Parámetros del comando
+
+        Returns:
+            lastrowid del cursor
+        """
+        inicio = time.perf_counter()
+        try:
+            return self.ejecutar_comando(registro_consultas.sql(nombre), params)
+        finally:
+            registro_consultas.medir(nombre, time.perf_counter() - inicio)
+
+    @staticmethod
+    def estadisticas_consultas() -> Dict[str, Dict[str, float]]:
+        """Tiempos acumulados por consulta registrada (ver RegistroConsultas)"""
+        return registro_consultas.estadisticas()
+
+    def _consultar_sql(self, nombre: str, sql: str, params: tuple = ()) -> List[Dict]:
+        """Ejecuta un SELECT ya normalizado y acumula su tiempo bajo `nombre`"""
+        inicio = time.perf_counter()
+        try:
+            return self.ejecutar_query(sql, params)
+        finally:
+            registro_consultas.medir(nombre, time.perf_counter() - inicio)
+
     def ejecutar_script(self, script: str):
         """Ejecuta un script SQL completo"""
         with self.get_connection() as conn:
@@ -43,117 +149,557 @@ class DatabaseManager:
             cursor.executescript(script)
             conn.commit()
     
+    @contextmanager
+    def transaccion(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Abre una transacción explícita sobre la conexión del hilo
+
+        Todo lo ejecutado con el cursor se confirma con un único commit
+        al salir del bloque, o se revierte si se produce una excepción.
+
+        Yields:
+            Cursor sobre el que ejecutar las sentencias
+        """
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn.cursor()
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
     # ========== OPERACIONES DE RECETAS ==========
     
     def obtener_recetas_base(self) -> List[Dict]:
         """Obtiene todas las recetas preinstaladas"""
-        query = "SELECT * FROM recetas_base ORDER BY nombre"
-        return self.ejecutar_query(query)
+        return self.consultar('recetas_base')
     
     def obtener_recetas_usuario(self) -> List[Dict]:
         """Obtiene todas las recetas del usuario"""
-        query = "SELECT * FROM recetas_usuario ORDER BY nombre"
-        return self.ejecutar_query(query)
+        return self.consultar('recetas_usuario')
+    
+    def obtener_receta_base(self, receta_id: int) -> Optional[Dict]:
+        """Obtiene una receta preinstalada por su ID (búsqueda por clave primaria)"""
+        result = self.consultar('receta_base_por_id', (receta_id,))
+        return result[0] if result else None
+
+    def obtener_receta_usuario(self, receta_id: int) -> Optional[Dict]:
+        """Obtiene una receta de usuario por su ID (búsqueda por clave primaria)"""
+        result = self.consultar('receta_usuario_por_id', (receta_id,))
+        return result[0] if result else None
+
+    def hay_recetas_base(self) -> bool:
+        """Indica si ya hay alguna receta preinstalada"""
+        return bool(self.consultar('hay_recetas_base'))
+
+    def obtener_favorito_receta_usuario(self, receta_id: int) -> Optional[bool]:
+        """Obtiene el estado de favorito de una receta de usuario (None si no existe)"""
+        result = self.consultar('favorito_receta_usuario', (receta_id,))
+        return bool(result[0]['favorito']) if result else None
+
+    def actualizar_favorito_receta_usuario(self, receta_id: int, favorito: bool):
+        """Marca o desmarca una receta de usuario como favorita"""
+        self.modificar('actualizar_favorito_receta_usuario', (int(favorito), receta_id))
     
     def obtener_procesos_receta_base(self, receta_id: int) -> List[Dict]:
         """Obtiene los procesos de una receta base"""
-        query = """
-            SELECT * FROM procesos_base 
-            WHERE receta_id = ? 
-            ORDER BY orden
-        """
-        return self.ejecutar_query(query, (receta_id,))
+        return self.consultar('procesos_receta_base', (receta_id,))
     
     def obtener_procesos_receta_usuario(self, receta_id: int) -> List[Dict]:
         """Obtiene los procesos de una receta de usuario"""
-        query = """
-            SELECT * FROM procesos_usuario 
-            WHERE receta_id = ? 
-            ORDER BY orden
+        return self.consultar('procesos_receta_usuario', (receta_id,))
+
+    def obtener_todos_procesos_base(self) -> List[Dict]:
+        """Obtiene los procesos de todas las recetas base en una sola consulta"""
+        return self.consultar('procesos_base')
+
+    def obtener_todos_procesos_usuario(self, solo_favoritas: bool = False) -> List[Dict]:
         """
-        return self.ejecutar_query(query, (receta_id,))
-    
+        Obtiene los procesos de todas las recetas de usuario en una sola consulta
+
+        Args:
+            solo_favoritas: Si es True, solo devuelve procesos de recetas favoritas
+        """
+        return self.consultar('procesos_usuario_favoritas' if solo_favoritas else 'procesos_usuario')
+
+    # ========== LISTADO PAGINADO ==========
+
+    # Ramas del listado por filtro: (tabla, es_base, condición adicional)
+    _RAMAS_LISTADO = {
+        'todas': [('recetas_base', 1, ''), ('recetas_usuario', 0, '')],
+        'base': [('recetas_base', 1, '')],
+        'usuario': [('recetas_usuario', 0, '')],
+        'favoritas': [('recetas_usuario', 0, 'favorito = 1')],
+    }
+
+    # Tabla de procesos de cada tabla de recetas
+    _TABLA_PROCESOS = {'recetas_base': 'procesos_base', 'recetas_usuario': 'procesos_usuario'}
+
+    # Tipos de proceso que se devuelven en los resúmenes (iconos de las tarjetas)
+    TIPOS_EN_RESUMEN = 5
+
+    def _columnas_resumen(self, tabla: str, es_base: int) -> str:
+        """
+        Columnas del resumen de una receta (alias r) calculadas en SQL
+
+        num_pasos y duracion_total son columnas mantenidas por triggers; los
+        tipos de proceso se leen por el índice (receta_id, orden).
+        """
+        procesos = self._TABLA_PROCESOS[tabla]
+        favorito = "0" if es_base else "COALESCE(r.favorito, 0)"
+        return f"""
+            r.id, r.nombre, COALESCE(r.descripcion, '') AS descripcion,
+            {es_base} AS es_base, {favorito} AS favorito,
+            r.num_pasos, r.duracion_total,
+            (SELECT group_concat(tipo_proceso, ',') FROM (
+                SELECT p.tipo_proceso FROM {procesos} p WHERE p.receta_id = r.id
+                ORDER BY p.orden LIMIT {self.TIPOS_EN_RESUMEN}
+            )) AS tipos_procesos
+        """
+
+    def listar_recetas(self, filtro: str = 'todas',
+                       despues_de: Optional[Tuple[str, int, int]] = None,
+                       limite: int = 24, duracion_maxima: Optional[int] = None) -> List[Dict]:
+        """
+        Obtiene una página de recetas ordenadas por (nombre, es_base, id)
+
+        Paginación por clave (keyset): en lugar de OFFSET se continúa a
+        partir de la última fila de la página anterior, así que cada página
+        cuesta lo mismo sin importar lo lejos que esté. Cada tabla se
+        recorre por su índice de nombre y solo se leen `limite` filas.
+
+        Args:
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            despues_de: (nombre, es_base, id) de la última receta ya mostrada
+            limite: Tamaño de la página
+            duracion_maxima: Solo recetas de como mucho estos segundos
+
+        Returns:
+            Filas de resumen: id, nombre, descripcion, es_base, favorito,
+            num_pasos, duracion_total y tipos_procesos (separados por comas)
+        """
+        # El texto del SQL solo depende del filtro, de la rama del cursor y de
+        # si hay filtro de duración: se construye una vez por combinación
+        es_base_cursor = None if despues_de is None else despues_de[1]
+        con_duracion = duracion_maxima is not None
+        query = registro_consultas.variante(
+            'listar_recetas', (filtro, es_base_cursor, con_duracion),
+            lambda: self._sql_listado(filtro, es_base_cursor, con_duracion)
+        )
+
+        params: list = []
+        for _, es_base, _ in self._RAMAS_LISTADO[filtro]:
+            if con_duracion:
+                params.append(duracion_maxima)
+            if despues_de is not None:
+                params.extend(self._params_keyset(es_base, despues_de))
+            params.append(limite)
+        params.append(limite)
+        return self._consultar_sql('listar_recetas', query, tuple(params))
+
+    def _sql_listado(self, filtro: str, es_base_cursor: Optional[int], con_duracion: bool) -> str:
+        """Construye el SQL de listar_recetas para una combinación de opciones"""
+        ramas = []
+        for tabla, es_base, condicion in self._RAMAS_LISTADO[filtro]:
+            condiciones = [condicion] if condicion else []
+            if con_duracion:
+                condiciones.append("duracion_total <= ?")
+            if es_base_cursor is not None:
+                condiciones.append(self._condicion_keyset(es_base, es_base_cursor))
+            where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+            ramas.append(f"""
+                SELECT * FROM (
+                    SELECT {self._columnas_resumen(tabla, es_base)}
+                    FROM {tabla} r
+                    {where}
+                    ORDER BY r.nombre, r.id
+                    LIMIT ?
+                )
+            """)
+        return " UNION ALL ".join(ramas) + " ORDER BY nombre, es_base, id LIMIT ?"
+
+    @staticmethod
+    def _condicion_keyset(es_base: int, es_base_cursor: int) -> str:
+        """
+        Condición "posterior al cursor" para una rama con es_base constante
+
+        Dentro de una rama el orden es (nombre, id); es_base solo decide
+        qué rama va antes cuando dos recetas comparten nombre.
+        """
+        if es_base > es_base_cursor:
+            return "nombre >= ?"
+        if es_base < es_base_cursor:
+            return "nombre > ?"
+        return "(nombre, id) > (?, ?)"
+
+    @staticmethod
+    def _params_keyset(es_base: int, despues_de: Tuple[str, int, int]) -> list:
+        """Parámetros de _condicion_keyset para el cursor dado"""
+        nombre, es_base_cursor, receta_id = despues_de
+        if es_base != es_base_cursor:
+            return [nombre]
+        return [nombre, receta_id]
+
+    def obtener_resumenes_recetas(self, ids_base: List[int], ids_usuario: List[int]) -> List[Dict]:
+        """
+        Obtiene las filas de resumen de un conjunto de recetas
+
+        Args:
+            ids_base: IDs de recetas base
+            ids_usuario: IDs de recetas de usuario
+
+        Returns:
+            Filas de resumen (mismas columnas que listar_recetas), sin orden definido
+        """
+        filas = []
+        for tabla, es_base, ids in (('recetas_base', 1, ids_base), ('recetas_usuario', 0, ids_usuario)):
+            if ids:
+                # Los IDs van como un único parámetro JSON: la sentencia es la
+                # misma sea cual sea su número y se reutiliza ya preparada
+                query = registro_consultas.variante(
+                    'resumenes_recetas', tabla,
+                    lambda: f"SELECT {self._columnas_resumen(tabla, es_base)} FROM {tabla} r "
+                            f"WHERE r.id IN (SELECT value FROM json_each(?))"
+                )
+                filas.extend(self._consultar_sql('resumenes_recetas', query, (json.dumps(ids),)))
+        return filas
+
+    def contar_recetas(self, filtro: str = 'todas', duracion_maxima: Optional[int] = None) -> int:
+        """Cuenta las recetas de un filtro del navegador"""
+        con_duracion = duracion_maxima is not None
+        params = (duracion_maxima,) if con_duracion else ()
+        total = 0
+        for tabla, _, condicion in self._RAMAS_LISTADO[filtro]:
+            query = registro_consultas.variante(
+                'contar_recetas', (tabla, condicion, con_duracion),
+                lambda: self._sql_conteo(tabla, condicion, con_duracion)
+            )
+            total += self._consultar_sql('contar_recetas', query, params)[0]['total']
+        return total
+
+    @staticmethod
+    def _sql_conteo(tabla: str, condicion: str, con_duracion: bool) -> str:
+        """Construye el SQL de contar_recetas para una rama del filtro"""
+        condiciones = [condicion] if condicion else []
+        if con_duracion:
+            condiciones.append("duracion_total <= ?")
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        return f"SELECT COUNT(*) AS total FROM {tabla} {where}"
+
+    # ========== BÚSQUEDA DE TEXTO COMPLETO ==========
+
+    # Condición extra sobre recetas_fts según el filtro del navegador
+    # (rowid = id * 2 + es_base)
+    _FILTROS_FTS = {
+        'todas': "",
+        'base': "AND rowid % 2 = 1",
+        'usuario': "AND rowid % 2 = 0",
+        'favoritas': (
+            "AND rowid % 2 = 0 "
+            "AND rowid / 2 IN (SELECT id FROM recetas_usuario WHERE favorito = 1)"
+        ),
+    }
+
+    def buscar_recetas(self, consulta_fts: str, filtro: str = 'todas',
+                       limite: int = 50, desplazamiento: int = 0,
+                       duracion_maxima: Optional[int] = None) -> List[Dict]:
+        """
+        Busca recetas en el índice de texto completo
+
+        Args:
+            consulta_fts: Expresión MATCH de FTS5
+            filtro: 'todas', 'base', 'usuario' o 'favoritas'
+            limite: Número máximo de resultados
+            desplazamiento: Resultados a saltar (paginación)
+            duracion_maxima: Solo recetas de como mucho estos segundos
+
+        Returns:
+            Filas con 'id' y 'es_base', de más a menos relevante
+        """
+        sql_duracion, params_duracion = self._condicion_duracion_fts(duracion_maxima)
+        query = registro_consultas.variante(
+            'buscar_recetas', (filtro, bool(sql_duracion)),
+            lambda: f"""
+                SELECT rowid / 2 AS id, rowid % 2 AS es_base
+                FROM recetas_fts
+                WHERE recetas_fts MATCH ? {self._FILTROS_FTS[filtro]} {sql_duracion}
+                ORDER BY bm25(recetas_fts, 10.0, 4.0, 2.0, 1.0)
+                LIMIT ? OFFSET ?
+            """
+        )
+        return self._consultar_sql(
+            'buscar_recetas', query, (consulta_fts, *params_duracion, limite, desplazamiento)
+        )
+
+    def contar_busqueda_recetas(self, consulta_fts: str, filtro: str = 'todas',
+                                duracion_maxima: Optional[int] = None) -> int:
+        """Cuenta los resultados de una búsqueda de texto completo"""
+        sql_duracion, params_duracion = self._condicion_duracion_fts(duracion_maxima)
+        query = registro_consultas.variante(
+            'contar_busqueda_recetas', (filtro, bool(sql_duracion)),
+            lambda: f"""
+                SELECT COUNT(*) AS total FROM recetas_fts
+                WHERE recetas_fts MATCH ? {self._FILTROS_FTS[filtro]} {sql_duracion}
+            """
+        )
+        return self._consultar_sql(
+            'contar_busqueda_recetas', query, (consulta_fts, *params_duracion)
+        )[0]['total']
+
+    @staticmethod
+    def _condicion_duracion_fts(duracion_maxima: Optional[int]) -> Tuple[str, tuple]:
+        """Condición de duración sobre recetas_fts (por el índice de duracion_total)"""
+        if duracion_maxima is None:
+            return "", ()
+        return (
+            "AND rowid IN ("
+            "SELECT id * 2 + 1 FROM recetas_base WHERE duracion_total <= ? "
+            "UNION ALL SELECT id * 2 FROM recetas_usuario WHERE duracion_total <= ?)",
+            (duracion_maxima, duracion_maxima)
+        )
+
     def insertar_receta_usuario(self, nombre: str, descripcion: str = "") -> int:
         """Inserta una nueva receta de usuario"""
-        comando = """
-            INSERT INTO recetas_usuario (nombre, descripcion) 
-            VALUES (?, ?)
-        """
-        return self.ejecutar_comando(comando, (nombre, descripcion))
+        return self.modificar('insertar_receta_usuario', (nombre, descripcion))
     
     def insertar_proceso_usuario(self, receta_id: int, tipo: str, 
                                  parametros: str, orden: int, duracion: int) -> int:
         """Inserta un proceso en una receta de usuario"""
-        comando = """
-            INSERT INTO procesos_usuario 
-            (receta_id, tipo_proceso, parametros, orden, duracion) 
-            VALUES (?, ?, ?, ?, ?)
-        """
-        return self.ejecutar_comando(comando, (receta_id, tipo, parametros, orden, duracion))
+        return self.modificar('insertar_proceso_usuario',
+                              (receta_id, tipo, parametros, orden, duracion))
+
+    def insertar_ingrediente_usuario(self, receta_id: int, nombre: str, cantidad: float,
+                                     unidad: str, orden: int) -> int:
+        """Inserta un ingrediente en una receta de usuario"""
+        return self.modificar('insertar_ingrediente_usuario',
+                              (receta_id, nombre, cantidad, unidad, orden))
     
+    def insertar_receta_usuario_completa(self, nombre: str, descripcion: str,
+                                         ingredientes: List[tuple],
+                                         procesos: List[tuple]) -> int:
+        """
+        Inserta una receta de usuario con sus ingredientes y procesos en una
+        única transacción (todo o nada)
+
+        Args:
+            nombre: Nombre de la receta
+            descripcion: Descripción
+            ingredientes: Tuplas (nombre, cantidad, unidad) en orden
+            procesos: Tuplas (tipo, parametros, duracion) en orden
+
+        Returns:
+            ID de la receta creada
+        """
+        with self.transaccion() as cursor:
+            cursor.execute(
+                registro_consultas.sql('insertar_receta_usuario'), (nombre, descripcion)
+            )
+            receta_id = cursor.lastrowid
+
+            cursor.executemany(
+                registro_consultas.sql('insertar_ingrediente_usuario'),
+                [(receta_id, n, c, u, orden) for orden, (n, c, u) in enumerate(ingredientes)]
+            )
+
+            cursor.executemany(
+                registro_consultas.sql('insertar_proceso_usuario'),
+                [(receta_id, t, p, orden, d) for orden, (t, p, d) in enumerate(procesos, start=1)]
+            )
+
+        return receta_id
+
+    def obtener_siguiente_orden_proceso_usuario(self, receta_id: int) -> int:
+        """Obtiene el orden que le corresponde a un nuevo proceso de la receta"""
+        return self.consultar('siguiente_orden_proceso_usuario', (receta_id,))[0]['siguiente']
+
     def eliminar_recetas_usuario(self):
-        """Elimina todas las recetas y procesos del usuario (reinicio de fábrica)"""
+        """Elimina todas las recetas, ingredientes y procesos del usuario (reinicio de fábrica)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM procesos_usuario")
-            cursor.execute("DELETE FROM recetas_usuario")
+            cursor.execute(registro_consultas.sql('eliminar_ingredientes_usuario'))
+            cursor.execute(registro_consultas.sql('eliminar_procesos_usuario'))
+            cursor.execute(registro_consultas.sql('eliminar_recetas_usuario'))
             conn.commit()
     
     def tabla_existe(self, nombre_tabla: str) -> bool:
         """Verifica si una tabla existe"""
-        query = """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name=?
+        return len(self.consultar('tabla_existe', (nombre_tabla,))) > 0
+
+    # ========== EXPORTACIÓN E IMPORTACIÓN DEL CATÁLOGO ==========
+
+    def iterar_catalogo_usuario(self) -> Iterator[RecetaCompleta]:
         """
-        result = self.ejecutar_query(query, (nombre_tabla,))
-        return len(result) > 0
+        Recorre las recetas de usuario con sus ingredientes y procesos
+
+        Recetas, procesos e ingredientes se leen con tres cursores ordenados
+        por receta y se emparejan sobre la marcha (merge join), así que en
+        memoria solo está la receta en curso. La lectura se hace dentro de
+        una transacción para que las tres consultas vean la misma versión
+        de la base de datos aunque otro proceso escriba mientras tanto.
+
+        La transacción va en una conexión propia del iterador, no en la del
+        hilo: quien lo consume puede seguir usando la base de datos (y
+        confirmar sus propias transacciones) entre receta y receta.
+
+        El iterador debe consumirse en el mismo hilo que lo creó.
+
+        Yields:
+            Tuplas (nombre, descripcion, favorito, ingredientes, procesos)
+        """
+        conn = pool_conexiones.abrir_conexion_dedicada(self.db_path)
+        try:
+            conn.row_factory = fila_tupla
+            conn.execute("BEGIN")
+            recetas = conn.execute(registro_consultas.sql('exportar_recetas_usuario'))
+            procesos_de = self._lector_por_receta(
+                conn.execute(registro_consultas.sql('exportar_procesos_usuario'))
+            )
+            ingredientes_de = self._lector_por_receta(
+                conn.execute(registro_consultas.sql('exportar_ingredientes_usuario'))
+            )
+            for receta_id, nombre, descripcion, favorito in recetas:
+                yield (nombre, descripcion, bool(favorito),
+                       ingredientes_de(receta_id), procesos_de(receta_id))
+        finally:
+            conn.close()  # Solo lectura: cerrar descarta la transacción
+
+    @staticmethod
+    def _lector_por_receta(filas: Iterator[tuple]) -> Callable[[int], List[tuple]]:
+        """
+        Agrupa por receta un flujo de filas (receta_id, ...) ordenado por receta_id
+
+        Returns:
+            Función receta_id -> filas de esa receta (sin la columna receta_id).
+            Debe llamarse con IDs crecientes; las filas de recetas que no
+            se piden (huérfanas) se descartan.
+        """
+        pendiente = next(filas, None)
+
+        def filas_de(receta_id: int) -> List[tuple]:
+            nonlocal pendiente
+            grupo = []
+            while pendiente is not None and pendiente[0] <= receta_id:
+                if pendiente[0] == receta_id:
+                    grupo.append(pendiente[1:])
+                pendiente = next(filas, None)
+            return grupo
+
+        return filas_de
+
+    def insertar_lote_recetas_usuario(self, recetas: List[RecetaCompleta]) -> Tuple[int, int, int]:
+        """
+        Inserta un lote de recetas de usuario completas en una única transacción
+
+        Se omiten las recetas cuyo nombre ya existe (o se repite en el lote),
+        de modo que importar dos veces el mismo fichero no duplica recetas.
+
+        Args:
+            recetas: Tuplas (nombre, descripcion, favorito, ingredientes, procesos)
+
+        Returns:
+            (recetas, ingredientes, procesos) insertados
+        """
+        with self.transaccion() as cursor:
+            existentes = {
+                fila[0] for fila in cursor.execute(
+                    registro_consultas.sql('nombres_recetas_usuario_existentes'),
+                    (json.dumps([receta[0] for receta in recetas]),)
+                )
+            }
+            nuevas = {}
+            for nombre, descripcion, favorito, ingredientes, procesos in recetas:
+                if nombre not in existentes and nombre not in nuevas:
+                    nuevas[nombre] = (descripcion, favorito, ingredientes, procesos)
+
+            if not nuevas:
+                return 0, 0, 0
+
+            # Como en la carga de recetas base (init_db): IDs asignados aquí
+            # para insertar los hijos antes que la receta y que el trigger de
+            # recetas_fts la indexe una sola vez, ya completa
+            siguiente_id = cursor.execute(
+                registro_consultas.sql('siguiente_id_receta_usuario')
+            ).fetchone()[0]
+            ids = {nombre: siguiente_id + i for i, nombre in enumerate(nuevas)}
+
+            filas_ingredientes = [
+                (ids[nombre], n, c, u, orden)
+                for nombre, (_, _, ingredientes, _) in nuevas.items()
+                for orden, (n, c, u) in enumerate(ingredientes)
+            ]
+            filas_procesos = [
+                (ids[nombre], t, p, orden, d)
+                for nombre, (_, _, _, procesos) in nuevas.items()
+                for orden, (t, p, d) in enumerate(procesos, start=1)
+            ]
+            cursor.executemany(registro_consultas.sql('insertar_ingrediente_usuario'),
+                               filas_ingredientes)
+            cursor.executemany(registro_consultas.sql('insertar_proceso_usuario'), filas_procesos)
+
+            # Los triggers de totales no encuentran la receta al insertar sus
+            # procesos antes que ella: num_pasos y duracion_total se fijan aquí
+            cursor.executemany(
+                registro_consultas.sql('importar_receta_usuario'),
+                (
+                    (ids[nombre], nombre, descripcion, int(favorito),
+                     len(procesos), sum(p[2] for p in procesos))
+                    for nombre, (descripcion, favorito, _, procesos) in nuevas.items()
+                )
+            )
+
+        return len(nuevas), len(filas_ingredientes), len(filas_procesos)
 
     # ========== OPERACIONES DE PROCESOS PERSONALIZADOS ==========
 
     def obtener_procesos_personalizados(self) -> List[Dict]:
         """Obtiene todos los procesos personalizados activos"""
-        query = """
-            SELECT * FROM procesos_personalizados
-            WHERE activo = 1
-            ORDER BY nombre
-        """
-        return self.ejecutar_query(query)
+        return self.consultar('procesos_personalizados_activos')
 
     def insertar_proceso_personalizado(self, nombre: str, emoji: str,
                                       duracion_base: int, parametros_defecto: str = "",
                                       descripcion: str = "") -> int:
         """Inserta un nuevo proceso personalizado"""
-        comando = """
-            INSERT INTO procesos_personalizados
-            (nombre, emoji, duracion_base, parametros_defecto, descripcion)
-            VALUES (?, ?, ?, ?, ?)
-        """
-        return self.ejecutar_comando(comando,
-                                    (nombre, emoji, duracion_base, parametros_defecto, descripcion))
+        return self.modificar('insertar_proceso_personalizado',
+                              (nombre, emoji, duracion_base, parametros_defecto, descripcion))
 
     def actualizar_proceso_personalizado(self, id: int, nombre: str, emoji: str,
                                         duracion_base: int, parametros_defecto: str = "",
                                         descripcion: str = ""):
         """Actualiza un proceso personalizado existente"""
-        comando = """
-            UPDATE procesos_personalizados
-            SET nombre = ?, emoji = ?, duracion_base = ?,
-                parametros_defecto = ?, descripcion = ?
-            WHERE id = ?
-        """
-        self.ejecutar_comando(comando,
-                            (nombre, emoji, duracion_base, parametros_defecto, descripcion, id))
+        self.modificar('actualizar_proceso_personalizado',
+                       (nombre, emoji, duracion_base, parametros_defecto, descripcion, id))
 
     def eliminar_proceso_personalizado(self, id: int):
         """Marca un proceso personalizado como inactivo (soft delete)"""
-        comando = "UPDATE procesos_personalizados SET activo = 0 WHERE id = ?"
-        self.ejecutar_comando(comando, (id,))
+        self.modificar('desactivar_proceso_personalizado', (id,))
 
-    def obtener_proceso_personalizado_por_nombre(self, nombre: str) -> Optional[Dict]:
-        """Obtiene un proceso personalizado por su nombre"""
-        query = """
-            SELECT * FROM procesos_personalizados
-            WHERE nombre = ? AND activo = 1
+    def borrar_proceso_personalizado(self, id: int):
+        """Elimina definitivamente un proceso personalizado"""
+        self.modificar('borrar_proceso_personalizado', (id,))
+
+    def purgar_procesos_personalizados_inactivos(self) -> int:
+        """
+        Borra definitivamente los procesos personalizados desactivados que
+        no usa ninguna receta (mantenimiento)
+
+        Returns:
+            Número de procesos borrados
         """
-        result = self.ejecutar_query(query, (nombre,))
-        return result[0] if result else None
\ No newline at end of file
+        with self.transaccion() as cursor:
+            cursor.execute(registro_consultas.sql('purgar_procesos_personalizados_inactivos'))
+            return cursor.rowcount
+
+    def obtener_proceso_personalizado_por_nombre(self, nombre: str) -> Optional[Dict]:
+        """Obtiene un proceso personalizado activo por su nombre"""
+        result = self.consultar('proceso_personalizado_por_nombre', (nombre,))
+        return result[0] if result else None
+
+    def existe_nombre_proceso_personalizado(self, nombre: str) -> bool:
+        """Indica si ya hay un proceso personalizado con ese nombre (activo o inactivo)"""
+        return bool(self.consultar('existe_nombre_proceso_personalizado', (nombre,))[0]['existe'])
+
+
+def cerrar_conexiones():
+    """Cierra todas las conexiones del pool (llamar al apagar la aplicación)"""
+    pool_conexiones.cerrar_todas()
@@ -0,0 +1,144 @@
+"""
+Acceso asíncrono a la base de datos
+Ejecuta las operaciones de SQLite fuera del bucle de eventos de NiceGUI
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Hilos lectores: con WAL varias lecturas pueden avanzar en paralelo
+LECTORES_POR_DEFECTO = 4
+
+
+class AsyncDatabaseManager:
+    """
+    Fachada asíncrona para las operaciones de base de datos
+
+    Los manejadores de NiceGUI se ejecutan en el bucle de asyncio que
+    atiende los websockets de todos los clientes, así que una consulta
+    síncrona dentro de ellos congela la interfaz de todos mientras dura.
+    Con esta fachada el manejador hace `await` y el bucle queda libre:
+
+    - Las lecturas se reparten entre un pequeño grupo de hilos lectores.
+    - Las escrituras entran en una cola atendida por un único hilo escritor,
+      en orden de llegada, de modo que nunca compiten entre sí por el
+      bloqueo de escritura de SQLite.
+
+    Cada hilo usa su propia conexión del pool, igual que el resto de hilos
+    de la aplicación. Las funciones recibidas pueden ser métodos de
+    DatabaseManager o de los controladores (la caché del catálogo es
+    segura entre hilos).
+    """
+
+    def __init__(self, lectores: int = LECTORES_POR_DEFECTO):
+        """
+        Inicializa la fachada (los hilos se crean con la primera operación)
+
+        Args:
+            lectores: Número de hilos dedicados a lecturas
+        """
+        self._num_lectores = lectores
+        self._lock = threading.Lock()
+        self._lectura: Optional[ThreadPoolExecutor] = None
+        self._escritura: Optional[ThreadPoolExecutor] = None
+        self._lecturas = 0
+        self._escrituras = 0
+        self._escrituras_en_cola = 0
+
+    async def leer(self, funcion: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Ejecuta una operación de lectura en un hilo lector
+
+        Args:
+            funcion: Función o método a ejecutar (ej: recetas_ctrl.listar_recetas)
+            *args, **kwargs: Argumentos de la función
+
+        Returns:
+            El resultado de la función (sus excepciones se propagan)
+        """
+        ejecutor = self._obtener_ejecutores()[0]
+        with self._lock:
+            self._lecturas += 1
+        return await self._ejecutar(ejecutor, funcion, args, kwargs)
+
+    async def escribir(self, funcion: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Encola una operación de escritura en el hilo escritor
+
+        Las escrituras se ejecutan de una en una y en orden de llegada.
+
+        Args:
+            funcion: Función o método a ejecutar (ej: recetas_ctrl.toggle_favorito)
+            *args, **kwargs: Argumentos de la función
+
+        Returns:
+            El resultado de la función (sus excepciones se propagan)
+        """
+        ejecutor = self._obtener_ejecutores()[1]
+        with self._lock:
+            self._escrituras += 1
+            self._escrituras_en_cola += 1
+        try:
+            return await self._ejecutar(ejecutor, funcion, args, kwargs)
+        finally:
+            with self._lock:
+                self._escrituras_en_cola -= 1
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene información sobre el uso de la fachada
+
+        Returns:
+            Diccionario con lecturas y escrituras realizadas y escrituras en cola
+        """
+        with self._lock:
+            return {
+                'lecturas': self._lecturas,
+                'escrituras': self._escrituras,
+                'escrituras_en_cola': self._escrituras_en_cola,
+            }
+
+    def cerrar(self):
+        """
+        Espera a las operaciones pendientes y detiene los hilos
+
+        Llamar al apagar la aplicación, antes de cerrar las conexiones del
+        pool. Una operación posterior vuelve a crear los hilos.
+        """
+        with self._lock:
+            ejecutores = (self._lectura, self._escritura)
+            self._lectura = None
+            self._escritura = None
+
+        for ejecutor in ejecutores:
+            if ejecutor is not None:
+                ejecutor.shutdown(wait=True)
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _obtener_ejecutores(self):
+        """Devuelve (lectura, escritura), creándolos la primera vez"""
+        with self._lock:
+            if self._lectura is None:
+                self._lectura = ThreadPoolExecutor(
+                    max_workers=self._num_lectores, thread_name_prefix='bd-lectura'
+                )
+                self._escritura = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='bd-escritura'
+                )
+            return self._lectura, self._escritura
+
+    @staticmethod
+    async def _ejecutar(ejecutor: ThreadPoolExecutor, funcion: Callable[..., Any],
+                        args: tuple, kwargs: dict) -> Any:
+        """Ejecuta la función en el ejecutor sin bloquear el bucle de eventos"""
+        bucle = asyncio.get_running_loop()
+        return await bucle.run_in_executor(
+            ejecutor, functools.partial(funcion, *args, **kwargs)
+        )
+
+
+# Fachada compartida por toda la interfaz
+db_async = AsyncDatabaseManager()
@@ -0,0 +1,61 @@
+"""
+Fábricas de filas para las consultas en streaming
+Deciden qué objeto se crea por cada fila que devuelve SQLite
+"""
+import sqlite3
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+# Una fábrica recibe el cursor y la tupla de la fila y devuelve el objeto
+# que se entrega al iterar (misma firma que sqlite3.Connection.row_factory)
+FabricaFilas = Callable[[sqlite3.Cursor, tuple], Any]
+
+
+def fila_tupla(cursor: sqlite3.Cursor, fila: tuple) -> tuple:
+    """La propia tupla de SQLite, sin ninguna copia adicional"""
+    return fila
+
+
+def fila_dict(cursor: sqlite3.Cursor, fila: tuple) -> Dict[str, Any]:
+    """Diccionario columna -> valor (equivale a dict(sqlite3.Row))"""
+    return {columna[0]: valor for columna, valor in zip(cursor.description, fila)}
+
+
+@lru_cache(maxsize=64)
+def _clase_registro(columnas: Tuple[str, ...]):
+    """namedtuple para un conjunto de columnas (se crea una vez por consulta)"""
+    return namedtuple('Fila', columnas)
+
+
+# Última (description, clase) usada: evita recalcular las columnas en cada
+# fila, ya que el cursor mantiene el mismo objeto description mientras itera
+_ultimo_registro: Tuple[Any, Any] = (None, None)
+
+
+def fila_registro(cursor: sqlite3.Cursor, fila: tuple):
+    """namedtuple con acceso por atributo (fila.nombre) y por posición"""
+    global _ultimo_registro
+    descripcion, clase = _ultimo_registro
+    if descripcion is not cursor.description:
+        clase = _clase_registro(tuple(columna[0] for columna in cursor.description))
+        _ultimo_registro = (cursor.description, clase)
+    return clase._make(fila)
+
+
+def fila_modelo(constructor: Callable[..., Any]) -> FabricaFilas:
+    """
+    Crea una fábrica que construye directamente el objeto del modelo
+
+    Las columnas de la consulta se pasan por posición al constructor, así
+    que deben seleccionarse en el orden de sus argumentos.
+
+    Args:
+        constructor: Clase o función que recibe los valores de la fila
+
+    Returns:
+        Fábrica de filas para iterar_query/iterar
+    """
+    def fabrica(cursor: sqlite3.Cursor, fila: tuple):
+        return constructor(*fila)
+    return fabrica
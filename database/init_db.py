@@ -1,227 +1,177 @@
 """
 Inicialización de la base de datos con tablas y datos preinstalados (CORREGIDO)
-Versión 2.0 - Incluye migración para ingredientes y favoritos
+El esquema se crea y actualiza mediante las migraciones de database/migraciones.py
 """
+import json
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
 from database.db import DatabaseManager
-import sqlite3
+from database.consultas import registro_consultas
+from database.migraciones import aplicar_migraciones
 
-def inicializar_base_datos():
-    """Crea las tablas y carga datos preinstalados si no existen"""
-    db = DatabaseManager()
+# Receta de semilla: (nombre, descripción, [(tipo, parámetros, duración), ...])
+RecetaSemilla = Tuple[str, str, List[Tuple[str, str, int]]]
 
-    crear_tablas(db)
+# Recetas por lote al cargar semillas (acota la memoria en ficheros grandes)
+TAMANO_LOTE_SEMILLAS = 500
 
-    # NUEVA: Ejecutar migración a v2.0
-    migrar_a_v2(db)
 
-    # Cargar datos solo si no existen recetas base
-    if necesita_datos_iniciales(db):
-        cargar_datos_preinstalados(db)
-
-
-def crear_tablas(db: DatabaseManager):
-    """Crea las tablas de la base de datos"""
-    schema = """
-    CREATE TABLE IF NOT EXISTS recetas_base (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        nombre TEXT NOT NULL UNIQUE,
-        descripcion TEXT
-    );
-
-    CREATE TABLE IF NOT EXISTS procesos_base (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        receta_id INTEGER NOT NULL,
-        tipo_proceso TEXT NOT NULL,
-        parametros TEXT,
-        orden INTEGER NOT NULL,
-        duracion INTEGER NOT NULL,
-        FOREIGN KEY (receta_id) REFERENCES recetas_base(id)
-    );
-
-    CREATE TABLE IF NOT EXISTS recetas_usuario (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        nombre TEXT NOT NULL,
-        descripcion TEXT
-    );
-
-    CREATE TABLE IF NOT EXISTS procesos_usuario (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        receta_id INTEGER NOT NULL,
-        tipo_proceso TEXT NOT NULL,
-        parametros TEXT,
-        orden INTEGER NOT NULL,
-        duracion INTEGER NOT NULL,
-        FOREIGN KEY (receta_id) REFERENCES recetas_usuario(id) ON DELETE CASCADE
-    );
+def inicializar_base_datos(ruta_semillas: Optional[str] = None):
     """
-    db.ejecutar_script(schema)
+    Aplica las migraciones pendientes y carga datos preinstalados si no existen
 
-
-def migrar_a_v2(db: DatabaseManager):
-    """
-    Migra la base de datos a la versión 2.0
-    Cambios:
-    - Tabla ingredientes (con FK a recetas_usuario)
-    - Columna favorito en recetas_usuario
-    - Columna fecha_creacion en recetas_usuario
-    - Tabla procesos_personalizados
+    Args:
+        ruta_semillas: Fichero JSONL opcional con el catálogo base a cargar
+            en lugar de las recetas preinstaladas (ver leer_semillas_jsonl)
     """
-    print("\n🔄 Verificando migración a v2.0...")
-
-    print("📦 Migrando base de datos a v2.0...")
-
-    # Paso 1: Crear tabla ingredientes
-    try:
-        db.ejecutar_script("""
-            CREATE TABLE IF NOT EXISTS ingredientes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                receta_id INTEGER NOT NULL,
-                nombre TEXT NOT NULL,
-                cantidad REAL,
-                unidad TEXT,
-                orden INTEGER NOT NULL,
-                es_base BOOLEAN DEFAULT 0,
-                FOREIGN KEY (receta_id) REFERENCES recetas_usuario(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ Tabla 'ingredientes' creada")
-    except Exception as e:
-        print(f"  ⚠ Error al crear tabla ingredientes: {e}")
-
-    # Paso 2: Agregar columna favorito a recetas_usuario
-    try:
-        db.ejecutar_comando(
-            "ALTER TABLE recetas_usuario ADD COLUMN favorito INTEGER DEFAULT 0"
-        )
-        print("  ✓ Columna 'favorito' agregada a recetas_usuario")
-    except sqlite3.OperationalError as e:
-        if "duplicate column" in str(e).lower():
-            print("  ℹ Columna 'favorito' ya existe")
-        else:
-            print(f"  ⚠ Error al agregar columna favorito: {e}")
-
-    # Paso 3: Agregar columna fecha_creacion a recetas_usuario
-    # Nota: SQLite no permite DEFAULT CURRENT_TIMESTAMP en ALTER TABLE
-    # Usamos NULL como default y lo rellenamos después
-    try:
-        db.ejecutar_comando(
-            "ALTER TABLE recetas_usuario ADD COLUMN fecha_creacion DATETIME"
-        )
-        print("  ✓ Columna 'fecha_creacion' agregada a recetas_usuario")
+    db = DatabaseManager()
 
-        # Rellenar con fecha actual las recetas existentes
-        db.ejecutar_comando(
-            "UPDATE recetas_usuario SET fecha_creacion = CURRENT_TIMESTAMP WHERE fecha_creacion IS NULL"
-        )
-        print("  ✓ Fechas actualizadas para recetas existentes")
-    except sqlite3.OperationalError as e:
-        if "duplicate column" in str(e).lower():
-            print("  ℹ Columna 'fecha_creacion' ya existe")
+    # En una base de datos al día esto solo lee PRAGMA user_version
+    aplicar_migraciones(db)
+
+    # Se comprueba en cada arranque (es una consulta LIMIT 1): si una carga
+    # anterior falló después de migrar, el catálogo base se completa ahora
+    if necesita_datos_iniciales(db):
+        if ruta_semillas:
+            cargar_semillas_desde_archivo(db, ruta_semillas)
         else:
-            print(f"  ⚠ Error al agregar columna fecha_creacion: {e}")
-
-    # Paso 4: Crear tabla de preferencias de usuario (opcional pero útil)
-    try:
-        db.ejecutar_script("""
-            CREATE TABLE IF NOT EXISTS preferencias_usuario (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                clave TEXT NOT NULL UNIQUE,
-                valor TEXT
-            );
-        """)
-        print("  ✓ Tabla 'preferencias_usuario' creada")
-    except Exception as e:
-        print(f"  ⚠ Error al crear tabla preferencias: {e}")
-
-    # Paso 5: Crear tabla de procesos personalizados
-    try:
-        db.ejecutar_script("""
-            CREATE TABLE IF NOT EXISTS procesos_personalizados (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nombre TEXT NOT NULL UNIQUE,
-                emoji TEXT DEFAULT '⚙️',
-                duracion_base INTEGER NOT NULL,
-                parametros_defecto TEXT,
-                descripcion TEXT,
-                fecha_creacion DATETIME DEFAULT CURRENT_TIMESTAMP,
-                activo INTEGER DEFAULT 1
-            );
-        """)
-        print("  ✓ Tabla 'procesos_personalizados' creada")
-    except Exception as e:
-        print(f"  ⚠ Error al crear tabla procesos_personalizados: {e}")
-
-    print("✅ Migración a v2.0 completada exitosamente\n")
-
-    # Paso 6: Cargar procesos personalizados de ejemplo (solo si la tabla está vacía)
-    try:
-        procesos = db.ejecutar_query("SELECT COUNT(*) as count FROM procesos_personalizados")
-        if procesos[0]['count'] == 0:
-            cargar_procesos_ejemplo(db)
-    except Exception as e:
-        print(f"  ⚠ Error al verificar procesos de ejemplo: {e}")
-
-
-def cargar_procesos_ejemplo(db: DatabaseManager):
-    """Carga algunos procesos personalizados de ejemplo"""
-    print("📦 Cargando procesos personalizados de ejemplo...")
-
-    procesos_ejemplo = [
-        ("Batir", "🥄", 8, "velocidad=alta", "Batir ingredientes hasta obtener una mezcla homogénea"),
-        ("Emulsionar", "💧", 6, "velocidad=media", "Mezclar líquidos inmiscibles formando una emulsión"),
-        ("Fermentar", "🌡️", 3600, "temperatura=28C", "Dejar reposar la masa para que fermente"),
-        ("Montar", "🍰", 10, "velocidad=alta", "Montar claras o nata hasta punto de nieve"),
-        ("Infusionar", "☕", 300, "temperatura=80C", "Extraer sabores mediante infusión en líquido caliente"),
-    ]
-
-    for nombre, emoji, duracion, parametros, descripcion in procesos_ejemplo:
-        try:
-            db.ejecutar_comando(
-                """
-                INSERT INTO procesos_personalizados
-                (nombre, emoji, duracion_base, parametros_defecto, descripcion)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (nombre, emoji, duracion, parametros, descripcion)
-            )
-        except Exception as e:
-            print(f"  ⚠ Error al insertar proceso '{nombre}': {e}")
-
-    print("  ✓ Procesos de ejemplo cargados\n")
+            cargar_datos_preinstalados(db)
 
 
 def necesita_datos_iniciales(db: DatabaseManager) -> bool:
     """Verifica si necesita cargar datos iniciales"""
-    recetas = db.obtener_recetas_base()
-    return len(recetas) == 0
+    return not db.hay_recetas_base()
 
 
 def cargar_datos_preinstalados(db: DatabaseManager):
-    """Carga recetas preinstaladas en la base de datos usando IDs dinámicos"""
+    """Carga las recetas preinstaladas en una única transacción"""
+    total = cargar_recetas_base(db, RECETAS_PREINSTALADAS)
+    print(f"✓ Datos preinstalados cargados correctamente ({total} recetas)")
+
+
+def cargar_semillas_desde_archivo(db: DatabaseManager, ruta: str):
+    """
+    Carga el catálogo base desde un fichero JSONL externo
+
+    Args:
+        db: Gestor de base de datos
+        ruta: Ruta del fichero JSONL
+    """
+    print(f"📦 Cargando recetas base desde {ruta}...")
+    total = cargar_recetas_base(db, leer_semillas_jsonl(ruta))
+    print(f"✓ {total} recetas base cargadas desde {ruta}")
+
+
+def leer_semillas_jsonl(ruta: str) -> Iterator[RecetaSemilla]:
+    """
+    Lee un fichero de semillas línea a línea (sin cargarlo entero en memoria)
+
+    Cada línea es un objeto JSON:
+        {"nombre": "...", "descripcion": "...",
+         "procesos": [{"tipo": "Picar", "parametros": "...", "duracion": 2}, ...]}
+
+    Args:
+        ruta: Ruta del fichero JSONL
+
+    Yields:
+        Tuplas (nombre, descripcion, procesos)
+    """
+    with open(ruta, encoding='utf-8') as f:
+        for linea in f:
+            if not linea.strip():
+                continue
+            datos = json.loads(linea)
+            procesos = [
+                (p['tipo'], p.get('parametros', ''), int(p['duracion']))
+                for p in datos.get('procesos', [])
+            ]
+            yield datos['nombre'], datos.get('descripcion', ''), procesos
+
+
+def cargar_recetas_base(db: DatabaseManager, recetas: Iterable[RecetaSemilla],
+                        tamano_lote: int = TAMANO_LOTE_SEMILLAS) -> int:
+    """
+    Inserta recetas base y sus procesos en una sola transacción
+
+    Las recetas se consumen por lotes y cada lote se inserta con executemany,
+    de modo que la memoria usada no depende del tamaño del catálogo y solo
+    se paga un commit (un fsync) al final.
+
+    Args:
+        db: Gestor de base de datos
+        recetas: Iterable de (nombre, descripcion, [(tipo, parametros, duracion), ...])
+        tamano_lote: Número de recetas por lote
+
+    Returns:
+        Número de recetas insertadas (las de nombre repetido se omiten)
+    """
+    iterador = iter(recetas)
+    insertadas = 0
+
+    with db.transaccion() as cursor:
+        while True:
+            lote = list(islice(iterador, tamano_lote))
+            if not lote:
+                break
+            insertadas += _insertar_lote_recetas_base(cursor, lote)
+
+    return insertadas
 
-    def insertar_receta(nombre, descripcion, procesos):
-        # Insertar la receta y obtener su ID real
-        receta_id = db.ejecutar_comando(
-            "INSERT INTO recetas_base (nombre, descripcion) VALUES (?, ?)",
-            (nombre, descripcion)
+
+def _insertar_lote_recetas_base(cursor, lote: List[RecetaSemilla]) -> int:
+    """Inserta un lote de recetas base dentro de la transacción en curso"""
+    nombres = [nombre for nombre, _, _ in lote]
+
+    # recetas_base.nombre es UNIQUE: se omiten las recetas que ya existen
+    # y los nombres repetidos dentro del propio lote
+    existentes = {
+        fila[0] for fila in cursor.execute(
+            registro_consultas.sql('nombres_recetas_base_existentes'), (json.dumps(nombres),)
+        )
+    }
+    nuevas = {}
+    for nombre, descripcion, procesos in lote:
+        if nombre not in existentes and nombre not in nuevas:
+            nuevas[nombre] = (descripcion, procesos)
+
+    if not nuevas:
+        return 0
+
+    # Se asignan los mismos IDs que daría AUTOINCREMENT. Así los procesos
+    # pueden insertarse primero y el trigger de recetas_fts indexa cada
+    # receta una sola vez, ya con sus procesos (en lugar de reescribir su
+    # entrada del índice por cada proceso)
+    siguiente_id = cursor.execute(registro_consultas.sql('siguiente_id_receta_base')).fetchone()[0]
+    ids = {nombre: siguiente_id + i for i, nombre in enumerate(nuevas)}
+
+    cursor.executemany(
+        registro_consultas.sql('insertar_proceso_base'),
+        (
+            (ids[nombre], tipo, parametros, orden, duracion)
+            for nombre, (_, procesos) in nuevas.items()
+            for orden, (tipo, parametros, duracion) in enumerate(procesos, start=1)
+        )
+    )
+
+    # Los triggers de totales no encuentran la receta al insertar sus
+    # procesos antes que ella, así que num_pasos y duracion_total se fijan aquí
+    cursor.executemany(
+        registro_consultas.sql('insertar_receta_base'),
+        (
+            (ids[nombre], nombre, descripcion, len(procesos), sum(p[2] for p in procesos))
+            for nombre, (descripcion, procesos) in nuevas.items()
         )
+    )
+
+    return len(nuevas)
 
-        # Insertar procesos asociados
-        for orden, (tipo, parametros, duracion) in enumerate(procesos, start=1):
-            db.ejecutar_comando(
-                """
-                INSERT INTO procesos_base 
-                (receta_id, tipo_proceso, parametros, orden, duracion)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (receta_id, tipo, parametros, orden, duracion)
-            )
-
-    # ===========================
-    # LISTA DE RECETAS PREINSTALADAS
-    # ===========================
-
-    insertar_receta(
+
+# ===========================
+# LISTA DE RECETAS PREINSTALADAS
+# ===========================
+
+RECETAS_PREINSTALADAS = [
+    (
         "Gazpacho Andaluz",
         "Sopa fría de tomate típica española",
         [
@@ -229,9 +179,8 @@ def cargar_datos_preinstalados(db: DatabaseManager):
             ("Triturar", "velocidad=alta", 5),
             ("Sofreir", "temperatura=media, tiempo=2min", 2),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Puré de Patatas",
         "Cremoso puré tradicional",
         [
@@ -239,9 +188,8 @@ def cargar_datos_preinstalados(db: DatabaseManager):
             ("Hervir", "temperatura=100C, tiempo=20min", 20),
             ("PrepararPure", "velocidad=media", 3),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Salsa Boloñesa",
         "Salsa italiana de carne",
         [
@@ -250,9 +198,8 @@ def cargar_datos_preinstalados(db: DatabaseManager):
             ("Triturar", "tomate, velocidad=media", 4),
             ("Hervir", "temperatura=90C, tiempo=30min", 30),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Hummus Casero",
         "Pasta de garbanzos estilo mediterráneo",
         [
@@ -260,36 +207,32 @@ def cargar_datos_preinstalados(db: DatabaseManager):
             ("Triturar", "velocidad=alta", 5),
             ("Picar", "ajo, perejil", 1),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Masa de Pizza",
         "Masa italiana tradicional",
         [
             ("Amasar", "velocidad=baja, tiempo=10min", 10),
             ("Amasar", "velocidad=media, tiempo=5min", 5),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Ensalada de Zanahoria",
         "Zanahoria rallada fresca",
         [
             ("Rallar", "zanahorias, grosor=fino", 2),
             ("Picar", "perejil", 1),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Verduras al Vapor",
         "Cocción saludable de vegetales",
         [
             ("Trocear", "brócoli, zanahoria, calabacín", 3),
             ("Vapor", "temperatura=100C, tiempo=15min", 15),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Sopa de Verduras",
         "Sopa nutritiva casera",
         [
@@ -298,24 +241,21 @@ def cargar_datos_preinstalados(db: DatabaseManager):
             ("Trocear", "verduras variadas", 4),
             ("Hervir", "temperatura=95C, tiempo=25min", 25),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Pesto Genovés",
         "Salsa italiana de albahaca",
         [
             ("Picar", "albahaca, piñones, ajo", 2),
             ("Triturar", "velocidad=alta", 3),
         ]
-    )
-
-    insertar_receta(
+    ),
+    (
         "Smoothie Tropical",
         "Batido de frutas frescas",
         [
             ("Trocear", "frutas variadas", 2),
             ("Triturar", "velocidad=alta, tiempo=3min", 3),
         ]
-    )
-
-    print("✓ Datos preinstalados cargados correctamente")
\ No newline at end of file
+    ),
+]
@@ -0,0 +1,287 @@
+"""
+Mantenimiento de la base de datos
+VACUUM incremental, estadísticas del planificador de consultas y purga de
+filas obsoletas, ejecutados en segundo plano mientras el robot está inactivo
+"""
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+from database.db import DatabaseManager
+
+# Páginas que libera cada paso de VACUUM incremental. Entre paso y paso se
+# comprueba si el robot sigue inactivo, así que una base de datos muy
+# fragmentada no retiene el bloqueo de escritura durante mucho tiempo
+PAGINAS_POR_PASO = 256
+
+# Tareas en el orden en que se ejecutan: la purga deja páginas libres que el
+# VACUUM recupera, y las estadísticas se recalculan al final
+TAREAS = ('purgar_procesos', 'vacuum', 'analyze', 'optimize')
+
+# Segundos mínimos entre dos ejecuciones de cada tarea
+PERIODOS_POR_DEFECTO: Dict[str, float] = {
+    'purgar_procesos': 24 * 3600,
+    'vacuum': 3600,
+    'analyze': 24 * 3600,
+    'optimize': 3600,
+}
+
+INTERVALO_COMPROBACION = 30     # Segundos entre comprobaciones del planificador
+INACTIVIDAD_MINIMA = 120        # Segundos de robot inactivo antes de empezar
+
+# Ejecuciones de tareas que se guardan en el historial
+TAMANO_HISTORIAL = 50
+
+
+class MantenimientoBD:
+    """
+    Tareas de mantenimiento de la base de datos
+
+    - purgar_procesos: borra los procesos personalizados desactivados
+      (eliminar_proceso_personalizado solo los marca) que ya no usa ninguna receta
+    - vacuum: devuelve al sistema de ficheros las páginas libres
+      (auto_vacuum=INCREMENTAL) y trunca el WAL. Nunca hace un VACUUM
+      completo: las bases de datos antiguas se convierten una vez con
+      convertir_a_vacuum_incremental()
+    - analyze: recalcula las estadísticas de todas las tablas e índices
+    - optimize: PRAGMA optimize, que solo analiza lo que lo necesita
+
+    Cada ejecución se registra con su duración y las páginas recuperadas.
+    """
+
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        """
+        Inicializa el mantenimiento
+
+        Args:
+            db: Gestor de base de datos (uno nuevo si no se indica)
+        """
+        self._db = db or DatabaseManager()
+        self._lock = threading.Lock()
+        self._historial: deque = deque(maxlen=TAMANO_HISTORIAL)
+
+    def ejecutar(self, tareas: Iterable[str] = TAREAS,
+                 continuar: Callable[[], bool] = lambda: True) -> List[Dict]:
+        """
+        Ejecuta tareas de mantenimiento en orden
+
+        Args:
+            tareas: Nombres de las tareas (ver TAREAS)
+            continuar: Se consulta antes de cada tarea (y entre pasos del
+                VACUUM); si devuelve False se deja el resto para otra vez
+
+        Returns:
+            Resultado de cada tarea ejecutada: {'tarea', 'segundos', 'paginas', 'filas'}
+
+        Raises:
+            ValueError: Si alguna tarea no existe
+        """
+        desconocidas = set(tareas) - set(TAREAS)
+        if desconocidas:
+            raise ValueError(f"Tareas de mantenimiento desconocidas: {sorted(desconocidas)}")
+
+        resultados = []
+        with self._lock:
+            for tarea in (t for t in TAREAS if t in tareas):
+                if not continuar():
+                    break
+                inicio = time.perf_counter()
+                paginas, filas = getattr(self, f'_{tarea}')(continuar)
+                resultado = {
+                    'tarea': tarea,
+                    'segundos': time.perf_counter() - inicio,
+                    'paginas': paginas,
+                    'filas': filas,
+                }
+                self._historial.append(dict(resultado, fecha=time.time()))
+                self._registrar(resultado)
+                resultados.append(resultado)
+        return resultados
+
+    def convertir_a_vacuum_incremental(self) -> bool:
+        """
+        Pasa a auto_vacuum=INCREMENTAL una base de datos creada sin él
+
+        Solo un VACUUM completo puede cambiar el modo: reescribe el fichero
+        entero y bloquea la base de datos mientras dura, así que se llama
+        de forma explícita al arrancar (app.py) y no desde el planificador.
+
+        Returns:
+            True si se convirtió, False si ya estaba en modo incremental
+        """
+        with self._lock:
+            conn = self._db.get_connection()
+            if self._pragma(conn, 'auto_vacuum') == 2:
+                return False
+
+            print("🧹 Convirtiendo la base de datos a auto_vacuum=INCREMENTAL (VACUUM completo)...")
+            inicio = time.perf_counter()
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            print(f"✓ Base de datos convertida en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+            return True
+
+    def historial(self) -> List[Dict]:
+        """Últimas ejecuciones de tareas, de la más antigua a la más reciente"""
+        return list(self._historial)
+
+    # ========== TAREAS ==========
+
+    def _purgar_procesos(self, continuar: Callable[[], bool]):
+        """Borra los procesos personalizados inactivos que no usa ninguna receta"""
+        filas = self._db.purgar_procesos_personalizados_inactivos()
+        return 0, filas
+
+    def _vacuum(self, continuar: Callable[[], bool]):
+        """Devuelve las páginas libres al sistema de ficheros"""
+        conn = self._db.get_connection()
+        antes = self._pragma(conn, 'page_count')
+
+        # Sin auto_vacuum=INCREMENTAL (base de datos sin convertir, ver
+        # convertir_a_vacuum_incremental) incremental_vacuum no hace nada:
+        # solo se trunca el WAL
+        if self._pragma(conn, 'auto_vacuum') == 2:
+            while self._pragma(conn, 'freelist_count') > 0 and continuar():
+                # executescript recorre la sentencia hasta el final; con
+                # execute sqlite3 daría un solo paso y liberaría una página
+                conn.executescript(f"PRAGMA incremental_vacuum({PAGINAS_POR_PASO});")
+
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return antes - self._pragma(conn, 'page_count'), 0
+
+    def _analyze(self, continuar: Callable[[], bool]):
+        """Recalcula las estadísticas del planificador de consultas"""
+        self._db.ejecutar_script("ANALYZE;")
+        return 0, 0
+
+    def _optimize(self, continuar: Callable[[], bool]):
+        """PRAGMA optimize: analiza solo las tablas cuyas estadísticas lo necesitan"""
+        self._db.ejecutar_script("PRAGMA optimize;")
+        return 0, 0
+
+    # ========== UTILIDADES ==========
+
+    @staticmethod
+    def _pragma(conn, nombre: str) -> int:
+        """Lee un PRAGMA numérico"""
+        return conn.execute(f"PRAGMA {nombre}").fetchone()[0]
+
+    def _registrar(self, resultado: Dict):
+        """Escribe en el log el tiempo empleado y lo recuperado por una tarea"""
+        detalle = ""
+        if resultado['paginas']:
+            tamano = self._pragma(self._db.get_connection(), 'page_size')
+            detalle = (f", {resultado['paginas']} páginas recuperadas "
+                       f"({resultado['paginas'] * tamano / (1024 * 1024):.1f} MB)")
+        elif resultado['filas']:
+            detalle = f", {resultado['filas']} filas purgadas"
+        print(f"🧹 Mantenimiento {resultado['tarea']}: {resultado['segundos'] * 1000:.0f} ms{detalle}")
+
+
+class PlanificadorMantenimiento:
+    """
+    Ejecuta el mantenimiento en un hilo de fondo cuando el robot está inactivo
+
+    Cada INTERVALO_COMPROBACION segundos consulta `esta_inactivo`. Cuando el
+    robot lleva al menos INACTIVIDAD_MINIMA segundos sin ejecutar nada, lanza
+    las tareas cuyo periodo ya ha vencido. Si el robot vuelve a trabajar,
+    el mantenimiento se interrumpe entre tareas (o entre pasos del VACUUM)
+    y las tareas pendientes se retoman en el siguiente periodo inactivo.
+    """
+
+    def __init__(self, esta_inactivo: Callable[[], bool],
+                 mantenimiento: Optional[MantenimientoBD] = None,
+                 periodos: Optional[Dict[str, float]] = None,
+                 intervalo: float = INTERVALO_COMPROBACION,
+                 inactividad_minima: float = INACTIVIDAD_MINIMA):
+        """
+        Inicializa el planificador (sin arrancar el hilo)
+
+        Args:
+            esta_inactivo: Devuelve True si el robot no está ejecutando nada
+            mantenimiento: Tareas a ejecutar (MantenimientoBD nuevo si no se indica)
+            periodos: Segundos mínimos entre ejecuciones de cada tarea
+            intervalo: Segundos entre comprobaciones
+            inactividad_minima: Segundos de inactividad antes de empezar
+        """
+        self._esta_inactivo = esta_inactivo
+        self._mantenimiento = mantenimiento or MantenimientoBD()
+        self._periodos = dict(PERIODOS_POR_DEFECTO if periodos is None else periodos)
+        self._intervalo = intervalo
+        self._inactividad_minima = inactividad_minima
+        self._ultima_ejecucion: Dict[str, float] = {}
+        self._inactivo_desde: Optional[float] = None
+        self._parar = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def mantenimiento(self) -> MantenimientoBD:
+        """Tareas de mantenimiento que ejecuta el planificador"""
+        return self._mantenimiento
+
+    def iniciar(self):
+        """Arranca el hilo del planificador (si no está ya en marcha)"""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._parar.clear()
+        self._hilo = threading.Thread(target=self._bucle, name='bd-mantenimiento', daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout: Optional[float] = 10):
+        """
+        Detiene el planificador
+
+        Un mantenimiento en curso termina su paso actual y no empieza más.
+
+        Args:
+            timeout: Segundos máximos de espera al hilo (None = sin límite)
+        """
+        self._parar.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
+
+    def comprobar(self, ahora: Optional[float] = None) -> List[Dict]:
+        """
+        Comprueba la inactividad y ejecuta las tareas vencidas
+
+        Es lo que hace el hilo en cada intervalo; puede llamarse directamente.
+
+        Args:
+            ahora: Instante actual (time.monotonic) para la comprobación
+
+        Returns:
+            Resultados de las tareas ejecutadas (vacío si no tocaba)
+        """
+        ahora = time.monotonic() if ahora is None else ahora
+        if not self._esta_inactivo():
+            self._inactivo_desde = None
+            return []
+        if self._inactivo_desde is None:
+            self._inactivo_desde = ahora
+        if ahora - self._inactivo_desde < self._inactividad_minima:
+            return []
+
+        vencidas = [
+            tarea for tarea, periodo in self._periodos.items()
+            if tarea not in self._ultima_ejecucion or ahora - self._ultima_ejecucion[tarea] >= periodo
+        ]
+        if not vencidas:
+            return []
+
+        resultados = self._mantenimiento.ejecutar(
+            vencidas, continuar=lambda: not self._parar.is_set() and self._esta_inactivo()
+        )
+        for resultado in resultados:
+            self._ultima_ejecucion[resultado['tarea']] = ahora
+        return resultados
+
+    def _bucle(self):
+        """Cuerpo del hilo: comprueba cada intervalo hasta que se detiene"""
+        while not self._parar.wait(self._intervalo):
+            try:
+                self.comprobar()
+            except Exception as e:
+                # Un fallo (p. ej. base de datos bloqueada) no debe parar el
+                # planificador: se reintenta en la siguiente comprobación
+                print(f"⚠️ Error en el mantenimiento de la base de datos: {e}")
@@ -0,0 +1,496 @@
+"""
+Migraciones versionadas del esquema
+La versión del esquema se guarda en PRAGMA user_version y cada migración
+se aplica una única vez, dentro de su propia transacción.
+"""
+import sqlite3
+from typing import Callable, Dict, List, Tuple
+from database.db import DatabaseManager
+from database.consultas import registro_consultas
+
+
+# ========== UTILIDADES ==========
+
+def _columna_existe(conn: sqlite3.Connection, tabla: str, columna: str) -> bool:
+    """Verifica si una tabla tiene una columna"""
+    return any(fila[1] == columna for fila in conn.execute(f"PRAGMA table_info({tabla})"))
+
+
+# ========== MIGRACIONES ==========
+
+def _migracion_1_esquema_inicial(conn: sqlite3.Connection):
+    """Tablas de recetas y procesos (base y usuario)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recetas_base (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL UNIQUE,
+            descripcion TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS procesos_base (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            receta_id INTEGER NOT NULL,
+            tipo_proceso TEXT NOT NULL,
+            parametros TEXT,
+            orden INTEGER NOT NULL,
+            duracion INTEGER NOT NULL,
+            FOREIGN KEY (receta_id) REFERENCES recetas_base(id)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recetas_usuario (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            descripcion TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS procesos_usuario (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            receta_id INTEGER NOT NULL,
+            tipo_proceso TEXT NOT NULL,
+            parametros TEXT,
+            orden INTEGER NOT NULL,
+            duracion INTEGER NOT NULL,
+            FOREIGN KEY (receta_id) REFERENCES recetas_usuario(id) ON DELETE CASCADE
+        )
+    """)
+
+
+# Procesos personalizados de ejemplo cargados en la migración a v2.0
+PROCESOS_EJEMPLO = [
+    ("Batir", "🥄", 8, "velocidad=alta", "Batir ingredientes hasta obtener una mezcla homogénea"),
+    ("Emulsionar", "💧", 6, "velocidad=media", "Mezclar líquidos inmiscibles formando una emulsión"),
+    ("Fermentar", "🌡️", 3600, "temperatura=28C", "Dejar reposar la masa para que fermente"),
+    ("Montar", "🍰", 10, "velocidad=alta", "Montar claras o nata hasta punto de nieve"),
+    ("Infusionar", "☕", 300, "temperatura=80C", "Extraer sabores mediante infusión en líquido caliente"),
+]
+
+
+def _migracion_2_ingredientes_y_favoritos(conn: sqlite3.Connection):
+    """
+    Versión 2.0
+    - Tabla ingredientes (con FK a recetas_usuario)
+    - Columnas favorito y fecha_creacion en recetas_usuario
+    - Tablas preferencias_usuario y procesos_personalizados
+    - Procesos personalizados de ejemplo
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ingredientes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            receta_id INTEGER NOT NULL,
+            nombre TEXT NOT NULL,
+            cantidad REAL,
+            unidad TEXT,
+            orden INTEGER NOT NULL,
+            es_base BOOLEAN DEFAULT 0,
+            FOREIGN KEY (receta_id) REFERENCES recetas_usuario(id) ON DELETE CASCADE
+        )
+    """)
+
+    if not _columna_existe(conn, 'recetas_usuario', 'favorito'):
+        conn.execute("ALTER TABLE recetas_usuario ADD COLUMN favorito INTEGER DEFAULT 0")
+
+    # SQLite no permite DEFAULT CURRENT_TIMESTAMP en ALTER TABLE:
+    # se añade con NULL y se rellenan las recetas existentes
+    if not _columna_existe(conn, 'recetas_usuario', 'fecha_creacion'):
+        conn.execute("ALTER TABLE recetas_usuario ADD COLUMN fecha_creacion DATETIME")
+        conn.execute(
+            "UPDATE recetas_usuario SET fecha_creacion = CURRENT_TIMESTAMP WHERE fecha_creacion IS NULL"
+        )
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS preferencias_usuario (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            clave TEXT NOT NULL UNIQUE,
+            valor TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS procesos_personalizados (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL UNIQUE,
+            emoji TEXT DEFAULT '⚙️',
+            duracion_base INTEGER NOT NULL,
+            parametros_defecto TEXT,
+            descripcion TEXT,
+            fecha_creacion DATETIME DEFAULT CURRENT_TIMESTAMP,
+            activo INTEGER DEFAULT 1
+        )
+    """)
+
+    # Procesos de ejemplo (solo si la tabla está vacía)
+    if conn.execute("SELECT COUNT(*) FROM procesos_personalizados").fetchone()[0] == 0:
+        conn.executemany(
+            """
+            INSERT INTO procesos_personalizados
+            (nombre, emoji, duracion_base, parametros_defecto, descripcion)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            PROCESOS_EJEMPLO
+        )
+
+
+def _migracion_3_indices(conn: sqlite3.Connection):
+    """Índices compuestos para las consultas más frecuentes"""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_procesos_base_receta ON procesos_base (receta_id, orden)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_procesos_usuario_receta ON procesos_usuario (receta_id, orden)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ingredientes_receta ON ingredientes (receta_id, orden)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recetas_usuario_favorito ON recetas_usuario (favorito, nombre)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recetas_usuario_nombre ON recetas_usuario (nombre)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_procesos_personalizados_activo "
+        "ON procesos_personalizados (activo, nombre)"
+    )
+
+
+# Índice de texto completo: una fila por receta, con rowid = id * 2 + es_base
+# para que recetas base y de usuario con el mismo ID no colisionen
+_TEXTO_INGREDIENTES = """
+    COALESCE((SELECT group_concat(nombre, ' ') FROM ingredientes
+              WHERE receta_id = {id} AND COALESCE(es_base, 0) = {es_base}), '')
+"""
+_TEXTO_PROCESOS = """
+    COALESCE((SELECT group_concat(tipo_proceso || ' ' || COALESCE(parametros, ''), ' ')
+              FROM {tabla} WHERE receta_id = {id}), '')
+"""
+
+
+def _triggers_fts_receta(tabla_recetas: str, tabla_procesos: str, es_base: int) -> List[str]:
+    """Triggers que sincronizan recetas_fts con una tabla de recetas y sus procesos"""
+    rowid = "{}.id * 2 + " + str(es_base)
+    rowid_proceso = "{}.receta_id * 2 + " + str(es_base)
+
+    def procesos_de(ref: str) -> str:
+        return _TEXTO_PROCESOS.format(tabla=tabla_procesos, id=f"{ref}.receta_id")
+
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_recetas}_fts_ai AFTER INSERT ON {tabla_recetas} BEGIN
+            INSERT INTO recetas_fts (rowid, nombre, descripcion, ingredientes, procesos)
+            VALUES ({rowid.format('new')}, new.nombre, COALESCE(new.descripcion, ''),
+                    {_TEXTO_INGREDIENTES.format(id='new.id', es_base=es_base)},
+                    {_TEXTO_PROCESOS.format(tabla=tabla_procesos, id='new.id')});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_recetas}_fts_au
+        AFTER UPDATE OF nombre, descripcion ON {tabla_recetas} BEGIN
+            UPDATE recetas_fts SET nombre = new.nombre, descripcion = COALESCE(new.descripcion, '')
+            WHERE rowid = {rowid.format('new')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_recetas}_fts_ad AFTER DELETE ON {tabla_recetas} BEGIN
+            DELETE FROM recetas_fts WHERE rowid = {rowid.format('old')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_fts_ai AFTER INSERT ON {tabla_procesos} BEGIN
+            UPDATE recetas_fts SET procesos = {procesos_de('new')}
+            WHERE rowid = {rowid_proceso.format('new')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_fts_au AFTER UPDATE ON {tabla_procesos} BEGIN
+            UPDATE recetas_fts SET procesos = {procesos_de('old')}
+            WHERE rowid = {rowid_proceso.format('old')};
+            UPDATE recetas_fts SET procesos = {procesos_de('new')}
+            WHERE rowid = {rowid_proceso.format('new')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_fts_ad AFTER DELETE ON {tabla_procesos} BEGIN
+            UPDATE recetas_fts SET procesos = {procesos_de('old')}
+            WHERE rowid = {rowid_proceso.format('old')};
+        END
+        """,
+    ]
+
+
+def _triggers_fts_ingredientes() -> List[str]:
+    """Triggers que sincronizan recetas_fts con la tabla ingredientes"""
+    rowid = "{ref}.receta_id * 2 + COALESCE({ref}.es_base, 0)"
+
+    def ingredientes_de(ref: str) -> str:
+        return _TEXTO_INGREDIENTES.format(id=f"{ref}.receta_id", es_base=f"COALESCE({ref}.es_base, 0)")
+
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS ingredientes_fts_ai AFTER INSERT ON ingredientes BEGIN
+            UPDATE recetas_fts SET ingredientes = {ingredientes_de('new')}
+            WHERE rowid = {rowid.format(ref='new')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS ingredientes_fts_au AFTER UPDATE ON ingredientes BEGIN
+            UPDATE recetas_fts SET ingredientes = {ingredientes_de('old')}
+            WHERE rowid = {rowid.format(ref='old')};
+            UPDATE recetas_fts SET ingredientes = {ingredientes_de('new')}
+            WHERE rowid = {rowid.format(ref='new')};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS ingredientes_fts_ad AFTER DELETE ON ingredientes BEGIN
+            UPDATE recetas_fts SET ingredientes = {ingredientes_de('old')}
+            WHERE rowid = {rowid.format(ref='old')};
+        END
+        """,
+    ]
+
+
+def _migracion_4_busqueda_texto_completo(conn: sqlite3.Connection):
+    """
+    Búsqueda de texto completo (FTS5)
+    - Tabla virtual recetas_fts: nombre, descripción, ingredientes y procesos
+    - Triggers que la mantienen sincronizada
+    - Indexado de las recetas existentes
+    """
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS recetas_fts USING fts5(
+            nombre, descripcion, ingredientes, procesos,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    """)
+
+    for trigger in (_triggers_fts_receta('recetas_base', 'procesos_base', 1)
+                    + _triggers_fts_receta('recetas_usuario', 'procesos_usuario', 0)
+                    + _triggers_fts_ingredientes()):
+        conn.execute(trigger)
+
+    conn.execute("DELETE FROM recetas_fts")
+    for tabla_recetas, tabla_procesos, es_base in (('recetas_base', 'procesos_base', 1),
+                                                   ('recetas_usuario', 'procesos_usuario', 0)):
+        conn.execute(f"""
+            INSERT INTO recetas_fts (rowid, nombre, descripcion, ingredientes, procesos)
+            SELECT r.id * 2 + {es_base}, r.nombre, COALESCE(r.descripcion, ''),
+                   {_TEXTO_INGREDIENTES.format(id='r.id', es_base=es_base)},
+                   {_TEXTO_PROCESOS.format(tabla=tabla_procesos, id='r.id')}
+            FROM {tabla_recetas} r
+        """)
+
+
+def _triggers_totales_receta(tabla_recetas: str, tabla_procesos: str) -> List[str]:
+    """Triggers que mantienen num_pasos y duracion_total al cambiar los procesos"""
+    sumar = f"""
+        UPDATE {tabla_recetas}
+        SET num_pasos = num_pasos + 1, duracion_total = duracion_total + new.duracion
+        WHERE id = new.receta_id;
+    """
+    restar = f"""
+        UPDATE {tabla_recetas}
+        SET num_pasos = num_pasos - 1, duracion_total = duracion_total - old.duracion
+        WHERE id = old.receta_id;
+    """
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_totales_ai
+        AFTER INSERT ON {tabla_procesos} BEGIN {sumar} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_totales_ad
+        AFTER DELETE ON {tabla_procesos} BEGIN {restar} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {tabla_procesos}_totales_au
+        AFTER UPDATE OF receta_id, duracion ON {tabla_procesos} BEGIN {restar} {sumar} END
+        """,
+    ]
+
+
+def _migracion_5_totales_receta(conn: sqlite3.Connection):
+    """
+    Columnas num_pasos y duracion_total en las tablas de recetas
+    - Calculadas para las recetas existentes
+    - Mantenidas por triggers sobre las tablas de procesos
+    - Índice por duración para filtrar ("menos de 10 minutos") sin cargar recetas
+    """
+    for tabla_recetas, tabla_procesos in (('recetas_base', 'procesos_base'),
+                                          ('recetas_usuario', 'procesos_usuario')):
+        for columna in ('num_pasos', 'duracion_total'):
+            if not _columna_existe(conn, tabla_recetas, columna):
+                conn.execute(
+                    f"ALTER TABLE {tabla_recetas} ADD COLUMN {columna} INTEGER NOT NULL DEFAULT 0"
+                )
+
+        conn.execute(f"""
+            UPDATE {tabla_recetas} SET
+                num_pasos = (SELECT COUNT(*) FROM {tabla_procesos} p
+                             WHERE p.receta_id = {tabla_recetas}.id),
+                duracion_total = (SELECT COALESCE(SUM(p.duracion), 0) FROM {tabla_procesos} p
+                                  WHERE p.receta_id = {tabla_recetas}.id)
+        """)
+
+        for trigger in _triggers_totales_receta(tabla_recetas, tabla_procesos):
+            conn.execute(trigger)
+
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{tabla_recetas}_duracion "
+            f"ON {tabla_recetas} (duracion_total, nombre)"
+        )
+
+
+# Lista ordenada de migraciones: (versión, descripción, función)
+# Para cambiar el esquema se añade una nueva entrada al final; nunca se
+# modifican las ya publicadas.
+MIGRACIONES: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Esquema inicial", _migracion_1_esquema_inicial),
+    (2, "Ingredientes, favoritos y procesos personalizados", _migracion_2_ingredientes_y_favoritos),
+    (3, "Índices de consultas frecuentes", _migracion_3_indices),
+    (4, "Búsqueda de texto completo (FTS5)", _migracion_4_busqueda_texto_completo),
+    (5, "Número de pasos y duración total de cada receta", _migracion_5_totales_receta),
+]
+
+VERSION_ACTUAL = MIGRACIONES[-1][0]
+
+
+# ========== EJECUCIÓN ==========
+
+def obtener_version(db: DatabaseManager) -> int:
+    """Obtiene la versión del esquema (PRAGMA user_version)"""
+    return db.get_connection().execute("PRAGMA user_version").fetchone()[0]
+
+
+def aplicar_migraciones(db: DatabaseManager) -> int:
+    """
+    Aplica las migraciones pendientes en orden
+
+    En una base de datos al día solo cuesta la lectura de PRAGMA user_version.
+
+    Args:
+        db: Gestor de base de datos
+
+    Returns:
+        Número de migraciones aplicadas
+
+    Raises:
+        Exception: La que lance una migración que falla (esa migración se
+            revierte y las siguientes no se aplican)
+    """
+    version = obtener_version(db)
+    pendientes = [m for m in MIGRACIONES if m[0] > version]
+
+    if not pendientes:
+        return 0
+
+    print(f"\n🔄 Migrando base de datos: v{version} → v{VERSION_ACTUAL}")
+    conn = db.get_connection()
+
+    for numero, descripcion, migracion in pendientes:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            migracion(conn)
+            # user_version es transaccional: se confirma junto con la migración
+            conn.execute(f"PRAGMA user_version = {numero}")
+            conn.commit()
+        except BaseException as e:
+            # Cualquier fallo (también del código Python de la migración) debe
+            # cerrar la transacción: la conexión del pool se reutiliza en el hilo
+            conn.rollback()
+            print(f"  ⚠ Error en migración v{numero} ({descripcion}): {e!r}")
+            raise
+        print(f"  ✓ v{numero}: {descripcion}")
+
+    print("✅ Migración completada\n")
+    return len(pendientes)
+
+
+# ========== VERIFICACIÓN DE ÍNDICES ==========
+
+# Consultas que deben resolverse con un índice (SEARCH), sin recorrer la
+# tabla completa (SCAN) ni ordenar con un B-tree temporal
+CONSULTAS_INDEXADAS: Dict[str, Tuple[str, tuple]] = {
+    'receta base por id': (
+        registro_consultas.sql('receta_base_por_id'), (1,)
+    ),
+    'receta de usuario por id': (
+        registro_consultas.sql('receta_usuario_por_id'), (1,)
+    ),
+    'procesos de una receta base': (
+        registro_consultas.sql('procesos_receta_base'), (1,)
+    ),
+    'procesos de una receta de usuario': (
+        registro_consultas.sql('procesos_receta_usuario'), (1,)
+    ),
+    'ingredientes de una receta': (
+        "SELECT * FROM ingredientes WHERE receta_id = ? ORDER BY orden", (1,)
+    ),
+    'recetas favoritas': (
+        "SELECT * FROM recetas_usuario WHERE favorito = 1 ORDER BY nombre", ()
+    ),
+    'página de recetas base': (
+        "SELECT id, nombre FROM recetas_base WHERE (nombre, id) > (?, ?) ORDER BY nombre, id LIMIT 24",
+        ('M', 0)
+    ),
+    'página de recetas de usuario': (
+        "SELECT id, nombre FROM recetas_usuario WHERE (nombre, id) > (?, ?) ORDER BY nombre, id LIMIT 24",
+        ('M', 0)
+    ),
+    'página de favoritas': (
+        "SELECT id, nombre FROM recetas_usuario WHERE favorito = 1 AND (nombre, id) > (?, ?) "
+        "ORDER BY nombre, id LIMIT 24",
+        ('M', 0)
+    ),
+    'recetas base de menos de 10 minutos': (
+        "SELECT id, nombre FROM recetas_base WHERE duracion_total <= ?", (600,)
+    ),
+    'recetas de usuario por duración': (
+        "SELECT id, nombre FROM recetas_usuario WHERE duracion_total <= ? ORDER BY duracion_total",
+        (600,)
+    ),
+    'procesos personalizados activos': (
+        registro_consultas.sql('procesos_personalizados_activos'), ()
+    ),
+    'proceso personalizado por nombre': (
+        registro_consultas.sql('proceso_personalizado_por_nombre'), ('Batir',)
+    ),
+    'nombres de recetas base existentes': (
+        registro_consultas.sql('nombres_recetas_base_existentes'), ('["Gazpacho"]',)
+    ),
+    'nombres de recetas de usuario existentes': (
+        registro_consultas.sql('nombres_recetas_usuario_existentes'), ('["Gazpacho"]',)
+    ),
+    'resumen de recetas de usuario por id': (
+        "SELECT id, nombre FROM recetas_usuario WHERE id IN (SELECT value FROM json_each(?))",
+        ('[1, 2]',)
+    ),
+}
+
+
+def verificar_planes_consulta(db: DatabaseManager) -> Dict[str, List[str]]:
+    """
+    Comprueba con EXPLAIN QUERY PLAN que las consultas frecuentes usan índices
+
+    Args:
+        db: Gestor de base de datos (con las migraciones aplicadas)
+
+    Returns:
+        Diccionario consulta -> pasos del plan problemáticos
+        (vacío si todas las consultas usan sus índices)
+    """
+    conn = db.get_connection()
+    regresiones = {}
+
+    for nombre, (query, params) in CONSULTAS_INDEXADAS.items():
+        plan = [fila[3] for fila in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+        # El recorrido de json_each es el de la propia lista de parámetros
+        problemas = [
+            paso for paso in plan
+            if (paso.startswith('SCAN') and 'VIRTUAL TABLE' not in paso) or 'TEMP B-TREE' in paso
+        ]
+        if problemas:
+            regresiones[nombre] = problemas
+
+    return regresiones
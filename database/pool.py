@@ -0,0 +1,214 @@
+"""
+Pool de conexiones SQLite
+Mantiene una conexión persistente por hilo y base de datos
+"""
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Perfil de PRAGMAs aplicado una vez a cada conexión nueva
+# - WAL permite que los lectores sigan trabajando mientras otro cliente escribe
+# - synchronous=NORMAL es seguro con WAL y evita un fsync por commit
+PRAGMAS_POR_DEFECTO: Dict[str, object] = {
+    'busy_timeout': 5000,       # Milisegundos de espera ante un bloqueo (primero,
+                                # para que el resto de PRAGMAs también esperen)
+    'auto_vacuum': 'INCREMENTAL',
+                                # Antes que journal_mode: en una base de datos
+                                # nueva solo surte efecto si aún no tiene
+                                # cabecera. Las existentes se convierten al
+                                # arrancar con un VACUUM (ver
+                                # MantenimientoBD.convertir_a_vacuum_incremental)
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -8000,        # Negativo = KiB (8 MB de caché de páginas)
+    'mmap_size': 67108864,      # 64 MB de lectura mediante mmap
+    'temp_store': 'MEMORY',
+}
+
+# Sentencias compiladas que guarda cada conexión (sqlite3 guarda 128 por defecto).
+# Cubre las consultas del registro (database/consultas.py) y todas las
+# variantes del listado y la búsqueda sin que se expulsen unas a otras
+TAMANO_CACHE_SENTENCIAS = 256
+
+
+class PoolConexiones:
+    """
+    Pool de conexiones con una conexión de larga duración por hilo
+
+    SQLite no permite compartir una conexión entre hilos de forma segura,
+    así que cada hilo (UI, hilos del robot creados por ThreadingManager...)
+    obtiene su propia conexión, que se reutiliza en todas sus operaciones.
+    Las conexiones de hilos que ya han terminado se cierran automáticamente
+    y cerrar_todas() libera todo al apagar la aplicación.
+
+    Cada conexión nueva recibe el perfil de PRAGMAs configurado.
+    """
+
+    def __init__(self, pragmas: Optional[Dict[str, object]] = None):
+        """
+        Inicializa el pool vacío
+
+        Args:
+            pragmas: Perfil de PRAGMAs (por defecto PRAGMAS_POR_DEFECTO)
+        """
+        self._pragmas = dict(PRAGMAS_POR_DEFECTO if pragmas is None else pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._registro: List[Tuple[threading.Thread, str, sqlite3.Connection]] = []
+        self._generacion = 0
+        self._creadas = 0
+
+    def obtener_conexion(self, db_path: str) -> sqlite3.Connection:
+        """
+        Obtiene la conexión del hilo actual para la base de datos indicada
+
+        Args:
+            db_path: Ruta del fichero SQLite
+
+        Returns:
+            Conexión reutilizable (creada la primera vez que se pide)
+        """
+        conexiones = self._conexiones_hilo()
+        conn = conexiones.get(db_path)
+        if conn is None:
+            conn = self._crear_conexion(db_path)
+            conexiones[db_path] = conn
+        return conn
+
+    def abrir_conexion_dedicada(self, db_path: str) -> sqlite3.Connection:
+        """
+        Abre una conexión que no se comparte con el resto del hilo
+
+        Para operaciones que mantienen una transacción abierta mientras otro
+        código sigue usando la conexión del hilo (ej: una exportación en
+        streaming). Recibe el mismo perfil de PRAGMAs, pero no queda en el
+        pool: quien la abre debe cerrarla.
+
+        Args:
+            db_path: Ruta del fichero SQLite
+
+        Returns:
+            Conexión nueva, propiedad del llamador
+        """
+        return self._abrir(db_path)
+
+    @property
+    def pragmas(self) -> Dict[str, object]:
+        """Perfil de PRAGMAs activo"""
+        return dict(self._pragmas)
+
+    def configurar_pragmas(self, pragmas: Dict[str, object]):
+        """
+        Cambia el perfil de PRAGMAs
+
+        No cierra conexiones de otros hilos, que pueden estar usándolas:
+        cada hilo cierra la suya y abre una con el nuevo perfil la próxima
+        vez que pide conexión. Los PRAGMAs que exigen acceso exclusivo
+        (salir de journal_mode=WAL) necesitan además que no quede ninguna
+        conexión abierta: cerrar_todas() cuando ningún hilo las use.
+
+        Args:
+            pragmas: Diccionario nombre -> valor (ej: {'journal_mode': 'WAL'})
+        """
+        with self._lock:
+            self._pragmas = dict(pragmas)
+            self._generacion += 1
+
+    def liberar_conexiones_hilo(self):
+        """Cierra las conexiones del hilo actual (si las tiene)"""
+        hilo = threading.current_thread()
+        with self._lock:
+            propias = [entrada for entrada in self._registro if entrada[0] is hilo]
+            self._registro = [entrada for entrada in self._registro if entrada[0] is not hilo]
+        for _, _, conn in propias:
+            conn.close()
+        self._local.conexiones = {}
+
+    def cerrar_todas(self):
+        """Cierra todas las conexiones abiertas (apagado de la aplicación)"""
+        with self._lock:
+            registro = self._registro
+            self._registro = []
+            self._generacion += 1
+
+        for _, _, conn in registro:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"⚠️ Error al cerrar conexión: {e}")
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene información sobre el uso del pool
+
+        Returns:
+            Diccionario con conexiones abiertas y creadas en total
+        """
+        with self._lock:
+            return {'abiertas': len(self._registro), 'creadas': self._creadas}
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _conexiones_hilo(self) -> Dict[str, sqlite3.Connection]:
+        """Devuelve el diccionario de conexiones del hilo actual"""
+        local = self._local
+        if getattr(local, 'generacion', None) != self._generacion:
+            # Primera vez en este hilo, o el pool se cerró o cambió de perfil
+            # desde entonces: las conexiones anteriores del hilo ya no valen
+            self._cerrar_conexiones_hilo(getattr(local, 'conexiones', {}).values())
+            local.conexiones = {}
+            local.generacion = self._generacion
+        return local.conexiones
+
+    def _cerrar_conexiones_hilo(self, conexiones):
+        """Cierra conexiones del hilo actual y las quita del registro"""
+        cerrar = set(map(id, conexiones))
+        if not cerrar:
+            return
+        with self._lock:
+            self._registro = [entrada for entrada in self._registro
+                              if id(entrada[2]) not in cerrar]
+        for conn in conexiones:
+            conn.close()  # Sin efecto si cerrar_todas() ya la cerró
+
+    def _abrir(self, db_path: str) -> sqlite3.Connection:
+        """Abre una conexión con el perfil de PRAGMAs (sin registrarla)"""
+        # check_same_thread=False solo para poder cerrarla desde el hilo de apagado;
+        # cada conexión se usa únicamente desde el hilo que la creó
+        conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=TAMANO_CACHE_SENTENCIAS
+        )
+        conn.row_factory = sqlite3.Row
+        self._aplicar_pragmas(conn)
+        return conn
+
+    def _crear_conexion(self, db_path: str) -> sqlite3.Connection:
+        """Abre una nueva conexión y la registra para poder cerrarla después"""
+        conn = self._abrir(db_path)
+
+        with self._lock:
+            self._purgar_hilos_terminados()
+            self._registro.append((threading.current_thread(), db_path, conn))
+            self._creadas += 1
+
+        return conn
+
+    def _aplicar_pragmas(self, conn: sqlite3.Connection):
+        """Aplica el perfil de PRAGMAs a una conexión recién abierta"""
+        for nombre, valor in self._pragmas.items():
+            # Los PRAGMA no admiten parámetros enlazados
+            conn.execute(f"PRAGMA {nombre} = {valor}")
+
+    def _purgar_hilos_terminados(self):
+        """Cierra las conexiones de hilos que ya no existen (llamar con el lock)"""
+        vivas = []
+        for hilo, db_path, conn in self._registro:
+            if hilo.is_alive():
+                vivas.append((hilo, db_path, conn))
+            else:
+                conn.close()
+        self._registro = vivas
+
+
+# Pool compartido por todas las instancias de DatabaseManager
+pool_conexiones = PoolConexiones()
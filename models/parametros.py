@@ -0,0 +1,168 @@
+"""
+Parámetros de los procesos de cocina
+Convierte el texto libre de parámetros ("temperatura=100C, tiempo=5min")
+en un registro inmutable y tipado, una sola vez por texto distinto
+"""
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+from utils.exceptions import ParametrosInvalidosException
+
+TAMANO_CACHE_PARAMETROS = 4096
+
+_TIEMPO = re.compile(r'^(\d+(?:[.,]\d+)?)\s*(h|min|m|s|seg)?$', re.IGNORECASE)
+_PESO = re.compile(r'^(\d+(?:[.,]\d+)?)\s*(kg|g)?$', re.IGNORECASE)
+_SEGUNDOS_POR_UNIDAD = {'h': 3600, 'min': 60, 'm': 60, 's': 1, 'seg': 1}
+
+
+class Parametros(NamedTuple):
+    """
+    Parámetros ya interpretados de un proceso
+
+    Los campos que el texto no indica son None. Los valores que no se
+    pueden interpretar también quedan a None y se describen en `errores`.
+    """
+    texto: str                          # Texto original
+    velocidad: Optional[str] = None     # "alta", "media", "baja"...
+    temperatura: Optional[str] = None   # "100C", "media"...
+    tiempo: Optional[int] = None        # Segundos
+    peso: Optional[int] = None          # Gramos
+    ingrediente: Optional[str] = None   # Valor de ingrediente=
+    ingredientes: Optional[str] = None  # Texto libre sin clave ("tomates, pepino")
+    otros: Tuple[Tuple[str, str], ...] = ()   # Claves no reconocidas (procesos personalizados)
+    errores: Tuple[str, ...] = ()
+
+    @property
+    def valido(self) -> bool:
+        """Indica si todos los valores se pudieron interpretar"""
+        return not self.errores
+
+    def etiquetas(self) -> List[str]:
+        """Resumen corto de los parámetros para la interfaz"""
+        etiquetas = []
+        if self.temperatura:
+            etiquetas.append(f"🌡️ {self.temperatura}")
+        if self.velocidad:
+            etiquetas.append(f"⚙️ {self.velocidad}")
+        if self.tiempo:
+            etiquetas.append(f"⏱️ {_formatear_tiempo(self.tiempo)}")
+        if self.peso:
+            etiquetas.append(f"⚖️ {self.peso}g")
+        if self.ingrediente:
+            etiquetas.append(f"🥕 {self.ingrediente}")
+        if self.ingredientes:
+            etiquetas.append(f"🥕 {self.ingredientes}")
+        etiquetas.extend(f"{clave}: {valor}" for clave, valor in self.otros)
+        return etiquetas
+
+
+def _formatear_tiempo(segundos: int) -> str:
+    """120 -> '2min', 90 -> '90s'"""
+    if segundos % 60 == 0:
+        return f"{segundos // 60}min"
+    return f"{segundos}s"
+
+
+def _numero(texto: str) -> float:
+    return float(texto.replace(',', '.'))
+
+
+def _parsear_tiempo(valor: str) -> int:
+    """'5min' -> 300, '30s' -> 30, '1h' -> 3600; sin unidad son minutos"""
+    coincidencia = _TIEMPO.match(valor)
+    if not coincidencia:
+        raise ValueError(f"tiempo '{valor}' no válido")
+    unidad = (coincidencia.group(2) or 'min').lower()
+    return int(round(_numero(coincidencia.group(1)) * _SEGUNDOS_POR_UNIDAD[unidad]))
+
+
+def _parsear_peso(valor: str) -> int:
+    """'400g' -> 400, '1.5kg' -> 1500; sin unidad son gramos"""
+    coincidencia = _PESO.match(valor)
+    if not coincidencia:
+        raise ValueError(f"peso '{valor}' no válido")
+    factor = 1000 if (coincidencia.group(2) or '').lower() == 'kg' else 1
+    return int(round(_numero(coincidencia.group(1)) * factor))
+
+
+_CONVERSORES = {
+    'tiempo': _parsear_tiempo,
+    'peso': _parsear_peso,
+}
+_CLAVES_TEXTO = ('velocidad', 'temperatura', 'ingrediente')
+
+
+@lru_cache(maxsize=TAMANO_CACHE_PARAMETROS)
+def parsear_parametros(texto: str) -> Parametros:
+    """
+    Interpreta el texto de parámetros de un proceso
+
+    El resultado es inmutable y se cachea por texto: los cientos de
+    procesos de un catálogo comparten unos pocos textos distintos, así
+    que cada uno se interpreta una sola vez. Los valores inválidos no
+    lanzan excepción (el catálogo debe poder cargarse igualmente); se
+    avisa una vez por texto y quedan en Parametros.errores.
+
+    Args:
+        texto: Parámetros en formato "clave=valor, clave=valor" o texto libre
+
+    Returns:
+        Parametros con los campos reconocidos
+    """
+    texto = texto or ""
+    campos = {}
+    otros = []
+    libres = []
+    errores = []
+
+    for parte in texto.split(','):
+        parte = parte.strip()
+        if not parte:
+            continue
+        if '=' not in parte:
+            libres.append(parte)
+            continue
+
+        clave, valor = (p.strip() for p in parte.split('=', 1))
+        clave = clave.lower()
+        if clave in campos:
+            continue  # Vale la primera aparición
+        if clave in _CONVERSORES:
+            try:
+                campos[clave] = _CONVERSORES[clave](valor)
+            except ValueError as e:
+                campos[clave] = None
+                errores.append(str(e))
+        elif clave in _CLAVES_TEXTO:
+            campos[clave] = valor or None
+        else:
+            otros.append((clave, valor))
+
+    if errores:
+        print(f"⚠️ Parámetros '{texto}': {'; '.join(errores)}")
+
+    return Parametros(
+        texto=texto,
+        ingredientes=', '.join(libres) or None,
+        otros=tuple(otros),
+        errores=tuple(errores),
+        **campos
+    )
+
+
+def validar_parametros(texto: str) -> Parametros:
+    """
+    Interpreta el texto de parámetros y exige que sea válido
+
+    Para la entrada del usuario (asistente de recetas, editor de procesos).
+
+    Raises:
+        ParametrosInvalidosException: Si algún valor no se puede interpretar
+    """
+    parametros = parsear_parametros(texto)
+    if not parametros.valido:
+        raise ParametrosInvalidosException(
+            f"Parámetros inválidos: {'; '.join(parametros.errores)}"
+        )
+    return parametros
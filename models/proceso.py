@@ -1,18 +1,35 @@
 """
 Clase abstracta ProcesoCocina y definición de la interfaz
 """
+import asyncio
+import copy
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
-import time
+from typing import Callable, Generator, Optional, Tuple
+from models.parametros import Parametros, parsear_parametros
+from models.progreso import ModeloProgreso, factor_velocidad
+from models.reloj import Reloj, obtener_reloj
 
 class ProcesoCocina(ABC):
     """
     Clase abstracta que define la interfaz para todos los procesos de cocina.
     
     Implementa el patrón Template Method para la ejecución de procesos.
-    Todas las subclases deben implementar ejecutar() y proporcionar
-    información sobre duración y descripción.
+    Las subclases proporcionan duración, descripción, número de pasos
+    (PASOS) y los mensajes de inicio y fin; las que necesitan otra
+    secuencia sobrescriben _ejecucion().
+
+    La lógica de ejecución es un generador que produce las esperas (en
+    segundos de reloj) y recibe si la espera se interrumpió. ejecutar() lo
+    conduce bloqueando el hilo y ejecutar_async() con el bucle de asyncio,
+    así que las dos versiones emiten exactamente los mismos mensajes.
     """
+
+    PASOS = 10  # Actualizaciones de progreso durante la simulación
+
+    # Sin __dict__ por instancia: un catálogo grande crea muchos procesos
+    __slots__ = ('_parametros', '_params', '_completado', '_detenido', '_velocidad',
+                 '_velocidad_modificada', '_aviso', '_aviso_async', '_progreso')
     
     def __init__(self, parametros: str = ""):
         """
@@ -22,20 +39,55 @@ class ProcesoCocina(ABC):
             parametros: Parámetros específicos del proceso (ej: "velocidad=alta")
         """
         self._parametros = parametros
+        self._params = parsear_parametros(parametros)  # Interpretados una vez (y cacheados)
         self._completado = False
         self._detenido = False
         self._velocidad = 5  # Velocidad por defecto (1-10)
         self._velocidad_modificada = False
+        # Despierta la espera en curso al detener o cambiar la velocidad.
+        # Se crea en la primera ejecución: la mayoría de procesos cargados
+        # nunca se ejecutan
+        self._aviso: Optional[threading.Event] = None
+        # (bucle, evento) mientras el proceso se ejecuta con ejecutar_async
+        self._aviso_async: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+        self._progreso: Optional[ModeloProgreso] = None
     
-    @abstractmethod
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
+    def ejecutar(self, callback: Optional[Callable[[str], None]] = None) -> bool:
         """
-        Ejecuta el proceso de cocina.
-        
+        Ejecuta el proceso de cocina bloqueando el hilo mientras dura
+
         Args:
             callback: Función opcional para enviar mensajes de estado
+
+        Returns:
+            True si se completó, False si fue detenido
         """
-        pass
+        reloj = obtener_reloj()
+        return self._conducir(reloj, self._ejecucion(reloj, callback))
+
+    async def ejecutar_async(self, callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Ejecuta el proceso de cocina en el bucle de asyncio
+
+        Las esperas son asíncronas, así que un solo hilo puede ejecutar
+        muchos procesos a la vez. Cancelar la tarea detiene el proceso.
+
+        Args:
+            callback: Función opcional para enviar mensajes de estado
+
+        Returns:
+            True si se completó, False si fue detenido
+        """
+        reloj = obtener_reloj()
+        return await self._conducir_async(reloj, self._ejecucion(reloj, callback))
+
+    def mensaje_inicio(self) -> str:
+        """Mensaje que se envía al empezar el proceso"""
+        return f"▶️ {self.get_descripcion()}..."
+
+    def mensaje_fin(self) -> str:
+        """Mensaje que se envía al completar el proceso"""
+        return f"✓ {self.get_descripcion()} completado"
     
     @abstractmethod
     def get_duracion(self) -> int:
@@ -52,6 +104,16 @@ class ProcesoCocina(ABC):
         """Obtiene los parámetros del proceso"""
         return self._parametros
 
+    @property
+    def parametros_parseados(self) -> Parametros:
+        """Parámetros interpretados (velocidad, temperatura, tiempo, peso, ingredientes)"""
+        return self._params
+
+    @property
+    def progreso(self) -> Optional[ModeloProgreso]:
+        """Modelo de progreso de la simulación en curso o de la última (None si no ha empezado)"""
+        return self._progreso
+
     @property
     def velocidad(self) -> int:
         """Obtiene la velocidad actual del proceso (1-10)"""
@@ -73,6 +135,9 @@ class ProcesoCocina(ABC):
         velocidad_anterior = self._velocidad
         self._velocidad = nueva_velocidad
         self._velocidad_modificada = True
+        if self._progreso:
+            self._progreso.cambiar_velocidad(nueva_velocidad)
+        self._avisar()
         return velocidad_anterior
 
     def obtener_factor_velocidad(self) -> float:
@@ -80,16 +145,16 @@ class ProcesoCocina(ABC):
         Calcula el factor de tiempo basado en la velocidad
 
         Returns:
-            Factor multiplicador: velocidad 1 = 2x tiempo, velocidad 10 = 0.5x tiempo
+            Factor multiplicador de models.progreso.factor_velocidad
         """
-        # Velocidad 1 (muy lento): factor 2.0 (el doble de tiempo)
-        # Velocidad 5 (normal): factor 1.0 (tiempo normal)
-        # Velocidad 10 (muy rápido): factor 0.5 (mitad del tiempo)
-        return 2.0 - (self._velocidad - 1) * 0.15
+        return factor_velocidad(self._velocidad)
 
     def detener(self):
-        """Marca el proceso para detención"""
+        """Marca el proceso para detención y despierta la espera en curso"""
         self._detenido = True
+        if self._progreso:
+            self._progreso.detener()
+        self._avisar()
     
     def esta_detenido(self) -> bool:
         """Verifica si el proceso está detenido"""
@@ -102,46 +167,158 @@ class ProcesoCocina(ABC):
     def marcar_completado(self):
         """Marca el proceso como completado"""
         self._completado = True
-    
-    def simular_proceso(self, duracion: int,
-                       callback: Optional[Callable[[str], None]] = None,
-                       pasos: int = 10):
+
+    def reiniciar(self):
         """
-        Simula la ejecución de un proceso con actualizaciones periódicas
+        Restablece el estado de ejecución (completado, detenido y velocidad)
 
-        Args:
-            duracion: Duración total en segundos (se ajusta según velocidad)
-            callback: Función para enviar actualizaciones
-            pasos: Número de actualizaciones durante el proceso
+        Un mismo proceso puede ejecutarse varias veces (ej: repetir la receta
+        cargada), así que debe reiniciarse antes de volver a ejecutarse.
         """
-        # Aplicar factor de velocidad
-        factor_velocidad = self.obtener_factor_velocidad()
-        duracion_ajustada = duracion * factor_velocidad
-        tiempo_por_paso = duracion_ajustada / pasos
+        self._completado = False
+        self._detenido = False
+        self._velocidad = 5
+        self._velocidad_modificada = False
+        self._limpiar_aviso()
+        self._progreso = None
 
-        velocidad_anterior = self._velocidad
+    def copiar(self) -> 'ProcesoCocina':
+        """
+        Copia del proceso con su configuración y sin estado de ejecución
 
-        for i in range(pasos):
+        Los procesos de la caché del catálogo son compartidos: se ejecuta
+        siempre una copia para no tocar el estado de otra ejecución.
+        """
+        copia = copy.copy(self)
+        copia._aviso = None
+        copia._aviso_async = None
+        copia.reiniciar()
+        return copia
+
+    # ========== EJECUCIÓN (GENERADORES Y CONDUCTORES) ==========
+
+    def _avisar(self):
+        """Despierta la espera en curso, sea de un hilo o del bucle de asyncio"""
+        aviso = self._aviso
+        if aviso is not None:
+            aviso.set()
+        aviso_async = self._aviso_async
+        if aviso_async is not None:
+            bucle, evento = aviso_async
+            bucle.call_soon_threadsafe(evento.set)
+
+    def _limpiar_aviso(self):
+        """Limpia el aviso antes de mirar las banderas de detención y velocidad"""
+        aviso = self._aviso
+        if aviso is not None:
+            aviso.clear()
+        aviso_async = self._aviso_async
+        if aviso_async is not None:
+            aviso_async[1].clear()
+
+    def _conducir(self, reloj: Reloj, ejecucion: Generator) -> bool:
+        """Ejecuta el generador esperando con el reloj en el hilo actual"""
+        if self._aviso is None:
+            self._aviso = threading.Event()
+        aviso = self._aviso
+        try:
+            espera = next(ejecucion)
+            while True:
+                espera = ejecucion.send(reloj.esperar(espera, aviso))
+        except StopIteration as fin:
+            return fin.value
+
+    async def _conducir_async(self, reloj: Reloj, ejecucion: Generator) -> bool:
+        """Ejecuta el generador esperando con el reloj en el bucle de asyncio"""
+        evento = asyncio.Event()
+        self._aviso_async = (asyncio.get_running_loop(), evento)
+        try:
+            espera = next(ejecucion)
+            while True:
+                espera = ejecucion.send(await reloj.esperar_async(espera, evento))
+        except StopIteration as fin:
+            return fin.value
+        except asyncio.CancelledError:
+            self.detener()
+            ejecucion.close()
+            raise
+        finally:
+            self._aviso_async = None
+
+    def _ejecucion(self, reloj: Reloj,
+                   callback: Optional[Callable[[str], None]]) -> Generator[float, bool, bool]:
+        """
+        Secuencia del proceso: mensaje de inicio, simulación y mensaje de fin
+
+        Produce las esperas en segundos de reloj y devuelve True si se
+        completó. Las subclases con otra secuencia (Pesar) la sobrescriben.
+        """
+        if callback:
+            callback(self.mensaje_inicio())
+
+        exito = yield from self._simulacion(reloj, self.get_duracion(), callback, self.PASOS)
+
+        if exito and callback:
+            callback(self.mensaje_fin())
+
+        return exito
+
+    def _espera(self, reloj: Reloj, segundos: float) -> Generator[float, bool, bool]:
+        """
+        Espera `segundos` de reloj sin tener en cuenta la velocidad
+
+        Los cambios de velocidad no acortan la espera; la detención sí, al
+        instante. Devuelve True si se agotó el tiempo, False si el proceso
+        se detuvo.
+        """
+        fin = reloj.ahora() + segundos
+        while True:
+            self._limpiar_aviso()
             if self._detenido:
-                if callback:
-                    callback("⚠️ Proceso detenido por el usuario")
                 return False
+            if not (yield fin - reloj.ahora()):
+                return True
+
+    def _simulacion(self, reloj: Reloj, duracion: float,
+                    callback: Optional[Callable[[str], None]],
+                    pasos: int) -> Generator[float, bool, bool]:
+        """
+        Simulación con actualizaciones periódicas (ver simular_proceso)
 
-            time.sleep(tiempo_por_paso)
+        Devuelve True si se completó, False si fue detenido.
+        """
+        modelo = ModeloProgreso(duracion, self._velocidad, reloj=reloj)
+        self._progreso = modelo
+        velocidad_anterior = self._velocidad
 
-            # Detectar cambio de velocidad y recalcular
-            if self._velocidad != velocidad_anterior:
-                if callback:
-                    callback(f"   ⚡ Velocidad ajustada: {velocidad_anterior} → {self._velocidad}")
+        for i in range(pasos):
+            # Trabajo (segundos de duración base) al final de este paso
+            objetivo = duracion * (i + 1) / pasos
+            while True:
+                # Limpiar el aviso antes de mirar las banderas: un aviso
+                # posterior hará que la siguiente espera vuelva al instante
+                self._limpiar_aviso()
 
-                # Recalcular tiempo restante con nueva velocidad
-                pasos_restantes = pasos - (i + 1)
-                if pasos_restantes > 0:
-                    factor_velocidad = self.obtener_factor_velocidad()
-                    tiempo_base_restante = (duracion / pasos) * pasos_restantes
-                    tiempo_por_paso = (tiempo_base_restante * factor_velocidad) / pasos_restantes
+                if self._detenido:
+                    if callback:
+                        callback("⚠️ Proceso detenido por el usuario")
+                    return False
 
-                velocidad_anterior = self._velocidad
+                # El modelo ya recalculó el resto con la nueva velocidad
+                if self._velocidad != velocidad_anterior:
+                    if callback:
+                        callback(f"   ⚡ Velocidad ajustada: {velocidad_anterior} → {self._velocidad}")
+                    velocidad_anterior = self._velocidad
+
+                instante = modelo.instante_trabajo(objetivo)
+                if instante is None:
+                    # El modelo se detuvo entre la comprobación y aquí: detener()
+                    # es definitivo, así que no hace falta esperar a la bandera
+                    if callback:
+                        callback("⚠️ Proceso detenido por el usuario")
+                    return False
+                if not (yield instante - reloj.ahora()):
+                    break
 
             if callback:
                 progreso = ((i + 1) / pasos) * 100
@@ -150,6 +327,38 @@ class ProcesoCocina(ABC):
 
         self.marcar_completado()
         return True
+
+    def simular_proceso(self, duracion: int,
+                       callback: Optional[Callable[[str], None]] = None,
+                       pasos: int = 10) -> bool:
+        """
+        Simula la ejecución de un proceso con actualizaciones periódicas
+
+        Las esperas se piden al reloj activo (models.reloj), así que la
+        misma simulación puede durar el tiempo real, acelerarse o ser
+        instantánea con un RelojVirtual. detener() y ajustar_velocidad()
+        despiertan la espera en curso, de modo que surten efecto al
+        momento y no al final del paso. El avance sigue el modelo de
+        progreso del proceso (propiedad progreso), el mismo que consulta
+        la interfaz.
+
+        Args:
+            duracion: Duración total en segundos (se ajusta según velocidad)
+            callback: Función para enviar actualizaciones
+            pasos: Número de actualizaciones durante el proceso
+
+        Returns:
+            True si se completó, False si fue detenido
+        """
+        reloj = obtener_reloj()
+        return self._conducir(reloj, self._simulacion(reloj, duracion, callback, pasos))
+
+    async def simular_proceso_async(self, duracion: int,
+                                    callback: Optional[Callable[[str], None]] = None,
+                                    pasos: int = 10) -> bool:
+        """Versión para asyncio de simular_proceso"""
+        reloj = obtener_reloj()
+        return await self._conducir_async(reloj, self._simulacion(reloj, duracion, callback, pasos))
     
     def __str__(self) -> str:
         """Representación en string del proceso"""
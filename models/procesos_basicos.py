@@ -3,25 +3,24 @@ Implementaciones concretas de procesos de cocina
 Cada clase hereda de ProcesoCocina e implementa un proceso específico
 """
 from models.proceso import ProcesoCocina
-from typing import Callable, Optional
+from models.reloj import Reloj
+from typing import Callable, Generator, Optional
 
 class Picar(ProcesoCocina):
     """Proceso de picado de ingredientes"""
+
+    PASOS = 5
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "ingredientes varios", duracion: int = None):
         super().__init__(parametros)
         self._duracion = duracion if duracion else 2
     
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🔪 Iniciando picado: {self._parametros}")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=5)
-        
-        if exito and callback:
-            callback(f"✓ Picado completado: ingredientes finamente cortados")
-        
-        return exito
+    def mensaje_inicio(self) -> str:
+        return f"🔪 Iniciando picado: {self._parametros}"
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Picado completado: ingredientes finamente cortados"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -32,21 +31,19 @@ class Picar(ProcesoCocina):
 
 class Rallar(ProcesoCocina):
     """Proceso de rallado de alimentos"""
+
+    PASOS = 5
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "ingredientes", duracion: int = None):
         super().__init__(parametros)
         self._duracion = duracion if duracion else 2
     
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🧀 Iniciando rallado: {self._parametros}")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=5)
-        
-        if exito and callback:
-            callback(f"✓ Rallado completado")
-        
-        return exito
+    def mensaje_inicio(self) -> str:
+        return f"🧀 Iniciando rallado: {self._parametros}"
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Rallado completado"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -57,35 +54,20 @@ class Rallar(ProcesoCocina):
 
 class Triturar(ProcesoCocina):
     """Proceso de triturado a alta velocidad"""
+
+    PASOS = 8
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "velocidad=media", duracion: int = None):
         super().__init__(parametros)
-        # Si se especifica duración, usarla; si no, intentar extraerla de parámetros o usar default
-        if duracion:
-            self._duracion = duracion
-        elif "tiempo=" in parametros:
-            try:
-                tiempo_str = parametros.split("tiempo=")[1].split(",")[0].replace("min", "")
-                self._duracion = int(tiempo_str) * 60
-            except:
-                self._duracion = 4
-        else:
-            self._duracion = 4
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        velocidad = "media"
-        if "velocidad=" in self._parametros:
-            velocidad = self._parametros.split("velocidad=")[1].split(",")[0]
-        
-        if callback:
-            callback(f"⚡ Triturando a velocidad {velocidad}...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=8)
-        
-        if exito and callback:
-            callback(f"✓ Triturado completado: textura homogénea")
-        
-        return exito
+        # Duración indicada, o el tiempo= de los parámetros, o la de por defecto
+        self._duracion = duracion or self._params.tiempo or 4
+    
+    def mensaje_inicio(self) -> str:
+        return f"⚡ Triturando a velocidad {self._params.velocidad or 'media'}..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Triturado completado: textura homogénea"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -96,21 +78,19 @@ class Triturar(ProcesoCocina):
 
 class Trocear(ProcesoCocina):
     """Proceso de troceado en cubos o piezas"""
+
+    PASOS = 6
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "ingredientes", duracion: int = None):
         super().__init__(parametros)
         self._duracion = duracion if duracion else 3
     
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🔲 Troceando: {self._parametros}")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=6)
-        
-        if exito and callback:
-            callback(f"✓ Troceado completado: piezas uniformes")
-        
-        return exito
+    def mensaje_inicio(self) -> str:
+        return f"🔲 Troceando: {self._parametros}"
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Troceado completado: piezas uniformes"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -121,31 +101,20 @@ class Trocear(ProcesoCocina):
 
 class Amasar(ProcesoCocina):
     """Proceso de amasado para masas y panes"""
+
+    PASOS = 10
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "velocidad=baja", duracion: int = None):
         super().__init__(parametros)
-        # Si se especifica duración, usarla; si no, intentar extraerla de parámetros o usar default
-        if duracion:
-            self._duracion = duracion
-        elif "tiempo=" in parametros:
-            try:
-                tiempo_str = parametros.split("tiempo=")[1].split(",")[0].replace("min", "")
-                self._duracion = int(tiempo_str) * 60
-            except:
-                self._duracion = 10
-        else:
-            self._duracion = 10
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🥖 Amasando masa ({self._parametros})...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=10)
-        
-        if exito and callback:
-            callback(f"✓ Amasado completado: masa lista")
-        
-        return exito
+        # Duración indicada, o el tiempo= de los parámetros, o la de por defecto
+        self._duracion = duracion or self._params.tiempo or 10
+    
+    def mensaje_inicio(self) -> str:
+        return f"🥖 Amasando masa ({self._parametros})..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Amasado completado: masa lista"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -156,35 +125,20 @@ class Amasar(ProcesoCocina):
 
 class Hervir(ProcesoCocina):
     """Proceso de cocción por ebullición"""
+
+    PASOS = 12
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "temperatura=100C", duracion: int = None):
         super().__init__(parametros)
-        # Si se especifica duración, usarla; si no, intentar extraerla de parámetros o usar default
-        if duracion:
-            self._duracion = duracion
-        elif "tiempo=" in parametros:
-            try:
-                tiempo_str = parametros.split("tiempo=")[1].split(",")[0].replace("min", "")
-                self._duracion = int(tiempo_str) * 60
-            except:
-                self._duracion = 15
-        else:
-            self._duracion = 15
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        temp = "100°C"
-        if "temperatura=" in self._parametros:
-            temp = self._parametros.split("temperatura=")[1].split(",")[0]
-        
-        if callback:
-            callback(f"🔥 Hirviendo a {temp}...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=12)
-        
-        if exito and callback:
-            callback(f"✓ Cocción completada")
-        
-        return exito
+        # Duración indicada, o el tiempo= de los parámetros, o la de por defecto
+        self._duracion = duracion or self._params.tiempo or 15
+    
+    def mensaje_inicio(self) -> str:
+        return f"🔥 Hirviendo a {self._params.temperatura or '100°C'}..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Cocción completada"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -195,30 +149,19 @@ class Hervir(ProcesoCocina):
 
 class Sofreir(ProcesoCocina):
     """Proceso de sofrito con aceite"""
+
+    PASOS = 8
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "temperatura=media", duracion: int = None):
         super().__init__(parametros)
-        if duracion:
-            self._duracion = duracion
-        elif "tiempo=" in parametros:
-            try:
-                tiempo_str = parametros.split("tiempo=")[1].split(",")[0].replace("min", "")
-                self._duracion = int(tiempo_str) * 60
-            except:
-                self._duracion = 5
-        else:
-            self._duracion = 5
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🍳 Sofriendo ingredientes ({self._parametros})...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=8)
-        
-        if exito and callback:
-            callback(f"✓ Sofrito completado: ingredientes dorados")
-        
-        return exito
+        self._duracion = duracion or self._params.tiempo or 5
+    
+    def mensaje_inicio(self) -> str:
+        return f"🍳 Sofriendo ingredientes ({self._parametros})..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Sofrito completado: ingredientes dorados"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -229,30 +172,19 @@ class Sofreir(ProcesoCocina):
 
 class Vapor(ProcesoCocina):
     """Proceso de cocción al vapor"""
+
+    PASOS = 10
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "temperatura=100C", duracion: int = None):
         super().__init__(parametros)
-        if duracion:
-            self._duracion = duracion
-        elif "tiempo=" in parametros:
-            try:
-                tiempo_str = parametros.split("tiempo=")[1].split(",")[0].replace("min", "")
-                self._duracion = int(tiempo_str) * 60
-            except:
-                self._duracion = 15
-        else:
-            self._duracion = 15
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"💨 Cocinando al vapor ({self._parametros})...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=10)
-        
-        if exito and callback:
-            callback(f"✓ Cocción al vapor completada: alimentos tiernos")
-        
-        return exito
+        self._duracion = duracion or self._params.tiempo or 15
+    
+    def mensaje_inicio(self) -> str:
+        return f"💨 Cocinando al vapor ({self._parametros})..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Cocción al vapor completada: alimentos tiernos"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -263,21 +195,19 @@ class Vapor(ProcesoCocina):
 
 class PrepararPure(ProcesoCocina):
     """Proceso especializado para preparar purés"""
+
+    PASOS = 6
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "velocidad=media", duracion: int = None):
         super().__init__(parametros)
         self._duracion = duracion if duracion else 3
     
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"🥔 Preparando puré ({self._parametros})...")
-        
-        exito = self.simular_proceso(self._duracion, callback, pasos=6)
-        
-        if exito and callback:
-            callback(f"✓ Puré listo: textura cremosa perfecta")
-        
-        return exito
+    def mensaje_inicio(self) -> str:
+        return f"🥔 Preparando puré ({self._parametros})..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ Puré listo: textura cremosa perfecta"
     
     def get_duracion(self) -> int:
         return self._duracion
@@ -288,61 +218,50 @@ class PrepararPure(ProcesoCocina):
 
 class Pesar(ProcesoCocina):
     """Proceso de pesaje con báscula integrada"""
+
+    __slots__ = ('_duracion',)
     
     def __init__(self, parametros: str = "ingrediente=sin especificar", duracion: int = None):
         super().__init__(parametros)
         self._duracion = duracion if duracion else 2
-        
-        # Extraer peso objetivo de parámetros
-        self._peso_objetivo = None
-        if "peso=" in parametros:
-            try:
-                peso_str = parametros.split("peso=")[1].split(",")[0].replace("g", "").replace("kg", "")
-                self._peso_objetivo = int(peso_str)
-            except:
-                self._peso_objetivo = None
-    
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        # Extraer nombre del ingrediente
-        ingrediente = "ingrediente"
-        if "ingrediente=" in self._parametros:
-            ingrediente = self._parametros.split("ingrediente=")[1].split(",")[0]
+    
+    def _ejecucion(self, reloj: Reloj,
+                   callback: Optional[Callable[[str], None]]) -> Generator[float, bool, bool]:
+        ingrediente = self._ingrediente
+        peso_objetivo = self._params.peso
         
         if callback:
             callback(f"⚖️ Iniciando pesaje de {ingrediente}...")
-            if self._peso_objetivo:
-                callback(f"   Peso objetivo: {self._peso_objetivo}g")
+            if peso_objetivo:
+                callback(f"   Peso objetivo: {peso_objetivo}g")
             callback(f"   Calibrando báscula...")
         
         # Simular proceso de pesaje
         import random
-        import time
         
         pasos_pesaje = 5
         tiempo_por_paso = self._duracion / pasos_pesaje
         
         for i in range(pasos_pesaje):
-            if self._detenido:
+            if not (yield from self._espera(reloj, tiempo_por_paso)):
                 if callback:
                     callback("⚠️ Pesaje detenido por el usuario")
                 return False
             
-            time.sleep(tiempo_por_paso)
-            
             if callback:
                 if i == 0:
                     callback("   Tara establecida a 0g")
                 elif i < pasos_pesaje - 1:
                     # Simular lectura de peso en progreso
-                    if self._peso_objetivo:
-                        peso_actual = int(self._peso_objetivo * (i / (pasos_pesaje - 1)))
-                        callback(f"   Peso actual: {peso_actual}g / {self._peso_objetivo}g")
+                    if peso_objetivo:
+                        peso_actual = int(peso_objetivo * (i / (pasos_pesaje - 1)))
+                        callback(f"   Peso actual: {peso_actual}g / {peso_objetivo}g")
                     else:
                         callback(f"   Añadiendo {ingrediente}...")
                 else:
                     # Peso final
-                    if self._peso_objetivo:
-                        peso_final = self._peso_objetivo
+                    if peso_objetivo:
+                        peso_final = peso_objetivo
                         callback(f"   ✓ Peso alcanzado: {peso_final}g")
                     else:
                         peso_final = random.randint(50, 500)
@@ -359,14 +278,21 @@ class Pesar(ProcesoCocina):
         return self._duracion
     
     def get_descripcion(self) -> str:
-        if self._peso_objetivo:
-            return f"Pesar ({self._peso_objetivo}g de {self._parametros.split('ingrediente=')[1].split(',')[0] if 'ingrediente=' in self._parametros else 'ingrediente'})"
+        if self._params.peso:
+            return f"Pesar ({self._params.peso}g de {self._ingrediente})"
         return f"Pesar {self._parametros}"
 
+    @property
+    def _ingrediente(self) -> str:
+        return self._params.ingrediente or "ingrediente"
+
 
 class ProcesoPersonalizado(ProcesoCocina):
     """Clase genérica para procesos personalizados creados por el usuario"""
 
+    PASOS = 8
+    __slots__ = ('_nombre', '_emoji', '_duracion', '_descripcion')
+
     def __init__(self, nombre: str, emoji: str, duracion_base: int,
                  parametros: str = "", descripcion: str = ""):
         super().__init__(parametros)
@@ -375,16 +301,11 @@ class ProcesoPersonalizado(ProcesoCocina):
         self._duracion = duracion_base
         self._descripcion = descripcion
 
-    def ejecutar(self, callback: Optional[Callable[[str], None]] = None):
-        if callback:
-            callback(f"{self._emoji} Iniciando {self._nombre}...")
-
-        exito = self.simular_proceso(self._duracion, callback, pasos=8)
-
-        if exito and callback:
-            callback(f"✓ {self._nombre} completado")
-
-        return exito
+    def mensaje_inicio(self) -> str:
+        return f"{self._emoji} Iniciando {self._nombre}..."
+    
+    def mensaje_fin(self) -> str:
+        return f"✓ {self._nombre} completado"
 
     def get_duracion(self) -> int:
         return self._duracion
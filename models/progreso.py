@@ -0,0 +1,166 @@
+"""
+Modelo de progreso de los procesos de cocina
+Progreso lineal a tramos compartido por el proceso en ejecución y la interfaz
+"""
+import bisect
+import threading
+from typing import List, NamedTuple, Optional
+
+from models.reloj import Reloj, obtener_reloj
+
+VELOCIDAD_NORMAL = 5
+
+
+def factor_velocidad(velocidad: int) -> float:
+    """
+    Factor de tiempo de una velocidad (1-10)
+
+    Es la única fórmula de velocidad: la usan ProcesoCocina y la interfaz.
+
+    Returns:
+        Segundos reales por segundo de duración base: velocidad 1 = 2.0,
+        velocidad 10 = 0.65
+    """
+    return 2.0 - (velocidad - 1) * 0.15
+
+
+class Tramo(NamedTuple):
+    """Intervalo con velocidad constante (velocidad None = detenido)"""
+    inicio: float               # Instante del reloj en que empieza
+    trabajo: float              # Segundos de duración base completados al empezar
+    velocidad: Optional[int]
+    factor: float               # factor_velocidad(velocidad); 0 si está detenido
+
+
+class ModeloProgreso:
+    """
+    Progreso de un proceso como función lineal a tramos del tiempo
+
+    En lugar de acumular progreso tick a tick, guarda un tramo por cada
+    cambio de velocidad (instante, trabajo hecho y factor). El progreso y
+    el tiempo restante en cualquier instante se calculan en O(1) desde el
+    último tramo, así que el proceso en ejecución y cualquier número de
+    observadores de la interfaz consultan el mismo modelo sin desviarse.
+
+    Los cambios se hacen con un lock; las consultas no lo necesitan porque
+    solo leen tramos ya añadidos.
+    """
+
+    def __init__(self, duracion: float, velocidad: int = VELOCIDAD_NORMAL,
+                 inicio: Optional[float] = None, reloj: Optional[Reloj] = None):
+        """
+        Args:
+            duracion: Duración base del proceso en segundos (a velocidad normal)
+            velocidad: Velocidad inicial (1-10)
+            inicio: Instante de inicio (por defecto, ahora según el reloj)
+            reloj: Reloj con el que se miden los instantes (por defecto, el activo)
+        """
+        self._duracion = duracion
+        self._reloj = reloj or obtener_reloj()
+        inicio = self._reloj.ahora() if inicio is None else inicio
+        self._tramos: List[Tramo] = [Tramo(inicio, 0.0, velocidad, factor_velocidad(velocidad))]
+        self._instantes: List[float] = [inicio]
+        self._lock = threading.Lock()
+
+    @property
+    def duracion(self) -> float:
+        """Duración base en segundos"""
+        return self._duracion
+
+    @property
+    def velocidad(self) -> Optional[int]:
+        """Velocidad actual (None si está detenido)"""
+        return self._tramos[-1].velocidad
+
+    @property
+    def detenido(self) -> bool:
+        """Indica si el proceso se detuvo"""
+        return self._tramos[-1].velocidad is None
+
+    @property
+    def tramos(self) -> List[Tramo]:
+        """Copia de los tramos registrados"""
+        return list(self._tramos)
+
+    def _tramo_en(self, t: float) -> Tramo:
+        """Tramo vigente en el instante t"""
+        tramo = self._tramos[-1]
+        if t >= tramo.inicio:
+            return tramo
+        indice = bisect.bisect_right(self._instantes, t) - 1
+        return self._tramos[max(indice, 0)]
+
+    def _ahora(self, t: Optional[float]) -> float:
+        return self._reloj.ahora() if t is None else t
+
+    def trabajo(self, t: Optional[float] = None) -> float:
+        """Segundos de duración base completados en el instante t (por defecto, ahora)"""
+        t = self._ahora(t)
+        tramo = self._tramo_en(t)
+        if tramo.factor == 0:
+            return tramo.trabajo
+        hecho = tramo.trabajo + max(t - tramo.inicio, 0.0) / tramo.factor
+        return min(hecho, self._duracion)
+
+    def progreso(self, t: Optional[float] = None) -> float:
+        """Porcentaje completado (0-100) en el instante t"""
+        if self._duracion <= 0:
+            return 100.0
+        return self.trabajo(t) / self._duracion * 100
+
+    def completado(self, t: Optional[float] = None) -> bool:
+        """Indica si el proceso había terminado en el instante t"""
+        return self.trabajo(t) >= self._duracion
+
+    def instante_trabajo(self, trabajo: float) -> Optional[float]:
+        """
+        Instante en que se alcanzan `trabajo` segundos de duración base
+
+        Se calcula con la velocidad actual (el último tramo).
+
+        Returns:
+            Instante del reloj, o None si el proceso está detenido
+        """
+        tramo = self._tramos[-1]
+        if tramo.factor == 0:
+            return None
+        return tramo.inicio + (trabajo - tramo.trabajo) * tramo.factor
+
+    def fin(self) -> Optional[float]:
+        """Instante estimado de fin con la velocidad actual (None si está detenido)"""
+        return self.instante_trabajo(self._duracion)
+
+    def restante(self, t: Optional[float] = None) -> Optional[float]:
+        """Segundos de reloj que faltan en el instante t (None si está detenido)"""
+        t = self._ahora(t)
+        fin = self.fin()
+        if fin is None:
+            return None
+        return max(fin - t, 0.0)
+
+    def cambiar_velocidad(self, velocidad: int, t: Optional[float] = None):
+        """
+        Registra un cambio de velocidad en el instante t (por defecto, ahora)
+
+        No tiene efecto si el proceso ya se detuvo.
+        """
+        self._nuevo_tramo(velocidad, factor_velocidad(velocidad), t)
+
+    def detener(self, t: Optional[float] = None):
+        """Congela el progreso en el instante t (por defecto, ahora)"""
+        self._nuevo_tramo(None, 0.0, t)
+
+    def _nuevo_tramo(self, velocidad: Optional[int], factor: float, t: Optional[float]):
+        with self._lock:
+            ultimo = self._tramos[-1]
+            if ultimo.velocidad is None:
+                return
+            t = max(self._ahora(t), ultimo.inicio)
+            # Primero el tramo y luego su instante: un lector que encuentre
+            # el instante siempre tiene el tramo correspondiente
+            self._tramos.append(Tramo(t, self.trabajo(t), velocidad, factor))
+            self._instantes.append(t)
+
+    def __repr__(self) -> str:
+        return (f"ModeloProgreso(duracion={self._duracion}, velocidad={self.velocidad}, "
+                f"tramos={len(self._tramos)})")
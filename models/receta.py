@@ -13,9 +13,12 @@ class Receta:
     Una receta es una secuencia de procesos que se ejecutan
     en orden para crear un plato.
     """
+
+    # Sin __dict__ por instancia, como ResumenReceta
+    __slots__ = ('_id', '_nombre', '_descripcion', '_es_base', '_procesos', '_favorito')
     
     def __init__(self, id: int, nombre: str, descripcion: str = "",
-                 es_base: bool = False):
+                 es_base: bool = False, favorito: bool = False):
         """
         Inicializa una receta
 
@@ -24,13 +27,14 @@ class Receta:
             nombre: Nombre de la receta
             descripcion: Descripción opcional
             es_base: Si es una receta preinstalada (True) o de usuario (False)
+            favorito: Si está marcada como favorita
         """
         self._id = id
         self._nombre = nombre
         self._descripcion = descripcion
         self._es_base = es_base
         self._procesos: List[ProcesoCocina] = []
-        self._favorito = False  # Nuevo en v2.0
+        self._favorito = favorito  # Nuevo en v2.0
     
     @property
     def id(self) -> int:
@@ -76,6 +80,15 @@ class Receta:
         """
         self._procesos.append(proceso)
     
+    def establecer_procesos(self, procesos: List[ProcesoCocina]):
+        """
+        Sustituye los procesos de la receta por una lista ya construida
+
+        Args:
+            procesos: Procesos en orden de ejecución (la lista pasa a ser de la receta)
+        """
+        self._procesos = procesos
+
     def cargar_procesos_desde_db(self, procesos_data: List[dict]):
         """
         Carga los procesos desde datos de la base de datos
@@ -126,33 +139,70 @@ class Receta:
         Returns:
             True si se completó, False si fue detenido
         """
-        total_pasos = len(self._procesos)
-        
-        if callback:
-            callback(f"\n{'='*50}")
-            callback(f"🍳 Iniciando receta: {self._nombre}")
-            callback(f"{'='*50}")
-            callback(f"📋 Pasos totales: {total_pasos}")
-            callback(f"⏱️ Duración estimada: {self.get_duracion_total()} segundos")
-            callback(f"{'='*50}\n")
+        self._anunciar_inicio(callback)
         
         for i, proceso in enumerate(self._procesos, 1):
-            if callback:
-                callback(f"\n--- Paso {i}/{total_pasos} ---")
-            
-            # Actualizar progreso ANTES de ejecutar el paso
-            if callback_progreso:
-                print(f"[RECETA] Llamando callback_progreso({i}, {total_pasos})")
-                callback_progreso(i, total_pasos)
+            self._anunciar_paso(i, callback, callback_progreso)
             
             # Ejecutar el proceso
             exito = proceso.ejecutar(callback)
             
             if not exito:
-                if callback:
-                    callback(f"\n❌ Receta detenida en paso {i}")
-                return False
+                return self._anunciar_detencion(i, callback)
         
+        return self._anunciar_fin(callback)
+
+    async def ejecutar_secuencial_async(self, callback: Optional[Callable[[str], None]] = None,
+                                        callback_progreso: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Versión para asyncio de ejecutar_secuencial (mismos mensajes)
+
+        Cancelar la tarea detiene el proceso en curso y la receta.
+
+        Returns:
+            True si se completó, False si fue detenido
+        """
+        self._anunciar_inicio(callback)
+
+        for i, proceso in enumerate(self._procesos, 1):
+            self._anunciar_paso(i, callback, callback_progreso)
+
+            exito = await proceso.ejecutar_async(callback)
+
+            if not exito:
+                return self._anunciar_detencion(i, callback)
+
+        return self._anunciar_fin(callback)
+
+    def _anunciar_inicio(self, callback: Optional[Callable[[str], None]]):
+        """Mensajes de cabecera de la ejecución"""
+        if callback:
+            callback(f"\n{'='*50}")
+            callback(f"🍳 Iniciando receta: {self._nombre}")
+            callback(f"{'='*50}")
+            callback(f"📋 Pasos totales: {len(self._procesos)}")
+            callback(f"⏱️ Duración estimada: {self.get_duracion_total()} segundos")
+            callback(f"{'='*50}\n")
+
+    def _anunciar_paso(self, i: int, callback: Optional[Callable[[str], None]],
+                       callback_progreso: Optional[Callable[[int, int], None]]):
+        """Mensaje y progreso ANTES de ejecutar el paso i"""
+        total_pasos = len(self._procesos)
+        if callback:
+            callback(f"\n--- Paso {i}/{total_pasos} ---")
+        
+        if callback_progreso:
+            print(f"[RECETA] Llamando callback_progreso({i}, {total_pasos})")
+            callback_progreso(i, total_pasos)
+
+    def _anunciar_detencion(self, i: int, callback: Optional[Callable[[str], None]]) -> bool:
+        """Mensaje de receta detenida en el paso i (devuelve False)"""
+        if callback:
+            callback(f"\n❌ Receta detenida en paso {i}")
+        return False
+
+    def _anunciar_fin(self, callback: Optional[Callable[[str], None]]) -> bool:
+        """Mensajes de receta completada (devuelve True)"""
         if callback:
             callback(f"\n{'='*50}")
             callback(f"✅ ¡Receta completada con éxito!")
@@ -165,6 +215,24 @@ class Receta:
         """Detiene todos los procesos de la receta"""
         for proceso in self._procesos:
             proceso.detener()
+
+    def reiniciar_procesos(self):
+        """Restablece el estado de ejecución de todos los procesos"""
+        for proceso in self._procesos:
+            proceso.reiniciar()
+
+    def copiar(self) -> 'Receta':
+        """
+        Copia de la receta con copias de sus procesos
+
+        Las recetas de la caché del catálogo son compartidas; la que se va a
+        ejecutar debe ser una copia para que su estado (detención, velocidad,
+        progreso) sea solo suyo.
+        """
+        copia = Receta(self._id, self._nombre, self._descripcion,
+                       self._es_base, self._favorito)
+        copia.establecer_procesos([proceso.copiar() for proceso in self._procesos])
+        return copia
     
     def __str__(self) -> str:
         """Representación en string de la receta"""
@@ -172,4 +240,52 @@ class Receta:
         return f"[{tipo}] {self._nombre} - {len(self._procesos)} pasos ({self.get_duracion_total()}s)"
     
     def __repr__(self) -> str:
-        return f"Receta(id={self._id}, nombre='{self._nombre}', pasos={len(self._procesos)})"
\ No newline at end of file
+        return f"Receta(id={self._id}, nombre='{self._nombre}', pasos={len(self._procesos)})"
+
+class ResumenReceta:
+    """
+    Resumen de una receta para los listados (tarjetas del navegador)
+
+    Contiene solo lo que muestra una tarjeta, calculado en SQL, sin crear
+    ningún ProcesoCocina. La receta completa se carga al abrirla
+    (RecetasController.obtener_receta_por_id).
+    """
+
+    __slots__ = ('id', 'nombre', 'descripcion', 'es_base', 'favorito',
+                 'num_pasos', 'duracion_total', 'tipos_procesos')
+
+    def __init__(self, id: int, nombre: str, descripcion: str, es_base: bool,
+                 favorito: bool, num_pasos: int, duracion_total: int,
+                 tipos_procesos: tuple = ()):
+        """
+        Inicializa el resumen
+
+        Args:
+            id: Identificador de la receta
+            nombre: Nombre de la receta
+            descripcion: Descripción
+            es_base: Si es una receta preinstalada
+            favorito: Si está marcada como favorita
+            num_pasos: Número de procesos
+            duracion_total: Suma de las duraciones en segundos
+            tipos_procesos: Tipos de los primeros procesos (para los iconos)
+        """
+        self.id = id
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.es_base = es_base
+        self.favorito = favorito
+        self.num_pasos = num_pasos
+        self.duracion_total = duracion_total
+        self.tipos_procesos = tipos_procesos
+
+    def get_num_pasos(self) -> int:
+        """Número de pasos (misma interfaz que Receta)"""
+        return self.num_pasos
+
+    def get_duracion_total(self) -> int:
+        """Duración total en segundos (misma interfaz que Receta)"""
+        return self.duracion_total
+
+    def __repr__(self) -> str:
+        return f"ResumenReceta(id={self.id}, nombre='{self.nombre}', pasos={self.num_pasos})"
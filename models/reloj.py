@@ -0,0 +1,207 @@
+"""
+Relojes para la simulación de procesos
+Permiten ejecutar recetas en tiempo real, acelerado o instantáneo (virtual)
+"""
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class Reloj(ABC):
+    """
+    Fuente de tiempo de los procesos de cocina
+
+    Los procesos no llaman a time.sleep directamente: piden el tiempo y las
+    esperas al reloj activo (obtener_reloj). Cambiando de reloj, la misma
+    receta se ejecuta en tiempo real, acelerada o de forma instantánea, con
+    los mismos mensajes de log y de progreso.
+    """
+
+    @abstractmethod
+    def ahora(self) -> float:
+        """Instante actual en segundos (solo tiene sentido la diferencia entre dos lecturas)"""
+        pass
+
+    @abstractmethod
+    def dormir(self, segundos: float):
+        """Espera `segundos` de tiempo del reloj"""
+        pass
+
+    def esperar(self, segundos: float, evento: threading.Event) -> bool:
+        """
+        Espera `segundos` de tiempo del reloj o hasta que se active `evento`
+
+        Los relojes que no pueden interrumpir la espera duermen el tiempo
+        completo (esta implementación por defecto).
+
+        Args:
+            segundos: Tiempo máximo de espera
+            evento: Aviso que despierta la espera antes de tiempo
+
+        Returns:
+            True si el evento está activado al volver, False si se agotó el tiempo
+        """
+        if evento.is_set():
+            return True
+        self.dormir(segundos)
+        return evento.is_set()
+
+    async def esperar_async(self, segundos: float, evento: asyncio.Event) -> bool:
+        """
+        Versión para asyncio de esperar: no bloquea el bucle de eventos
+
+        La implementación por defecto sirve para relojes cuyo dormir no
+        espera de verdad (RelojVirtual): avanza el reloj y cede el turno al
+        resto de tareas del bucle.
+
+        Returns:
+            True si el evento está activado al volver, False si se agotó el tiempo
+        """
+        if evento.is_set():
+            return True
+        self.dormir(segundos)
+        await asyncio.sleep(0)
+        return evento.is_set()
+
+
+class RelojReal(Reloj):
+    """Tiempo real (el de la cocina)"""
+
+    def ahora(self) -> float:
+        return time.monotonic()
+
+    def dormir(self, segundos: float):
+        if segundos > 0:
+            time.sleep(segundos)
+
+    def esperar(self, segundos: float, evento: threading.Event) -> bool:
+        return evento.wait(max(segundos, 0))
+
+    async def esperar_async(self, segundos: float, evento: asyncio.Event) -> bool:
+        return await _esperar_evento(evento, max(segundos, 0))
+
+
+class RelojEscalado(Reloj):
+    """
+    Tiempo real acelerado (o ralentizado) por un factor constante
+
+    Con factor=60 un proceso de un minuto dura un segundo. ahora() avanza
+    `factor` segundos por cada segundo real.
+    """
+
+    def __init__(self, factor: float):
+        """
+        Args:
+            factor: Segundos simulados por cada segundo real (> 0)
+
+        Raises:
+            ValueError: Si el factor no es positivo
+        """
+        if factor <= 0:
+            raise ValueError("El factor del reloj debe ser mayor que 0")
+        self._factor = factor
+        self._inicio = time.monotonic()
+
+    @property
+    def factor(self) -> float:
+        """Segundos simulados por segundo real"""
+        return self._factor
+
+    def ahora(self) -> float:
+        return (time.monotonic() - self._inicio) * self._factor
+
+    def dormir(self, segundos: float):
+        if segundos > 0:
+            time.sleep(segundos / self._factor)
+
+    def esperar(self, segundos: float, evento: threading.Event) -> bool:
+        return evento.wait(max(segundos, 0) / self._factor)
+
+    async def esperar_async(self, segundos: float, evento: asyncio.Event) -> bool:
+        return await _esperar_evento(evento, max(segundos, 0) / self._factor)
+
+
+async def _esperar_evento(evento: asyncio.Event, timeout: float) -> bool:
+    """Espera un asyncio.Event como mucho `timeout` segundos reales"""
+    if evento.is_set():
+        return True
+    try:
+        await asyncio.wait_for(evento.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return evento.is_set()
+
+
+class RelojVirtual(Reloj):
+    """
+    Tiempo completamente simulado (eventos discretos)
+
+    El tiempo solo avanza cuando un proceso duerme: dormir(s) salta s
+    segundos hacia delante al instante, sin esperar. Una receta completa se
+    ejecuta en milisegundos y ahora() indica cuánto habría tardado.
+
+    Pensado para un único hilo de ejecución por reloj (una simulación);
+    para simulaciones en paralelo se usa un reloj por hilo (usar_reloj).
+    """
+
+    def __init__(self, inicio: float = 0.0):
+        """
+        Args:
+            inicio: Instante inicial del reloj en segundos
+        """
+        self._ahora = inicio
+        self._lock = threading.Lock()
+
+    def ahora(self) -> float:
+        with self._lock:
+            return self._ahora
+
+    def dormir(self, segundos: float):
+        if segundos > 0:
+            with self._lock:
+                self._ahora += segundos
+
+
+# ========== RELOJ ACTIVO ==========
+
+_reloj_por_defecto: Reloj = RelojReal()
+# Un ContextVar aísla tanto hilos como tareas de asyncio
+_reloj_contexto: ContextVar[Optional[Reloj]] = ContextVar('reloj', default=None)
+
+
+def obtener_reloj() -> Reloj:
+    """
+    Reloj que deben usar los procesos en el hilo (o tarea de asyncio) actual
+
+    Returns:
+        El reloj fijado en este contexto con usar_reloj o, si no hay, el
+        reloj por defecto (RelojReal salvo que se cambie con establecer_reloj)
+    """
+    return _reloj_contexto.get() or _reloj_por_defecto
+
+
+def establecer_reloj(reloj: Reloj):
+    """Cambia el reloj por defecto de todos los hilos"""
+    global _reloj_por_defecto
+    _reloj_por_defecto = reloj
+
+
+@contextmanager
+def usar_reloj(reloj: Reloj) -> Iterator[Reloj]:
+    """
+    Usa un reloj solo en el hilo o tarea de asyncio actual mientras dura el bloque
+
+    Ejemplo:
+        with usar_reloj(RelojVirtual()) as reloj:
+            receta.ejecutar_secuencial(callback)
+            print(f"Habría tardado {reloj.ahora():.0f}s")
+    """
+    token = _reloj_contexto.set(reloj)
+    try:
+        yield reloj
+    finally:
+        _reloj_contexto.reset(token)
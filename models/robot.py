@@ -220,6 +220,38 @@ class RobotCocina:
             RobotApagadoException: Si el robot está apagado
             ProcesoInvalidoException: Si el proceso no es válido
         """
+        if not self.__iniciar_proceso(proceso):
+            return False
+        
+        # Ejecutar el proceso
+        exito = proceso.ejecutar(self.__log)
+        
+        return self.__terminar_proceso(exito)
+
+    async def ejecutar_proceso_async(self, proceso: ProcesoCocina) -> bool:
+        """
+        Ejecuta un proceso individual en el bucle de asyncio
+
+        Igual que ejecutar_proceso pero sin bloquear ni necesitar un hilo
+        propio. Cancelar la tarea detiene el proceso y deja el robot en
+        estado detenido.
+
+        Raises:
+            RobotApagadoException: Si el robot está apagado
+            ProcesoInvalidoException: Si el proceso no es válido
+        """
+        if not self.__iniciar_proceso(proceso):
+            return False
+
+        exito = False
+        try:
+            exito = await proceso.ejecutar_async(self.__log)
+        finally:
+            self.__terminar_proceso(exito)
+        return exito
+
+    def __iniciar_proceso(self, proceso: ProcesoCocina) -> bool:
+        """Valida y pasa a ejecutando para un proceso (False si no puede ejecutarse)"""
         self.__verificar_encendido()
         
         if proceso is None:
@@ -229,14 +261,15 @@ class RobotCocina:
             self.__log("⚠️ El robot no puede ejecutar en su estado actual")
             return False
         
+        proceso.reiniciar()
         self.__proceso_actual = proceso
         self.__cambiar_estado(ESTADO_EJECUTANDO)
         
         self.__log(f"\n▶️ Ejecutando: {proceso.get_descripcion()}")
-        
-        # Ejecutar el proceso
-        exito = proceso.ejecutar(self.__log)
-        
+        return True
+
+    def __terminar_proceso(self, exito: bool) -> bool:
+        """Sale del estado ejecutando al acabar un proceso"""
         self.__proceso_actual = None
         
         if exito:
@@ -260,23 +293,58 @@ class RobotCocina:
         Raises:
             RobotApagadoException: Si el robot está apagado
         """
+        if not self.__iniciar_receta(receta):
+            return False
+        
+        # Ejecutar la receta
+        exito = receta.ejecutar_secuencial(
+            callback=self.__log,
+            callback_progreso=self.__callback_progreso
+        )
+        
+        return self.__terminar_receta(exito)
+
+    async def ejecutar_receta_async(self, receta: Receta) -> bool:
+        """
+        Ejecuta una receta completa en el bucle de asyncio
+
+        Igual que ejecutar_receta pero sin bloquear ni necesitar un hilo
+        propio. Cancelar la tarea detiene la receta y deja el robot en
+        estado detenido.
+
+        Raises:
+            RobotApagadoException: Si el robot está apagado
+        """
+        if not self.__iniciar_receta(receta):
+            return False
+
+        exito = False
+        try:
+            exito = await receta.ejecutar_secuencial_async(
+                callback=self.__log,
+                callback_progreso=self.__callback_progreso
+            )
+        finally:
+            self.__terminar_receta(exito)
+        return exito
+
+    def __iniciar_receta(self, receta: Receta) -> bool:
+        """Valida y pasa a ejecutando para una receta (False si no puede ejecutarse)"""
         self.__verificar_encendido()
         
         if not self.puede_ejecutar:
             self.__log("⚠️ El robot no puede ejecutar en su estado actual")
             return False
         
+        receta.reiniciar_procesos()
         self.__receta_actual = receta
         self.__cambiar_estado(ESTADO_EJECUTANDO)
         
         print(f"[ROBOT] Callback progreso configurado: {self.__callback_progreso is not None}")
-        
-        # Ejecutar la receta
-        exito = receta.ejecutar_secuencial(
-            callback=self.__log,
-            callback_progreso=self.__callback_progreso
-        )
-        
+        return True
+
+    def __terminar_receta(self, exito: bool) -> bool:
+        """Sale del estado ejecutando al acabar una receta"""
         self.__receta_actual = None
         
         if exito:
@@ -1,12 +1,27 @@
 """
 Componentes comunes y reutilizables de la UI
-Incluye: toggle de modo oscuro, separadores, badges, etc.
+Incluye: toggle de modo oscuro, separadores, badges, grid con scroll infinito, etc.
 """
 
+import inspect
+from typing import Dict, Optional
+
 from nicegui import ui
+from database.db_async import db_async
 from ui.state.app_state import app_state
 from ui.styles.colors import COLORS
 
+# Recetas por página de los navegadores (listado y resultados de búsqueda)
+TAMANO_PAGINA_RECETAS = 24
+
+# Opciones del filtro de duración: segundos máximos -> etiqueta (0 = cualquiera)
+FILTROS_DURACION: Dict[int, str] = {
+    0: 'Cualquiera',
+    5 * 60: '≤ 5 min',
+    10 * 60: '≤ 10 min',
+    30 * 60: '≤ 30 min',
+}
+
 
 def create_dark_mode_toggle():
     """
@@ -338,3 +353,99 @@ def show_warning_notification(message: str):
 def show_info_notification(message: str):
     """Muestra notificación informativa"""
     ui.notify(message, type='info', position='top', timeout=3000)
+
+
+def create_infinite_grid(load_page, render_item, grid_classes: str = 'w-full gap-4',
+                         columns=None, height: str = '70vh', threshold: float = 0.85):
+    """
+    Crea un grid con scroll infinito que pide los elementos página a página
+
+    Solo se dibujan las páginas que el usuario llega a ver, de modo que el
+    tamaño del DOM y de los mensajes del websocket no depende del total.
+
+    Args:
+        load_page: Función cursor -> (elementos, siguiente_cursor), síncrona o
+            asíncrona. El primer cursor es None y un siguiente_cursor None
+            indica que no hay más
+        render_item: Función que dibuja un elemento dentro del grid
+        grid_classes: Clases CSS del grid
+        columns: Número de columnas (None = definido por las clases)
+        height: Altura del área con scroll
+        threshold: Fracción del scroll a partir de la cual se carga otra página
+
+    Returns:
+        ui.scroll_area: Área con scroll que contiene el grid
+    """
+    state = {'cursor': None, 'done': False, 'loading': False}
+
+    async def load_more():
+        if state['done'] or state['loading']:
+            return
+        state['loading'] = True
+        try:
+            page = load_page(state['cursor'])
+            if inspect.isawaitable(page):
+                page = await page
+            items, state['cursor'] = page
+            with grid:
+                for item in items:
+                    render_item(item)
+            state['done'] = state['cursor'] is None
+            more_button.visible = not state['done']
+        finally:
+            state['loading'] = False
+
+    async def on_scroll(e):
+        if e.vertical_percentage >= threshold:
+            await load_more()
+
+    scroll = ui.scroll_area(on_scroll=on_scroll).classes('w-full').style(f'height: {height};')
+    with scroll:
+        grid = ui.grid(columns=columns).classes(grid_classes)
+        # Por si la primera página no llena el área y no llega a haber scroll
+        more_button = ui.button('Cargar más', icon='expand_more', on_click=load_more).props(
+            'flat'
+        ).classes('w-full mt-2')
+
+    # Primera página en cuanto el cliente esté conectado, sin bloquear el render
+    ui.timer(0, load_more, once=True)
+    return scroll
+
+
+def crear_cargador_recetas(recetas_ctrl, filtro: str, texto: str = '',
+                           duracion_max: Optional[int] = None):
+    """
+    Crea el load_page de create_infinite_grid para un navegador de recetas
+
+    Sin búsqueda pagina por clave (nombre, es_base, id); con búsqueda los
+    resultados van por relevancia y el cursor es el desplazamiento.
+
+    Args:
+        recetas_ctrl: RecetasController con el que se leen las páginas
+        filtro: 'todas', 'base', 'usuario' o 'favoritas'
+        texto: Texto de búsqueda ('' = listado sin búsqueda)
+        duracion_max: Duración máxima en segundos (None o 0 = cualquiera)
+
+    Returns:
+        Función asíncrona cursor -> (resúmenes, siguiente_cursor)
+    """
+    duracion_max = duracion_max or None
+
+    async def cargar_pagina(cursor):
+        if not texto:
+            return await db_async.leer(
+                recetas_ctrl.listar_recetas,
+                filtro, cursor, limite=TAMANO_PAGINA_RECETAS, duracion_maxima=duracion_max
+            )
+
+        desplazamiento = cursor or 0
+        recetas = await db_async.leer(
+            recetas_ctrl.buscar_recetas,
+            texto, filtro, limite=TAMANO_PAGINA_RECETAS, desplazamiento=desplazamiento,
+            duracion_maxima=duracion_max
+        )
+        if len(recetas) < TAMANO_PAGINA_RECETAS:
+            return recetas, None
+        return recetas, desplazamiento + TAMANO_PAGINA_RECETAS
+
+    return cargar_pagina
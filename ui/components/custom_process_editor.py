@@ -5,11 +5,14 @@ Diseño coherente con la interfaz Thermomix
 """
 from nicegui import ui
 from database.db import DatabaseManager
+from controllers.cache_catalogo import cache_catalogo
+from models.parametros import validar_parametros
 from models.procesos_basicos import (
     registrar_proceso_personalizado,
     cargar_procesos_personalizados_desde_bd,
     _procesos_personalizados_cache
 )
+from utils.exceptions import ParametrosInvalidosException
 from typing import Optional
 
 
@@ -237,6 +240,12 @@ class EditorProcesosPersonalizados:
             ui.notify('La duración debe ser al menos 1 segundo', type='warning')
             return
 
+        try:
+            validar_parametros(parametros.strip() if parametros else "")
+        except ParametrosInvalidosException as e:
+            ui.notify(e.mensaje, type='warning')
+            return
+
         # Verificar si ya existe (incluyendo inactivos para evitar UNIQUE constraint)
         existente = self._verificar_nombre_existe(nombre)
         if existente:
@@ -261,6 +270,8 @@ class EditorProcesosPersonalizados:
                 parametros_defecto=parametros.strip() if parametros else "",
                 descripcion=descripcion.strip() if descripcion else ""
             )
+            # Las recetas que usan este tipo ya pueden construir sus procesos
+            cache_catalogo.invalidar_todo()
 
             ui.notify(f'Función "{nombre}" creada correctamente', type='positive', position='top')
 
@@ -278,9 +289,7 @@ class EditorProcesosPersonalizados:
 
     def _verificar_nombre_existe(self, nombre: str) -> bool:
         """Verifica si ya existe un proceso con ese nombre (activo o inactivo)"""
-        query = "SELECT COUNT(*) as count FROM procesos_personalizados WHERE nombre = ?"
-        result = self.db.ejecutar_query(query, (nombre,))
-        return result[0]['count'] > 0
+        return self.db.existe_nombre_proceso_personalizado(nombre)
 
     def _actualizar_lista_procesos(self):
         """Actualiza la lista de procesos personalizados"""
@@ -354,14 +363,12 @@ class EditorProcesosPersonalizados:
         """Elimina un proceso personalizado (eliminación real, no soft delete)"""
         try:
             # Eliminar completamente de la base de datos
-            self.db.ejecutar_comando(
-                "DELETE FROM procesos_personalizados WHERE id = ?",
-                (proceso_id,)
-            )
+            self.db.borrar_proceso_personalizado(proceso_id)
 
             # Eliminar del cache en memoria
             if nombre in _procesos_personalizados_cache:
                 del _procesos_personalizados_cache[nombre]
+            cache_catalogo.invalidar_todo()
 
             ui.notify(f'Función "{nombre}" eliminada', type='positive')
 
@@ -6,9 +6,20 @@ Permite explorar recetas preinstaladas y personalizadas
 from nicegui import ui
 from ui.state.app_state import app_state
 from ui.styles.colors import COLORS, MODO_ICONOS
+from ui.components.common import FILTROS_DURACION, create_infinite_grid, crear_cargador_recetas
 from controllers.recetas_controller import RecetasController
+from database.db_async import db_async
 from typing import List, Optional
-from models.receta import Receta
+from models.receta import ResumenReceta
+
+# Grid responsive
+GRID_CLASSES = (
+    'w-full gap-6 '
+    'grid-cols-1 '           # Mobile
+    'sm:grid-cols-2 '        # Tablet
+    'lg:grid-cols-3 '        # Desktop
+    'xl:grid-cols-4'         # Large desktop
+)
 
 
 class RecipeBrowser:
@@ -20,7 +31,7 @@ class RecipeBrowser:
         self.grid_container = None
         self.search_input = None
 
-    def render(self):
+    async def render(self):
         """Renderiza el navegador completo"""
         self.container = ui.column().classes('w-full gap-6 p-6')
 
@@ -32,7 +43,7 @@ class RecipeBrowser:
             self._render_filter_bar()
 
             # Grid de recetas
-            self._render_recipe_grid()
+            await self._render_recipe_grid()
 
         return self.container
 
@@ -81,14 +92,24 @@ class RecipeBrowser:
                     for key, label in filtros.items():
                         self._create_filter_button(key, label)
 
+                # Duración máxima (columna duracion_total)
+                ui.select(
+                    FILTROS_DURACION,
+                    value=app_state.filtro_duracion_max or 0,
+                    label='Duración',
+                    on_change=self._on_duration_change
+                ).props('outlined dense').classes('w-36')
+
                 ui.space()
 
                 # Barra de búsqueda
                 self.search_input = ui.input(
-                    placeholder='Buscar recetas...'
-                ).props('outlined dense').classes(
+                    placeholder='Buscar recetas...',
+                    value=app_state.busqueda_texto,
+                    on_change=self._on_search
+                ).props('outlined dense clearable').classes(
                     'w-64'
-                ).on('input', lambda: self._refresh_grid())
+                )
 
                 self.search_input._props['prepend-icon'] = 'search'
 
@@ -111,42 +132,55 @@ class RecipeBrowser:
                 'hover:bg-thermo-cyan-50 dark:hover:bg-thermo-cyan-900/20'
             )
 
-    def _set_filter(self, filter_key: str):
+    async def _on_search(self, e):
+        """Actualiza el texto de búsqueda y refresca el grid"""
+        app_state.busqueda_texto = (e.value or '').strip()
+        await self._refresh_grid()
+
+    async def _on_duration_change(self, e):
+        """Actualiza la duración máxima y refresca el grid"""
+        app_state.filtro_duracion_max = e.value or None
+        await self._refresh_grid()
+
+    async def _set_filter(self, filter_key: str):
         """Cambia el filtro activo"""
         app_state.filtro_recetas = filter_key
-        self._refresh_grid()
+        await self._refresh_grid()
         ui.notify(f'Mostrando: {filter_key}', type='info', position='top')
 
-    def _render_recipe_grid(self):
+    async def _render_recipe_grid(self):
         """Grid responsivo de tarjetas de recetas"""
         self.grid_container = ui.column().classes('w-full gap-4')
 
         with self.grid_container:
-            # Obtener recetas filtradas
-            recetas = self._get_filtered_recipes()
-
-            if not recetas:
-                # Sin resultados
-                self._render_empty_state()
-            else:
-                # Contador de resultados
-                ui.label(f'{len(recetas)} receta(s) encontrada(s)').classes(
-                    'text-sm text-gray-600 dark:text-gray-400 mb-2'
-                )
+            await self._render_grid_content()
 
-                # Grid responsive
-                with ui.grid().classes(
-                    'w-full gap-6 '
-                    'grid-cols-1 '           # Mobile
-                    'sm:grid-cols-2 '        # Tablet
-                    'lg:grid-cols-3 '        # Desktop
-                    'xl:grid-cols-4'         # Large desktop
-                ):
-                    for receta in recetas:
-                        self._render_recipe_card(receta)
+    async def _render_grid_content(self):
+        """Contador y grid paginado según el filtro y la búsqueda activos"""
+        total = await self._count_recipes()
+
+        if total == 0:
+            # Sin resultados
+            self._render_empty_state()
+            return
 
-    def _render_recipe_card(self, receta: Receta):
-        """Renderiza una tarjeta individual de receta"""
+        # Contador de resultados
+        ui.label(f'{total} receta(s) encontrada(s)').classes(
+            'text-sm text-gray-600 dark:text-gray-400 mb-2'
+        )
+
+        # Solo se piden y dibujan las páginas que se llegan a ver
+        create_infinite_grid(
+            load_page=crear_cargador_recetas(
+                self.recetas_ctrl, app_state.filtro_recetas,
+                app_state.busqueda_texto, app_state.filtro_duracion_max
+            ),
+            render_item=self._render_recipe_card,
+            grid_classes=GRID_CLASSES
+        )
+
+    def _render_recipe_card(self, receta: ResumenReceta):
+        """Renderiza una tarjeta individual a partir del resumen de la receta"""
         with ui.card().classes(
             'relative bg-white dark:bg-gray-800 rounded-2xl '
             'border-2 border-gray-200 dark:border-gray-700 '
@@ -216,18 +250,16 @@ class RecipeBrowser:
                             'text-sm text-gray-700 dark:text-gray-300 font-medium'
                         )
 
-                # Preview de procesos (iconos)
-                if receta.procesos:
+                # Preview de procesos (iconos de los primeros tipos del resumen)
+                if receta.tipos_procesos:
                     with ui.row().classes('w-full gap-1 flex-wrap mt-2'):
-                        # Mostrar máximo 5 iconos
-                        for proceso in receta.procesos[:5]:
-                            tipo = proceso.__class__.__name__
+                        for tipo in receta.tipos_procesos:
                             icono = MODO_ICONOS.get(tipo, '🔧')
                             ui.label(icono).classes('text-lg').tooltip(tipo)
 
                         # Indicador de "más procesos"
-                        if len(receta.procesos) > 5:
-                            ui.label(f'+{len(receta.procesos) - 5}').classes(
+                        if receta.num_pasos > len(receta.tipos_procesos):
+                            ui.label(f'+{receta.num_pasos - len(receta.tipos_procesos)}').classes(
                                 'text-xs text-gray-500 dark:text-gray-400 font-medium'
                             )
 
@@ -264,70 +296,41 @@ class RecipeBrowser:
                     on_click=self._open_create_wizard
                 ).props('unelevated color=cyan-6').classes('mt-4')
 
-    def _get_filtered_recipes(self) -> List[Receta]:
-        """Obtiene las recetas según el filtro activo"""
-        # Obtener todas las recetas
-        recetas_base, recetas_usuario = self.recetas_ctrl.obtener_todas_recetas()
-
-        # Aplicar filtro
-        filtro = app_state.filtro_recetas
-
-        if filtro == 'base':
-            recetas = recetas_base
-        elif filtro == 'usuario':
-            recetas = recetas_usuario
-        elif filtro == 'favoritas':
-            # Solo recetas de usuario favoritas
-            recetas = [r for r in recetas_usuario if getattr(r, 'favorito', False)]
-        else:  # 'todas'
-            recetas = recetas_base + recetas_usuario
-
-        # Aplicar búsqueda
-        if self.search_input and self.search_input.value:
-            search_term = self.search_input.value.lower()
-            recetas = [
-                r for r in recetas
-                if search_term in r.nombre.lower() or
-                   (r.descripcion and search_term in r.descripcion.lower())
-            ]
-
-        # Ordenar: favoritas primero, luego alfabético
-        recetas.sort(key=lambda r: (
-            not getattr(r, 'favorito', False),  # Favoritas primero
-            r.nombre.lower()  # Luego alfabético
-        ))
-
-        return recetas
-
-    def _refresh_grid(self):
+    async def _count_recipes(self) -> int:
+        """Número total de recetas del filtro (o de la búsqueda) activo"""
+        duracion_max = app_state.filtro_duracion_max
+        if app_state.busqueda_texto:
+            return await db_async.leer(
+                self.recetas_ctrl.contar_resultados_busqueda,
+                app_state.busqueda_texto, app_state.filtro_recetas, duracion_max
+            )
+        return await db_async.leer(
+            self.recetas_ctrl.contar_recetas, app_state.filtro_recetas, duracion_max
+        )
+
+    async def _refresh_grid(self):
         """Refresca el grid de recetas"""
         if self.grid_container:
             self.grid_container.clear()
             with self.grid_container:
-                recetas = self._get_filtered_recipes()
-
-                if not recetas:
-                    self._render_empty_state()
-                else:
-                    ui.label(f'{len(recetas)} receta(s) encontrada(s)').classes(
-                        'text-sm text-gray-600 dark:text-gray-400 mb-2'
-                    )
-
-                    with ui.grid().classes(
-                        'w-full gap-6 '
-                        'grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4'
-                    ):
-                        for receta in recetas:
-                            self._render_recipe_card(receta)
+                await self._render_grid_content()
+
+    async def _load_recipe(self, resumen: ResumenReceta):
+        """Carga una receta para ejecutar (solo entonces se crean sus procesos)"""
+        receta = await db_async.leer(
+            self.recetas_ctrl.obtener_receta_por_id, resumen.id, resumen.es_base
+        )
+        if receta is None:
+            ui.notify('⚠️ La receta ya no existe', type='warning', position='top')
+            await self._refresh_grid()
+            return
 
-    def _load_recipe(self, receta: Receta):
-        """Carga una receta para ejecutar"""
         app_state.cargar_receta(receta)
         ui.notify(f'✓ Receta cargada: {receta.nombre}', type='positive', position='top')
         # Aquí cambiaríamos a la vista de ejecución
         # Por ahora solo actualizamos el estado
 
-    def _toggle_favorite(self, receta: Receta):
+    async def _toggle_favorite(self, receta: ResumenReceta):
         """Toggle favorito de una receta"""
         if receta.es_base:
             ui.notify('⚠️ No puedes marcar recetas preinstaladas como favoritas', type='warning')
@@ -335,7 +338,9 @@ class RecipeBrowser:
 
         try:
             # Actualizar en BD
-            nuevo_estado = self.recetas_ctrl.toggle_favorito(receta.id, receta.es_base)
+            nuevo_estado = await db_async.escribir(
+                self.recetas_ctrl.toggle_favorito, receta.id, receta.es_base
+            )
 
             # Actualizar en modelo
             receta.favorito = nuevo_estado
@@ -346,7 +351,7 @@ class RecipeBrowser:
 
             # Refrescar grid si estamos en vista de favoritas
             if app_state.filtro_recetas == 'favoritas':
-                self._refresh_grid()
+                await self._refresh_grid()
 
         except Exception as e:
             ui.notify(f'❌ Error: {str(e)}', type='negative')
@@ -358,7 +363,7 @@ class RecipeBrowser:
         # Aquí se cambiaría a la vista del wizard
 
 
-def create_recipe_browser(recetas_ctrl: RecetasController):
+async def create_recipe_browser(recetas_ctrl: RecetasController):
     """
     Función helper para crear el navegador de recetas
 
@@ -369,4 +374,4 @@ def create_recipe_browser(recetas_ctrl: RecetasController):
         RecipeBrowser instance
     """
     browser = RecipeBrowser(recetas_ctrl)
-    return browser.render()
+    return await browser.render()
@@ -8,6 +8,9 @@ from ui.state.app_state import app_state
 from ui.styles.colors import COLORS, MODO_ICONOS
 from ui.components.common import show_success_notification, show_error_notification
 from controllers.recetas_controller import RecetasController
+from database.db_async import db_async
+from models.parametros import validar_parametros
+from utils.exceptions import ParametrosInvalidosException
 from typing import Dict, Any, Optional, Callable
 import re
 
@@ -507,6 +510,12 @@ class RecipeWizard:
             show_error_notification('⚠️ La duración debe ser mayor a 0')
             return
 
+        try:
+            validar_parametros(parametros.strip() if parametros else '')
+        except ParametrosInvalidosException as e:
+            show_error_notification(f'⚠️ {e.mensaje}')
+            return
+
         # Agregar
         app_state.wizard_procesos.append({
             'tipo': tipo,
@@ -640,34 +649,18 @@ class RecipeWizard:
         if self.on_complete:
             self.on_complete(None)
 
-    def _save_recipe(self):
+    async def _save_recipe(self):
         """Guarda la receta en la base de datos"""
         try:
-            # Crear receta
-            receta = self.recetas_ctrl.crear_receta_usuario(
+            # Guardar receta, ingredientes y procesos en una sola transacción
+            receta = await db_async.escribir(
+                self.recetas_ctrl.guardar_receta_completa,
                 nombre=self.recipe_data['nombre'],
-                descripcion=self.recipe_data['descripcion']
+                descripcion=self.recipe_data['descripcion'],
+                ingredientes=app_state.wizard_ingredientes,
+                procesos=app_state.wizard_procesos
             )
 
-            # Agregar ingredientes
-            for i, ing in enumerate(app_state.wizard_ingredientes):
-                self.recetas_ctrl.agregar_ingrediente(
-                    receta_id=receta.id,
-                    nombre=ing['nombre'],
-                    cantidad=ing['cantidad'],
-                    unidad=ing['unidad'],
-                    orden=i
-                )
-
-            # Agregar procesos
-            for proceso in app_state.wizard_procesos:
-                self.recetas_ctrl.agregar_proceso_a_receta(
-                    receta_id=receta.id,
-                    tipo_proceso=proceso['tipo'],
-                    duracion=proceso['duracion'],
-                    parametros=proceso['parametros']
-                )
-
             # Notificar éxito
             show_success_notification(f'✓ Receta "{receta.nombre}" creada con éxito')
 
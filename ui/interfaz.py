@@ -6,7 +6,10 @@ Diseño premium tipo Thermomix real con todas las funcionalidades
 from nicegui import ui, app
 from controllers.robot_controller import RobotController
 from controllers.recetas_controller import RecetasController
+from database.db_async import db_async
+from models.progreso import ModeloProgreso
 from ui.state.app_state import app_state
+from ui.components.common import FILTROS_DURACION, create_infinite_grid, crear_cargador_recetas
 from typing import Optional
 import asyncio
 import time
@@ -245,7 +248,7 @@ logs = []
 
 
 # ===== FUNCIÓN PRINCIPAL =====
-def crear_interfaz_principal():
+async def crear_interfaz_principal():
     """Crea la interfaz principal estilo Thermomix"""
     global main_content
 
@@ -260,7 +263,7 @@ def crear_interfaz_principal():
         main_content = ui.column().classes('w-full gap-4 mt-4')
 
         with main_content:
-            renderizar_vista_actual()
+            await renderizar_vista_actual()
 
 
 def crear_header_thermomix():
@@ -375,14 +378,14 @@ def navegar_a(vista: str):
     ui.navigate.to('/')
 
 
-def renderizar_vista_actual():
+async def renderizar_vista_actual():
     """Renderiza la vista según app_state.vista_actual"""
     vista = app_state.vista_actual
 
     if vista == 'dashboard':
         renderizar_dashboard()
     elif vista == 'browser':
-        renderizar_browser()
+        await renderizar_browser()
     elif vista == 'wizard':
         renderizar_wizard()
     elif vista == 'config':
@@ -790,13 +793,6 @@ def crear_panel_ejecucion_activa():
     """Crea el panel de ejecución con actualización en tiempo real"""
     proceso = app_state.receta_actual.procesos[app_state.paso_actual]
 
-    # Estado del timer para tracking de velocidad
-    timer_state = {
-        'progreso_acumulado': 0.0,  # Progreso acumulado (0-100)
-        'ultimo_tick': time.time(),
-        'velocidad_anterior': app_state.velocidad_actual
-    }
-
     with ui.element('div').classes('lcd-screen').style(
         f'border-color: {COLORS.LED_RUNNING}; box-shadow: 0 0 20px {COLORS.LED_RUNNING};'
     ):
@@ -809,6 +805,13 @@ def crear_panel_ejecucion_activa():
             f'font-size: 1rem; color: {COLORS.TEXT_PRIMARY}; text-align: center; margin-bottom: 1rem;'
         )
 
+        # Parámetros ya interpretados del paso (temperatura, velocidad, peso...)
+        etiquetas = proceso.parametros_parseados.etiquetas()
+        if etiquetas:
+            ui.label(' · '.join(etiquetas)).style(
+                f'font-size: 0.85rem; color: {COLORS.TEXT_SECONDARY}; text-align: center; margin-bottom: 1rem;'
+            )
+
         # Barra de progreso del paso actual
         progreso_label = ui.label('0%').style(
             f'font-size: 2rem; font-weight: bold; color: {COLORS.CYAN}; text-align: center;'
@@ -850,54 +853,31 @@ def crear_panel_ejecucion_activa():
                 f'font-size: 1.1rem; font-weight: bold; border-radius: 12px;'
             )
 
-        # Timer para actualizar el progreso con soporte para cambio de velocidad
+        # Timer que muestra el progreso según el modelo compartido del paso
         def actualizar_progreso():
-            if not app_state.en_ejecucion:
+            modelo = app_state.modelo_progreso
+            if not app_state.en_ejecucion or modelo is None:
                 timer.deactivate()
                 return
 
-            ahora = time.time()
-            delta = ahora - timer_state['ultimo_tick']
-            timer_state['ultimo_tick'] = ahora
-
-            duracion_base = app_state.duracion_paso_actual
-
-            if duracion_base > 0:
-                # Calcular factor de velocidad actual
-                # Velocidad 1 = 2x tiempo (más lento), Velocidad 5 = 1x, Velocidad 10 = 0.5x (más rápido)
-                velocidad = app_state.velocidad_actual
-                factor_velocidad = 2.0 - (velocidad - 1) * (1.5 / 9)  # Mapea 1->2.0, 10->0.5
-
-                # El progreso avanza más rápido con mayor velocidad
-                # delta_progreso = (tiempo transcurrido / duración ajustada) * 100
-                duracion_ajustada = duracion_base * factor_velocidad
-                delta_progreso = (delta / duracion_ajustada) * 100
-
-                timer_state['progreso_acumulado'] += delta_progreso
-                progreso = min(timer_state['progreso_acumulado'], 100)
-
-                # Calcular tiempo restante estimado con velocidad actual
-                progreso_restante = 100 - progreso
-                if progreso_restante > 0:
-                    restante = (progreso_restante / 100) * duracion_ajustada
-                else:
-                    restante = 0
+            progreso = modelo.progreso()
+            restante = modelo.restante() or 0.0
 
-                app_state.progreso_paso_actual = progreso
+            app_state.progreso_paso_actual = progreso
 
-                # Actualizar UI
-                progreso_label.text = f'{progreso:.1f}%'
-                progress_inner.style(f'width: {progreso:.1f}%;')
-                tiempo_label.text = f'Tiempo restante: {restante:.1f}s'
+            # Actualizar UI
+            progreso_label.text = f'{progreso:.1f}%'
+            progress_inner.style(f'width: {progreso:.1f}%;')
+            tiempo_label.text = f'Tiempo restante: {restante:.1f}s'
 
-                # Si se completó
-                if progreso >= 100:
-                    timer.deactivate()
-                    app_state.en_ejecucion = False
-                    app_state.paso_completado = True
-                    agregar_log(f'✅ Paso {app_state.paso_actual + 1} completado')
-                    ui.notify('¡Paso completado!', type='positive')
-                    ui.navigate.to('/')
+            # Si se completó
+            if modelo.completado():
+                timer.deactivate()
+                app_state.en_ejecucion = False
+                app_state.paso_completado = True
+                agregar_log(f'✅ Paso {app_state.paso_actual + 1} completado')
+                ui.notify('¡Paso completado!', type='positive')
+                ui.navigate.to('/')
 
         timer = ui.timer(0.1, actualizar_progreso)
 
@@ -914,6 +894,7 @@ def _ejecutar_paso_real():
     app_state.duracion_paso_actual = duracion
     app_state.progreso_paso_actual = 0
     app_state.velocidad_actual = 5  # Resetear velocidad a normal
+    app_state.modelo_progreso = ModeloProgreso(duracion, app_state.velocidad_actual)
 
     agregar_log(f'▶️ Ejecutando: {proceso.get_descripcion()} ({duracion}s)')
     ui.notify(f'Ejecutando paso {app_state.paso_actual + 1}...', type='info')
@@ -985,6 +966,9 @@ def iniciar_ejecucion_paso():
 
 def detener_ejecucion():
     """Detiene la ejecución actual"""
+    if app_state.modelo_progreso:
+        app_state.modelo_progreso.detener()
+        app_state.progreso_paso_actual = app_state.modelo_progreso.progreso()
     progreso_actual = app_state.progreso_paso_actual
     app_state.en_ejecucion = False
     app_state.tiempo_inicio_paso = 0
@@ -1014,8 +998,10 @@ def ajustar_velocidad_proceso(nueva_velocidad, velocidad_label):
         # Ajustar velocidad directamente en el proceso
         velocidad_anterior = proceso.ajustar_velocidad(velocidad)
 
-        # Guardar en app_state para usar en el cálculo del timer
+        # Registrar el cambio en el modelo que consulta el timer
         app_state.velocidad_actual = velocidad
+        if app_state.modelo_progreso:
+            app_state.modelo_progreso.cambiar_velocidad(velocidad)
 
         # Actualizar UI
         velocidad_label.text = f'Velocidad: {velocidad}'
@@ -1108,26 +1094,26 @@ def confirmar_reinicio_bd():
             f'font-size: 0.9rem; color: {COLORS.MAGENTA}; margin-bottom: 1.5rem;'
         )
 
+        async def confirmar():
+            dialog.close()
+            await reiniciar_bd_usuario()
+
         with ui.row().classes('w-full justify-end gap-3'):
             ui.button('Cancelar', on_click=dialog.close).props('flat').style(
                 f'color: {COLORS.TEXT_SECONDARY};'
             )
-            ui.button('SÍ, ELIMINAR TODO', on_click=lambda: [reiniciar_bd_usuario(), dialog.close()]).style(
+            ui.button('SÍ, ELIMINAR TODO', on_click=confirmar).style(
                 f'background: {COLORS.BTN_STOP}; color: white;'
             )
 
     dialog.open()
 
 
-def reiniciar_bd_usuario():
+async def reiniciar_bd_usuario():
     """Reinicia la base de datos de recetas de usuario"""
     try:
-        from database.db import DatabaseManager
-        db = DatabaseManager()
-
-        db.ejecutar_comando("DELETE FROM ingredientes WHERE es_base = 0")
-        db.ejecutar_comando("DELETE FROM procesos_usuario")
-        db.ejecutar_comando("DELETE FROM recetas_usuario")
+        # A través del controlador para que la caché del catálogo se vacíe
+        await db_async.escribir(recetas_ctrl.reiniciar_fabrica)
 
         agregar_log('🗑️ Base de datos de usuario reiniciada')
         ui.notify('✓ Todas las recetas de usuario han sido eliminadas', type='positive', position='top')
@@ -1158,7 +1144,7 @@ def renderizar_procesos_personalizados():
 
 
 # ===== VISTA: BROWSER =====
-def renderizar_browser():
+async def renderizar_browser():
     """Navegador de recetas"""
     with ui.row().classes('w-full items-center gap-3 mb-4'):
         ui.button(icon='arrow_back', on_click=lambda: navegar_a('dashboard')).props('flat round').style(
@@ -1186,27 +1172,55 @@ def renderizar_browser():
             else:
                 btn.style(f'background: {COLORS.BG_CARD}; color: {COLORS.TEXT_SECONDARY}; border: 1px solid {COLORS.BORDER_PRIMARY};')
 
-    # Grid de recetas
-    recetas_base, recetas_usuario = recetas_ctrl.obtener_todas_recetas()
+    # Filtro por duración total (columna duracion_total)
+    with ui.row().classes('w-full gap-2 mb-4 flex-wrap items-center'):
+        ui.label('Duración:').style(f'color: {COLORS.TEXT_SECONDARY}; font-size: 0.85rem;')
+        for segundos, label in FILTROS_DURACION.items():
+            is_active = (app_state.filtro_duracion_max or 0) == segundos
+            btn = ui.button(label, on_click=lambda s=segundos: set_filtro_duracion(s)).props('dense')
+            if is_active:
+                btn.style(f'background: {COLORS.CYAN}; color: {COLORS.BG_PRIMARY};')
+            else:
+                btn.style(f'background: {COLORS.BG_CARD}; color: {COLORS.TEXT_SECONDARY}; border: 1px solid {COLORS.BORDER_PRIMARY};')
 
+    # Búsqueda (índice FTS5, se lanza con Enter)
+    busqueda_input = ui.input(
+        placeholder='Buscar por nombre, ingrediente o paso...',
+        value=app_state.busqueda_texto
+    ).props('outlined dark dense clearable').classes('w-full mb-4')
+    busqueda_input.on('keydown.enter', lambda: buscar_recetas(busqueda_input.value))
+    busqueda_input.on('clear', lambda: buscar_recetas(''))
+
+    # Grid de recetas (paginado)
     filtro = app_state.filtro_recetas
-    if filtro == 'base':
-        recetas = recetas_base
-    elif filtro == 'usuario':
-        recetas = recetas_usuario
-    elif filtro == 'favoritas':
-        recetas = [r for r in recetas_usuario if getattr(r, 'favorito', False)]
+    texto = app_state.busqueda_texto.strip()
+    duracion_max = app_state.filtro_duracion_max
+
+    if texto:
+        total = await db_async.leer(recetas_ctrl.contar_resultados_busqueda, texto, filtro, duracion_max)
     else:
-        recetas = recetas_base + recetas_usuario
+        total = await db_async.leer(recetas_ctrl.contar_recetas, filtro, duracion_max)
 
-    if not recetas:
+    if total == 0:
         with ui.column().classes('w-full items-center py-8'):
             ui.icon('search_off').style(f'font-size: 4rem; color: {COLORS.TEXT_SECONDARY};')
             ui.label('No hay recetas').style(f'color: {COLORS.TEXT_SECONDARY};')
     else:
-        with ui.grid(columns=2).classes('w-full gap-3'):
-            for receta in recetas:
-                crear_card_receta(receta)
+        ui.label(f'{total} recetas').style(
+            f'color: {COLORS.TEXT_SECONDARY}; font-size: 0.85rem;'
+        )
+        create_infinite_grid(
+            load_page=crear_cargador_recetas(recetas_ctrl, filtro, texto, duracion_max),
+            render_item=crear_card_receta,
+            grid_classes='w-full gap-3',
+            columns=2
+        )
+
+
+def buscar_recetas(texto):
+    """Aplica el texto de búsqueda del navegador"""
+    app_state.busqueda_texto = (texto or '').strip()
+    navegar_a('browser')
 
 
 def set_filtro(filtro: str):
@@ -1215,8 +1229,14 @@ def set_filtro(filtro: str):
     navegar_a('browser')
 
 
+def set_filtro_duracion(segundos):
+    """Cambia la duración máxima de las recetas mostradas (0 = cualquiera)"""
+    app_state.filtro_duracion_max = segundos or None
+    navegar_a('browser')
+
+
 def crear_card_receta(receta):
-    """Crea una tarjeta de receta"""
+    """Crea una tarjeta de receta a partir de su resumen (ResumenReceta)"""
     with ui.element('div').classes('recipe-card').on('click', lambda r=receta: cargar_receta(r)):
         with ui.row().classes('w-full items-start justify-between gap-2'):
             with ui.column().classes('flex-1 gap-1'):
@@ -1250,10 +1270,10 @@ def crear_card_receta(receta):
                 )
 
 
-def toggle_favorito(receta):
+async def toggle_favorito(receta):
     """Toggle favorito"""
     try:
-        nuevo_estado = recetas_ctrl.toggle_favorito(receta.id, receta.es_base)
+        nuevo_estado = await db_async.escribir(recetas_ctrl.toggle_favorito, receta.id, receta.es_base)
         receta.favorito = nuevo_estado
         msg = 'Agregada a favoritos' if nuevo_estado else 'Eliminada de favoritos'
         ui.notify(msg, type='positive', position='top')
@@ -1262,8 +1282,14 @@ def toggle_favorito(receta):
         ui.notify(f'Error: {str(e)}', type='negative')
 
 
-def cargar_receta(receta):
-    """Carga una receta"""
+async def cargar_receta(resumen):
+    """Carga una receta desde su tarjeta (solo entonces se crean sus procesos)"""
+    receta = await db_async.leer(recetas_ctrl.obtener_receta_por_id, resumen.id, resumen.es_base)
+    if receta is None:
+        ui.notify('La receta ya no existe', type='warning', position='top')
+        navegar_a('browser')
+        return
+
     app_state.cargar_receta(receta)
     agregar_log(f'📖 Receta cargada: {receta.nombre}')
     ui.notify(f'Receta cargada: {receta.nombre}', type='positive', position='top')
@@ -1519,7 +1545,7 @@ def cancelar_wizard():
     navegar_a('dashboard')
 
 
-def guardar_receta():
+async def guardar_receta():
     """Guarda la receta en la base de datos"""
     nombre = getattr(app_state, 'wizard_nombre', '')
     descripcion = getattr(app_state, 'wizard_descripcion', '')
@@ -1533,20 +1559,11 @@ def guardar_receta():
         return
 
     try:
-        # Crear receta
-        receta = recetas_ctrl.crear_receta_usuario(nombre, descripcion)
-
-        # Agregar ingredientes
-        for i, ing in enumerate(app_state.wizard_ingredientes):
-            recetas_ctrl.agregar_ingrediente(
-                receta.id, ing['nombre'], ing['cantidad'], ing['unidad'], i
-            )
-
-        # Agregar procesos
-        for proc in app_state.wizard_procesos:
-            recetas_ctrl.agregar_proceso_a_receta(
-                receta.id, proc['tipo'], proc['parametros'], proc['duracion']
-            )
+        # Guardar receta, ingredientes y procesos en una sola transacción
+        await db_async.escribir(
+            recetas_ctrl.guardar_receta_completa,
+            nombre, descripcion, app_state.wizard_ingredientes, app_state.wizard_procesos
+        )
 
         agregar_log(f'✅ Receta creada: {nombre}')
         ui.notify(f'Receta "{nombre}" creada con éxito!', type='positive')
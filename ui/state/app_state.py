@@ -5,6 +5,7 @@ Mantiene el estado global de la UI y la lógica de negocio
 
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
+from models.progreso import ModeloProgreso
 from models.receta import Receta
 
 
@@ -39,6 +40,7 @@ class AppState:
     duracion_paso_actual: float = 0.0  # duración total del paso en segundos
     progreso_paso_actual: float = 0.0  # 0-100%
     velocidad_actual: int = 5  # velocidad de ejecución 1-10 (5 es normal)
+    modelo_progreso: Optional[ModeloProgreso] = None  # progreso del paso (compartido por los timers)
 
     # === MODO MANUAL (NUEVA FUNCIONALIDAD) ===
     modo_seleccionado: Optional[str] = None  # "Picar", "Triturar", etc.
@@ -48,6 +50,7 @@ class AppState:
     vista_actual: str = "dashboard"  # "dashboard", "browser", "execution", "wizard", "config"
     filtro_recetas: str = "todas"  # "todas", "base", "usuario", "favoritas"
     busqueda_texto: str = ""
+    filtro_duracion_max: Optional[int] = None  # segundos (None = cualquier duración)
 
     # === TEMA ===
     tema_oscuro: bool = False
@@ -80,12 +83,15 @@ class AppState:
         self.tiempo_inicio_paso = 0.0
         self.duracion_paso_actual = 0.0
         self.progreso_paso_actual = 0.0
+        self.modelo_progreso = None
         self.mostrar_celebracion = False
         self.nombre_receta_completada = ""
 
     def cargar_receta(self, receta: Receta):
         """Carga una receta para ejecutar"""
-        self.receta_actual = receta
+        # La receta puede venir de la caché del catálogo, compartida con otras
+        # sesiones: se ejecuta una copia con sus propios procesos
+        self.receta_actual = receta.copiar()
         self.paso_actual = 0
         self.en_ejecucion = False
         self.paso_completado = False
@@ -25,4 +25,11 @@ class RecetaNoEncontradaException(RobotCocinaException):
     
     def __init__(self, mensaje: str = "Receta no encontrada"):
         self.mensaje = mensaje
-        super().__init__(self.mensaje)
\ No newline at end of file
+        super().__init__(self.mensaje)
+
+class ParametrosInvalidosException(RobotCocinaException):
+    """Se lanza cuando los parámetros de un proceso no se pueden interpretar"""
+    
+    def __init__(self, mensaje: str = "Parámetros inválidos"):
+        self.mensaje = mensaje
+        super().__init__(self.mensaje)